@@ -14,10 +14,12 @@ from apps.models import (
     BankingCredentials,
     BankMovement,
     ProcessedServiceListing,
+    ActivityGuidanceCacheEntry,
+    BackgroundJob,
+    BankSyncStats,
+    PayerCount,
 )  # Replace 'apps' with your actual app name
 
-from .bedrock_chat import BedRockLLM
-from .openai_chat import OpenAIService
 
 class ExtraParam(ActionForm):
     query = CharField(required=False)
@@ -62,6 +64,8 @@ class BankAccountAdmin(admin.ModelAdmin):
 
     @admin.action(description="Chat con BedRock")
     def chat_with_bedrock(self, request, queryset):
+        from .openai_chat import OpenAIService
+
         query=request.POST["query"]
         
         # Crear instancia de BedRock (usando el rol IAM)
@@ -108,3 +112,59 @@ class ProcessedServiceListingAdmin(admin.ModelAdmin):
     )
 
     search_fields = ("user__username", "service_name")
+
+
+@admin.register(ActivityGuidanceCacheEntry)
+class ActivityGuidanceCacheEntryAdmin(admin.ModelAdmin):
+    list_display = (
+        "normalized_description",
+        "activity",
+        "iva_code",
+        "model_id",
+        "hits",
+        "last_used_at",
+    )
+
+    search_fields = ("normalized_description", "activity")
+
+
+@admin.register(BackgroundJob)
+class BackgroundJobAdmin(admin.ModelAdmin):
+    list_display = (
+        "id",
+        "kind",
+        "status",
+        "user",
+        "enqueued_at",
+        "started_at",
+        "finished_at",
+        "attempts",
+    )
+
+    list_filter = ("kind", "status")
+
+
+@admin.register(BankSyncStats)
+class BankSyncStatsAdmin(admin.ModelAdmin):
+    list_display = (
+        "bank_account",
+        "synced_at",
+        "new_movements",
+        "skipped_movements",
+        "failed_movements",
+        "error",
+    )
+
+    list_filter = ("synced_at",)
+
+
+@admin.register(PayerCount)
+class PayerCountAdmin(admin.ModelAdmin):
+    list_display = (
+        "user",
+        "period",
+        "period_start",
+        "distinct_payers",
+    )
+
+    list_filter = ("period", "period_start")
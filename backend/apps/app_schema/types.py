@@ -1,3 +1,4 @@
+import graphene
 from graphene_django.types import DjangoObjectType
 from apps.models import (
     BankMovement,
@@ -5,6 +6,7 @@ from apps.models import (
     BankingCredentials,
     UserDetail,
     ProcessedServiceListing,
+    BackgroundJob,
 )
 
 
@@ -29,3 +31,12 @@ class UserDetailType(DjangoObjectType):
 class ProcessedServiceListingType(DjangoObjectType):
     class Meta:
         model = ProcessedServiceListing
+
+
+class BackgroundJobType(DjangoObjectType):
+    wait_seconds = graphene.Float()
+    run_seconds = graphene.Float()
+
+    class Meta:
+        model = BackgroundJob
+        fields = ("id", "kind", "status", "error", "enqueued_at", "started_at", "finished_at")
@@ -0,0 +1,236 @@
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import timedelta
+from typing import Dict, List, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Max, Min, Q
+from django.db.models.functions import Mod
+from django.utils import timezone
+
+from apps.bank_scraper import SantanderClient
+from apps.jobs import enqueue
+from apps.models import BackgroundJob, BankAccount, BankingCredentials
+
+logger = logging.getLogger(__name__)
+
+_RUN_KEY_PREFIX = "bank-refresh:last-run"
+
+
+@dataclass
+class RefreshRun:
+    shard: int
+    shards: int
+    started_at: str
+    due: int = 0
+    skipped: int = 0
+    in_progress: int = 0
+    backing_off: int = 0
+    synced: int = 0
+    failed: int = 0
+    enqueued: int = 0
+    new_movements: int = 0
+    duration_seconds: float = 0.0
+    errors: Dict[int, str] = field(default_factory=dict)
+
+    @property
+    def credentials_per_second(self) -> float:
+        return self.synced / self.duration_seconds if self.duration_seconds else 0.0
+
+    @property
+    def movements_per_second(self) -> float:
+        return self.new_movements / self.duration_seconds if self.duration_seconds else 0.0
+
+
+def latest_credentials(shard: int = 0, shards: int = 1) -> List[BankingCredentials]:
+    """
+    The newest Santander credentials of every (user, RUT) in the shard.
+    Registering again creates a new row, older ones are stale passwords.
+    Users are split across shards by id.
+    """
+    latest_ids = (
+        BankingCredentials.objects.filter(bank="Santander", password__isnull=False)
+        .annotate(shard=Mod("user_id", shards))
+        .filter(shard=shard)
+        .values("user_id", "rut")
+        .annotate(latest_id=Max("id"))
+        .values_list("latest_id", flat=True)
+    )
+    return list(BankingCredentials.objects.filter(id__in=list(latest_ids)).select_related("user"))
+
+
+def due_credentials(
+    credentials: List[BankingCredentials], min_interval: Optional[timedelta] = None
+) -> List[BankingCredentials]:
+    """
+    The credentials whose user has no Santander account yet or one not
+    synced within `min_interval` (default SANTANDER_REFRESH_INTERVAL).
+    """
+    min_interval = min_interval or timedelta(seconds=settings.SANTANDER_REFRESH_INTERVAL)
+    cutoff = timezone.now() - min_interval
+    user_ids = {credential.user_id for credential in credentials}
+    accounts = BankAccount.objects.filter(bank="Santander", user_id__in=user_ids)
+    users_with_accounts = set(accounts.values_list("user_id", flat=True))
+    stale_users = set(
+        accounts.filter(Q(last_synced_at__isnull=True) | Q(last_synced_at__lt=cutoff)).values_list(
+            "user_id", flat=True
+        )
+    )
+    return [
+        credential
+        for credential in credentials
+        if credential.user_id not in users_with_accounts or credential.user_id in stale_users
+    ]
+
+
+def login_backoff(credentials: BankingCredentials) -> timedelta:
+    """
+    How long after its last rejected login the credentials are left alone:
+    SANTANDER_LOGIN_BACKOFF, doubled per further consecutive rejection, up
+    to SANTANDER_LOGIN_BACKOFF_MAX.
+    """
+    if not credentials.login_failures:
+        return timedelta(0)
+    seconds = settings.SANTANDER_LOGIN_BACKOFF * 2 ** min(credentials.login_failures - 1, 30)
+    return timedelta(seconds=min(seconds, settings.SANTANDER_LOGIN_BACKOFF_MAX))
+
+
+def backing_off(credentials: BankingCredentials, now=None) -> bool:
+    if not credentials.login_failures or credentials.last_login_failure_at is None:
+        return False
+    now = now or timezone.now()
+    return now < credentials.last_login_failure_at + login_backoff(credentials)
+
+
+def syncs_in_progress(credentials: List[BankingCredentials]) -> set:
+    """
+    Ids of the credentials with a sync job queued or running.
+    """
+    return set(
+        BackgroundJob.objects.filter(
+            kind="sync_bank_movements",
+            status__in=[BackgroundJob.STATUS_QUEUED, BackgroundJob.STATUS_RUNNING],
+            user_id__in={credential.user_id for credential in credentials},
+        ).values_list("payload__credentials_id", flat=True)
+    )
+
+
+def refresh_shard(
+    shard: int = 0,
+    shards: int = 1,
+    concurrency: Optional[int] = None,
+    min_interval: Optional[timedelta] = None,
+    use_queue: bool = False,
+) -> RefreshRun:
+    """
+    Sync every due credential of the shard, `concurrency` users at a time,
+    or with `use_queue` hand them to the job workers. Credentials with a
+    sync job already queued or running are left to it, and credentials
+    whose login was rejected wait out their `login_backoff`. Requests
+    toward the bank go through the global and per-RUT rate limits of
+    `santander_post`. The run's counters are published for `refresh_stats`.
+    """
+    concurrency = concurrency or settings.SANTANDER_REFRESH_CONCURRENCY
+    start = time.perf_counter()
+    run = RefreshRun(shard=shard, shards=shards, started_at=timezone.now().isoformat())
+    credentials = latest_credentials(shard, shards)
+    due = due_credentials(credentials, min_interval)
+    run.skipped = len(credentials) - len(due)
+    in_progress = syncs_in_progress(due)
+    now = timezone.now()
+    ready = []
+    for credential in due:
+        if credential.id in in_progress:
+            run.in_progress += 1
+        elif backing_off(credential, now):
+            run.backing_off += 1
+        else:
+            ready.append(credential)
+    due = ready
+    run.due = len(due)
+
+    if use_queue:
+        for credentials in due:
+            enqueue("sync_bank_movements", {"credentials_id": credentials.id}, user=credentials.user)
+        run.enqueued = len(due)
+    elif due:
+        with ThreadPoolExecutor(
+            max_workers=min(concurrency, len(due)), thread_name_prefix="bank-refresh"
+        ) as executor:
+            for credentials, outcome in zip(due, executor.map(_sync, due)):
+                if isinstance(outcome, Exception):
+                    run.failed += 1
+                    run.errors[credentials.id] = str(outcome)
+                else:
+                    run.synced += 1
+                    run.new_movements += outcome
+
+    run.duration_seconds = time.perf_counter() - start
+    _publish(run)
+    return run
+
+
+def _sync(credentials):
+    try:
+        stats = SantanderClient.obtain_movements(credentials)
+        return sum(stat.new_movements for stat in stats)
+    except Exception as e:
+        logger.exception("Refresh of credentials %s failed", credentials.id)
+        return e
+    finally:
+        connection.close()
+
+
+def _publish(run: RefreshRun):
+    payload = asdict(run)
+    payload["credentials_per_second"] = run.credentials_per_second
+    payload["movements_per_second"] = run.movements_per_second
+    cache.set(f"{_RUN_KEY_PREFIX}:{run.shard}:{run.shards}", payload, timeout=None)
+    logger.info(
+        "Bank refresh shard %s/%s: %s due, %s skipped, %s in progress, %s backing off, "
+        "%s synced, %s failed, %s enqueued, "
+        "%s new movements in %.1f s (%.2f users/s, %.1f movements/s)",
+        run.shard,
+        run.shards,
+        run.due,
+        run.skipped,
+        run.in_progress,
+        run.backing_off,
+        run.synced,
+        run.failed,
+        run.enqueued,
+        run.new_movements,
+        run.duration_seconds,
+        run.credentials_per_second,
+        run.movements_per_second,
+    )
+
+
+def sync_lag() -> Dict[str, float]:
+    """
+    How far behind the Santander accounts are: the oldest sync, how many
+    accounts are older than SANTANDER_REFRESH_INTERVAL and how many were
+    never synced.
+    """
+    now = timezone.now()
+    cutoff = now - timedelta(seconds=settings.SANTANDER_REFRESH_INTERVAL)
+    accounts = BankAccount.objects.filter(bank="Santander")
+    oldest = accounts.aggregate(oldest=Min("last_synced_at"))["oldest"]
+    return {
+        "accounts": accounts.count(),
+        "never_synced_accounts": accounts.filter(last_synced_at__isnull=True).count(),
+        "stale_accounts": accounts.filter(last_synced_at__lt=cutoff).count(),
+        "max_lag_seconds": (now - oldest).total_seconds() if oldest else 0.0,
+    }
+
+
+def refresh_stats(shards: int = 1) -> Dict[str, object]:
+    """
+    Current lag plus the last published run of every shard.
+    """
+    runs = [cache.get(f"{_RUN_KEY_PREFIX}:{shard}:{shards}") for shard in range(shards)]
+    return {**sync_lag(), "runs": [run for run in runs if run is not None]}
@@ -1,12 +1,192 @@
-import requests
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date
+from queue import Empty, Full, Queue
+from threading import Event
+from typing import Dict, Iterable, Iterator, List, Optional, Set
 
-from apps.models import BankMovement, BankAccount
+from django.conf import settings
+from django.db.models import F
+from django.utils import timezone
+
+from apps.dashboard_cache import bump_data_version
+from apps.helpers import extract_ruts
+from apps.integrations.json_stream import JsonArrayStream
+from apps.integrations.santander_http import santander_post
+from apps.integrations.santander_tokens import token_cache
+from apps.models import BankMovement, BankAccount, BankingCredentials, BankSyncStats
+from apps.payer_counts import refresh_payer_counts
 from urllib.parse import urlencode
 
+logger = logging.getLogger(__name__)
+
+_accounting_date_field = BankMovement._meta.get_field("accounting_date")
+
+
+class SantanderAuthError(Exception):
+    pass
+
+
+class SantanderLoginError(Exception):
+    pass
+
+
+# End of an account's movements in the producer/consumer queue of obtain_movements
+_DONE = object()
+
+
+def _movement_number(movement) -> Optional[int]:
+    try:
+        return int(movement["movementNumber"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+@dataclass
+class ParsedMovements:
+    """
+    Running totals of an account's sync. `movements` holds parsed movements
+    not inserted yet; `obtain_movements` drains it in chunks.
+    """
+
+    movements: List[BankMovement] = field(default_factory=list)
+    new: int = 0
+    skipped: int = 0
+    failed: int = 0
+    # Lowest movement number that could not be parsed; the cursor stays
+    # below it so the next sync retries it.
+    first_failed_number: Optional[int] = None
+    last_movement_number: Optional[int] = None
+    last_accounting_date: Optional[date] = None
+    # Months with new incoming movements from an identified payer, whose
+    # payer counts need a recount
+    payer_months: Set[date] = field(default_factory=set)
+
+
+class BankAccountResolver:
+    """
+    The accounts of one user at one bank for the length of a sync: all of
+    them are loaded with one query, and the ones the bank lists that are not
+    stored yet are created together.
+    """
+
+    def __init__(self, user, bank: str):
+        self.user = user
+        self.bank = bank
+        self._accounts: Dict[str, BankAccount] = {
+            account.account_number: account
+            for account in BankAccount.objects.filter(user=user, bank=bank)
+        }
+
+    def resolve(self, account_numbers: Iterable[str], full_name: str) -> Dict[str, BankAccount]:
+        """
+        The accounts for `account_numbers`, creating missing ones and
+        updating the holder name of the others when the bank reports a new
+        one.
+        """
+        account_numbers = list(dict.fromkeys(account_numbers))
+        missing = [number for number in account_numbers if number not in self._accounts]
+        if missing:
+            # A concurrent sync of the same user may create some first; the
+            # unique constraint keeps a single row and the reload finds it.
+            BankAccount.objects.bulk_create(
+                [
+                    BankAccount(
+                        user=self.user, bank=self.bank, account_number=number, full_name=full_name
+                    )
+                    for number in missing
+                ],
+                ignore_conflicts=True,
+            )
+            for account in BankAccount.objects.filter(
+                user=self.user, bank=self.bank, account_number__in=missing
+            ):
+                self._accounts[account.account_number] = account
+        renamed = []
+        now = timezone.now()
+        for number in account_numbers:
+            account = self._accounts[number]
+            if full_name and account.full_name != full_name:
+                account.full_name = full_name
+                # bulk_update skips auto_now
+                account.updated_at = now
+                renamed.append(account)
+        if renamed:
+            BankAccount.objects.bulk_update(renamed, ["full_name", "updated_at"])
+        return {number: self._accounts[number] for number in account_numbers}
+
 
 class SantanderScraper:
+    # Header templates are built once; calls only add their token.
+    LOGIN_HEADERS = {
+        "Accept": "application/json",
+        "Accept-Language": "es-419,es;q=0.9",
+        "Connection": "keep-alive",
+        "Content-Type": "application/x-www-form-urlencoded",
+        "Origin": "https://mibanco.santander.cl",
+        "Referer": "https://mibanco.santander.cl/",
+        "Sec-Fetch-Dest": "empty",
+        "Sec-Fetch-Mode": "cors",
+        "Sec-Fetch-Site": "same-site",
+        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
+        "app": "007",
+        "canal": "003",
+        "nro_ser": "1",
+        "sec-ch-ua": '"Google Chrome";v="131", "Chromium";v="131", "Not_A Brand";v="24"',
+        "sec-ch-ua-mobile": "?0",
+        "sec-ch-ua-platform": '"macOS"',
+        "tokentbk": "TOKEN@4152811016027300",
+    }
+
+    ACCOUNTS_HEADERS = {
+        "accept": "application/json, text/plain, */*",
+        "accept-language": "es-419,es;q=0.9",
+        "content-type": "application/json",
+        "origin": "https://mibanco.santander.cl",
+        "priority": "u=1, i",
+        "referer": "https://mibanco.santander.cl/",
+        "sec-ch-ua": '"Google Chrome";v="131", "Chromium";v="131", "Not_A Brand";v="24"',
+        "sec-ch-ua-mobile": "?0",
+        "sec-ch-ua-platform": '"macOS"',
+        "sec-fetch-dest": "empty",
+        "sec-fetch-mode": "cors",
+        "sec-fetch-site": "same-site",
+        "user-agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
+    }
+
+    MOVEMENTS_HEADERS = {
+        "Accept": "application/json, text/plain, */*",
+        "Accept-Language": "es-419,es;q=0.9",
+        "Connection": "keep-alive",
+        "Content-Type": "application/json",
+        "Origin": "https://mibanco.santander.cl",
+        "Referer": "https://mibanco.santander.cl/",
+        "Sec-Fetch-Dest": "empty",
+        "Sec-Fetch-Mode": "cors",
+        "Sec-Fetch-Site": "same-site",
+        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
+        "X-Client-Code": "STD-PER-FPP",
+        "X-Organization-Code": "Santander",
+        "sec-ch-ua": '"Google Chrome";v="131", "Chromium";v="131", "Not_A Brand";v="24"',
+        "sec-ch-ua-mobile": "?0",
+        "sec-ch-ua-platform": '"macOS"',
+        "x-B3-SpanId": "AL43243287438243P",
+        "x-santander-client-id": "O2XRSU4kVspEGbLDDGfFC5BOTrGKh5Ts",
+        "x-schema-id": "GHOBP",
+    }
+
     @classmethod
-    def fetch_login_tokens(cls, banking_credentials):
+    def fetch_login_tokens(cls, banking_credentials, use_cache=True):
+        """
+        Access token and JWT of the credentials, reused from `token_cache`
+        while they are valid so repeated syncs skip the login and the
+        password decrypt.
+        """
+        if use_cache:
+            tokens = token_cache.get(banking_credentials)
+            if tokens is not None:
+                return tokens
         # Encode the data to handle special characters properly
         data = {
             "scope": "Completa",
@@ -16,59 +196,49 @@ class SantanderScraper:
         }
         encoded_data = urlencode(data)  # Properly encode the data
 
-        headers = {
-            "Accept": "application/json",
-            "Accept-Language": "es-419,es;q=0.9",
-            "Connection": "keep-alive",
-            "Content-Type": "application/x-www-form-urlencoded",
-            "Origin": "https://mibanco.santander.cl",
-            "Referer": "https://mibanco.santander.cl/",
-            "Sec-Fetch-Dest": "empty",
-            "Sec-Fetch-Mode": "cors",
-            "Sec-Fetch-Site": "same-site",
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
-            "app": "007",
-            "canal": "003",
-            "nro_ser": "1",
-            "sec-ch-ua": '"Google Chrome";v="131", "Chromium";v="131", "Not_A Brand";v="24"',
-            "sec-ch-ua-mobile": "?0",
-            "sec-ch-ua-platform": '"macOS"',
-            "tokentbk": "TOKEN@4152811016027300",
-        }
-
         # Make the POST request
-        response = requests.post(
-            "https://apideveloper.santander.cl/sancl/privado/party_authentication_restricted/party_auth_dss/v1/oauth2/token",
-            headers=headers,
+        response = santander_post(
+            settings.SANTANDER_TOKEN_URL,
+            rut=banking_credentials.rut,
+            headers=cls.LOGIN_HEADERS,
             data=encoded_data,  # Pass the encoded data
         )
-        json_response = response.json()
         # Handle potential errors in the response
         if response.status_code != 200:
+            if 400 <= response.status_code < 500 and response.status_code != 429:
+                cls.record_login_failure(banking_credentials)
+                raise SantanderLoginError(
+                    f"Login rejected: {response.status_code}, {response.text}"
+                )
             raise Exception(
                 f"Error fetching tokens: {response.status_code}, {response.text}"
             )
+        json_response = response.json()
+        if banking_credentials.login_failures:
+            BankingCredentials.objects.filter(pk=banking_credentials.pk).update(
+                login_failures=0, last_login_failure_at=None
+            )
+            banking_credentials.login_failures = 0
+            banking_credentials.last_login_failure_at = None
+        token_cache.set(
+            banking_credentials,
+            json_response["access_token"],
+            json_response["tokenJWT"],
+            json_response.get("expires_in"),
+        )
         return json_response["access_token"], json_response["tokenJWT"]
 
+    @staticmethod
+    def record_login_failure(banking_credentials):
+        now = timezone.now()
+        BankingCredentials.objects.filter(pk=banking_credentials.pk).update(
+            login_failures=F("login_failures") + 1, last_login_failure_at=now, updated_at=now
+        )
+        banking_credentials.login_failures += 1
+        banking_credentials.last_login_failure_at = now
+
     @classmethod
     def fetch_bank_accounts(cls, jwt_token, rut):
-        headers = {
-            "accept": "application/json, text/plain, */*",
-            "accept-language": "es-419,es;q=0.9",
-            "access-token": jwt_token,
-            "content-type": "application/json",
-            "origin": "https://mibanco.santander.cl",
-            "priority": "u=1, i",
-            "referer": "https://mibanco.santander.cl/",
-            "sec-ch-ua": '"Google Chrome";v="131", "Chromium";v="131", "Not_A Brand";v="24"',
-            "sec-ch-ua-mobile": "?0",
-            "sec-ch-ua-platform": '"macOS"',
-            "sec-fetch-dest": "empty",
-            "sec-fetch-mode": "cors",
-            "sec-fetch-site": "same-site",
-            "user-agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
-        }
-
         json_data = {
             "cabecera": {
                 "HOST": {
@@ -96,11 +266,19 @@ class SantanderScraper:
                 "ESTADORELACION": "",
             },
         }
-        response = requests.post(
-            "https://apiper.santander.cl/perdsk/datosCliente/cruceProductosOnline",
-            headers=headers,
+        response = santander_post(
+            settings.SANTANDER_ACCOUNTS_URL,
+            rut=rut,
+            idempotent=True,
+            headers={**cls.ACCOUNTS_HEADERS, "access-token": jwt_token},
             json=json_data,
         )
+        if response.status_code in (401, 403):
+            raise SantanderAuthError(f"Tokens rejected: {response.status_code}")
+        if response.status_code != 200:
+            raise Exception(
+                f"Error fetching accounts: {response.status_code}, {response.text}"
+            )
         data_response = response.json()["DATA"]["OUTPUT"]
         scalars = data_response["ESCALARES"]
         full_name = f"{scalars['NOMBREPERSONA']} {scalars['APELLIDOPATERNO']} {scalars['APELLIDOMATERNO']}"
@@ -108,64 +286,156 @@ class SantanderScraper:
         return data_response["MATRICES"]["MATRIZCAPTACIONES"]["e1"], full_name
 
     @classmethod
-    def fetch_bank_movements(cls, access_token, bank_account):
-        headers = {
-            "Accept": "application/json, text/plain, */*",
-            "Accept-Language": "es-419,es;q=0.9",
-            "Authorization": f"Bearer {access_token}",
-            "Connection": "keep-alive",
-            "Content-Type": "application/json",
-            "Origin": "https://mibanco.santander.cl",
-            "Referer": "https://mibanco.santander.cl/",
-            "Sec-Fetch-Dest": "empty",
-            "Sec-Fetch-Mode": "cors",
-            "Sec-Fetch-Site": "same-site",
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
-            "X-Client-Code": "STD-PER-FPP",
-            "X-Organization-Code": "Santander",
-            "sec-ch-ua": '"Google Chrome";v="131", "Chromium";v="131", "Not_A Brand";v="24"',
-            "sec-ch-ua-mobile": "?0",
-            "sec-ch-ua-platform": '"macOS"',
-            "x-B3-SpanId": "AL43243287438243P",
-            "x-santander-client-id": "O2XRSU4kVspEGbLDDGfFC5BOTrGKh5Ts",
-            "x-schema-id": "GHOBP",
-        }
+    def fetch_bank_movements(cls, access_token, bank_account, rut=None, page_key=None):
+        """
+        One page of at most SANTANDER_MOVEMENTS_PAGE_SIZE movements; pass
+        the previous page's `pagination.nextPageKey` for the next one.
+        """
+        return cls.request_bank_movements(access_token, bank_account, rut, page_key).json()
+
+    @classmethod
+    def request_bank_movements(
+        cls, access_token, bank_account, rut=None, page_key=None, stream=False
+    ):
+        """
+        Response of a movements page request. With `stream` the body is not
+        read yet; the caller reads it and closes the response.
+        """
         json_data = {
             "accountId": bank_account,
             "currency": "CLP",
             "commercialGroup": "",
+            "pageSize": settings.SANTANDER_MOVEMENTS_PAGE_SIZE,
         }
+        if page_key:
+            json_data["nextPageKey"] = page_key
 
-        response = requests.post(
-            "https://openbanking.santander.cl/account_balances_transactions_and_withholdings_retail/v1/current-accounts/transactions",
-            headers=headers,
+        response = santander_post(
+            settings.SANTANDER_MOVEMENTS_URL,
+            rut=rut,
+            idempotent=True,
+            headers={**cls.MOVEMENTS_HEADERS, "Authorization": f"Bearer {access_token}"},
             json=json_data,
+            stream=stream,
         )
-        return response.json()
+        if response.status_code in (401, 403):
+            response.close()
+            raise SantanderAuthError(f"Tokens rejected: {response.status_code}")
+        if response.status_code != 200:
+            raise Exception(
+                f"Error fetching movements: {response.status_code}, {response.text}"
+            )
+        return response
 
     @classmethod
-    def parse_movements(cls, json_response: dict, account_number, user, full_name):
-        bank_account, _ = BankAccount.objects.get_or_create(
-            account_number=account_number,
-            bank="Santander",
-            user=user,
-            full_name=full_name,
-        )
-        if not json_response.get("movements"):
-            return []
-        return [
-            BankMovement(
-                accounting_date=mov["accountingDate"],
-                transaction_date=mov["transactionDate"],
-                observation=mov["observation"],
-                expanded_code=mov["expandedCode"],
-                movement_number=mov["movementNumber"],
-                amount=cls.parse_amount(mov["movementAmount"]),
-                bank_account=bank_account,
-            )
-            for mov in json_response["movements"]
-            if "FINGO" not in mov.get("observacion", "")
-        ]
+    def iter_movements(cls, access_token, bank_account, rut=None, cursor=None) -> Iterator[dict]:
+        """
+        Every movement of the account, page after page, decoded from each
+        response body as it arrives so a page is never held whole. A page
+        without a continuation key is the last (or only) one.
+
+        With the account's sync `cursor`, paging stops after the page that
+        reaches it, but only when the bank sends the newest movements first
+        (numbers decreasing within a page): every later page is older still.
+        When it sends the oldest first, as `FakeSantanderServer` does by
+        default, the stored movements come first and every page is still
+        downloaded; `parse_movements` only skips parsing them.
+        """
+        seen_keys = set()
+        page_key = None
+        newest_first = None
+        while True:
+            first_number = last_number = None
+            with cls.request_bank_movements(
+                access_token, bank_account, rut, page_key, stream=True
+            ) as response:
+                page = JsonArrayStream(
+                    response.iter_content(settings.SANTANDER_STREAM_READ_SIZE), "movements"
+                )
+                for movement in page:
+                    number = _movement_number(movement)
+                    if number is not None:
+                        if first_number is None:
+                            first_number = number
+                        elif number != last_number:
+                            newest_first = number < last_number
+                        last_number = number
+                    yield movement
+            page_key = (page.rest.get("pagination") or {}).get("nextPageKey")
+            if not page_key:
+                return
+            reached_cursor = cursor is not None and last_number is not None and last_number <= cursor
+            if newest_first and reached_cursor:
+                return
+            if page_key in seen_keys:
+                raise Exception(f"Santander repeated page key {page_key} for {bank_account}")
+            seen_keys.add(page_key)
+
+    @classmethod
+    def parse_movements(
+        cls, movements: Iterable[dict], bank_account, parsed: Optional[ParsedMovements] = None
+    ) -> ParsedMovements:
+        """
+        Build the `movements` (raw, as the bank sends them) above the
+        account's sync cursor, adding them and the counts to `parsed`.
+        Movements at or below the cursor are only counted, without parsing
+        anything but their number.
+        """
+        parsed = parsed if parsed is not None else ParsedMovements()
+        cursor = bank_account.last_movement_number
+        first_new = len(parsed.movements)
+        for mov in movements:
+            movement_number = _movement_number(mov)
+            if movement_number is None:
+                logger.warning(
+                    "Movement without a number in account %s", bank_account.account_number
+                )
+                parsed.failed += 1
+                continue
+            if cursor is not None and movement_number <= cursor:
+                parsed.skipped += 1
+                continue
+            if "FINGO" in mov.get("observacion", ""):
+                parsed.skipped += 1
+                continue
+            try:
+                if not isinstance(mov["observation"], str):
+                    raise TypeError("observation is not a string")
+                movement = BankMovement(
+                    accounting_date=_accounting_date_field.to_python(mov["accountingDate"]),
+                    transaction_date=mov["transactionDate"],
+                    observation=mov["observation"],
+                    expanded_code=mov["expandedCode"],
+                    movement_number=movement_number,
+                    amount=cls.parse_amount(mov["movementAmount"]),
+                    bank_account=bank_account,
+                )
+            except Exception:
+                logger.warning(
+                    "Unparseable movement %s of account %s",
+                    movement_number,
+                    bank_account.account_number,
+                )
+                parsed.failed += 1
+                if parsed.first_failed_number is None or movement_number < parsed.first_failed_number:
+                    parsed.first_failed_number = movement_number
+                continue
+            parsed.movements.append(movement)
+            parsed.new += 1
+            if parsed.last_movement_number is None or movement_number > parsed.last_movement_number:
+                parsed.last_movement_number = movement_number
+            if movement.accounting_date and (
+                parsed.last_accounting_date is None
+                or movement.accounting_date > parsed.last_accounting_date
+            ):
+                parsed.last_accounting_date = movement.accounting_date
+        new_movements = parsed.movements[first_new:]
+        counterparty_ruts = extract_ruts([movement.observation for movement in new_movements])
+        for movement, counterparty_rut in zip(new_movements, counterparty_ruts):
+            movement.counterparty_rut = counterparty_rut
+            if movement.amount > 0 and counterparty_rut and movement.accounting_date:
+                parsed.payer_months.add(movement.accounting_date.replace(day=1))
+        return parsed
 
     @classmethod
     def parse_amount(cls, amount: str):
@@ -176,23 +446,191 @@ class SantanderScraper:
 
 class SantanderClient:
     @classmethod
-    def obtain_movements(cls, banking_credentials):
+    def obtain_movements(cls, banking_credentials, concurrency=None):
+        """
+        Import the movements of every account of the credentials that are
+        newer than the account's sync cursor, and record a `BankSyncStats`
+        row per account.
+
+        Accounts are fetched page by page in parallel, at most `concurrency`
+        at a time (default `settings.SANTANDER_ACCOUNT_CONCURRENCY`). An
+        account whose fetch fails is logged and skipped; the sync only fails
+        when every account did. Movements are decoded as the bodies stream
+        in and inserted in `bulk_create` chunks of
+        SANTANDER_INSERT_CHUNK_SIZE, so memory does not grow with the size of
+        a page or the length of the history. Returns the `BankSyncStats` of
+        the sync.
+        """
+        concurrency = concurrency or settings.SANTANDER_ACCOUNT_CONCURRENCY
         access_token, jwt_token = SantanderScraper.fetch_login_tokens(
             banking_credentials
         )
-        client_accounts, full_name = SantanderScraper.fetch_bank_accounts(
-            jwt_token, banking_credentials.rut
-        )
-        to_create = []
-        user = banking_credentials.user
-        for account_detail in client_accounts:
-            account_number = (
-                f"{account_detail['OFICINACONTRATO']}{account_detail['NUMEROCONTRATO']}"
+        try:
+            client_accounts, full_name = SantanderScraper.fetch_bank_accounts(
+                jwt_token, banking_credentials.rut
             )
-            response = SantanderScraper.fetch_bank_movements(
-                access_token, account_number
+        except SantanderAuthError:
+            # Cached tokens revoked before their expiry: log in again once.
+            token_cache.invalidate(banking_credentials)
+            access_token, jwt_token = SantanderScraper.fetch_login_tokens(
+                banking_credentials, use_cache=False
             )
-            to_create += SantanderScraper.parse_movements(
-                response, account_number, user, full_name
+            client_accounts, full_name = SantanderScraper.fetch_bank_accounts(
+                jwt_token, banking_credentials.rut
+            )
+        bank_accounts = BankAccountResolver(banking_credentials.user, "Santander").resolve(
+            (
+                f"{account_detail['OFICINACONTRATO']}{account_detail['NUMEROCONTRATO']}"
+                for account_detail in client_accounts
+            ),
+            full_name,
+        )
+
+        parsed_by_account = {
+            account_number: ParsedMovements() for account_number in bank_accounts
+        }
+        errors = {}
+        workers = max(1, min(concurrency, len(bank_accounts)))
+        # Pool threads put batches of raw movements into a bounded queue;
+        # this thread parses and inserts them, so at most a few batches are
+        # held in memory and every query runs on this thread's connection.
+        batches = Queue(maxsize=2 * workers)
+        cancelled = Event()
+
+        def put(item):
+            while not cancelled.is_set():
+                try:
+                    batches.put(item, timeout=0.5)
+                    return
+                except Full:
+                    continue
+
+        def produce(account_number):
+            try:
+                batch = []
+                for movement in SantanderScraper.iter_movements(
+                    access_token,
+                    account_number,
+                    banking_credentials.rut,
+                    bank_accounts[account_number].last_movement_number,
+                ):
+                    batch.append(movement)
+                    if len(batch) >= settings.SANTANDER_STREAM_BATCH_SIZE:
+                        if cancelled.is_set():
+                            return
+                        put((account_number, batch))
+                        batch = []
+                if batch:
+                    put((account_number, batch))
+            except Exception as e:
+                put((account_number, e))
+            else:
+                put((account_number, _DONE))
+
+        pending = []
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="santander") as executor:
+            for account_number in bank_accounts:
+                executor.submit(produce, account_number)
+            try:
+                remaining = len(bank_accounts)
+                while remaining:
+                    try:
+                        account_number, batch = batches.get(timeout=1)
+                    except Empty:
+                        continue
+                    if batch is _DONE:
+                        remaining -= 1
+                        continue
+                    if isinstance(batch, Exception):
+                        remaining -= 1
+                        logger.error(
+                            "Could not import movements of account %s: %s", account_number, batch
+                        )
+                        if isinstance(batch, SantanderAuthError):
+                            token_cache.invalidate(banking_credentials)
+                        errors[account_number] = str(batch)
+                        continue
+                    if account_number in errors:
+                        continue
+                    parsed = SantanderScraper.parse_movements(
+                        batch, bank_accounts[account_number], parsed_by_account[account_number]
+                    )
+                    pending += parsed.movements
+                    parsed.movements.clear()
+                    if len(pending) >= settings.SANTANDER_INSERT_CHUNK_SIZE:
+                        cls.insert_movements(pending)
+                        pending = []
+            finally:
+                cancelled.set()
+        cls.insert_movements(pending)
+        synced_at = timezone.now()
+        stats = []
+        for account_number, bank_account in bank_accounts.items():
+            if account_number in errors:
+                # Batches parsed before the failure were inserted.
+                stats.append(
+                    BankSyncStats(
+                        bank_account=bank_account,
+                        synced_at=synced_at,
+                        new_movements=parsed_by_account[account_number].new,
+                        error=errors[account_number],
+                    )
+                )
+                continue
+            parsed = parsed_by_account[account_number]
+            cls.advance_cursor(bank_account, parsed, synced_at)
+            stats.append(
+                BankSyncStats(
+                    bank_account=bank_account,
+                    synced_at=synced_at,
+                    new_movements=parsed.new,
+                    skipped_movements=parsed.skipped,
+                    failed_movements=parsed.failed,
+                )
             )
-        BankMovement.objects.bulk_create(to_create, ignore_conflicts=True)
+        BankSyncStats.objects.bulk_create(stats)
+        refresh_payer_counts(
+            banking_credentials.user_id,
+            set().union(*(parsed.payer_months for parsed in parsed_by_account.values())),
+        )
+        if bank_accounts and len(errors) == len(bank_accounts):
+            raise Exception(f"Could not import movements of any account: {list(errors)}")
+        return stats
+
+    @staticmethod
+    def insert_movements(movements):
+        # Bumped per chunk: a sync failing later has still changed the data.
+        BankMovement.objects.bulk_create(movements, ignore_conflicts=True)
+        bump_data_version(movement.bank_account_id for movement in movements)
+
+    @classmethod
+    def advance_cursor(cls, bank_account, parsed, synced_at):
+        """
+        Move the account's cursor to its newest stored movement, but never
+        past a movement that failed to parse.
+        """
+        update_fields = ["last_synced_at", "updated_at"]
+        bank_account.last_synced_at = synced_at
+        if parsed.new:
+            cursor = parsed.last_movement_number
+            if parsed.first_failed_number is not None:
+                cursor = min(cursor, parsed.first_failed_number - 1)
+            if bank_account.last_movement_number is None or cursor > bank_account.last_movement_number:
+                bank_account.last_movement_number = cursor
+                update_fields.append("last_movement_number")
+            last_accounting_date = parsed.last_accounting_date
+            if last_accounting_date and (
+                bank_account.last_accounting_date is None
+                or last_accounting_date > bank_account.last_accounting_date
+            ):
+                bank_account.last_accounting_date = last_accounting_date
+                update_fields.append("last_accounting_date")
+        bank_account.save(update_fields=update_fields)
+
+
+def sync_bank_movements(credentials_id):
+    """
+    Background job (see `apps.jobs`) that imports the movements of a newly
+    registered set of credentials.
+    """
+    SantanderClient.obtain_movements(BankingCredentials.objects.get(pk=credentials_id))
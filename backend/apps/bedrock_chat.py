@@ -1,40 +1,61 @@
-import boto3
 import json
 import os
 from typing import Optional, Dict, Any, List
 
 from openai import OpenAI
 
+from django.conf import settings
+
+from apps.integrations.bedrock_clients import get_bedrock_client
+from apps.integrations.conversation_history import ConversationHistory
+
 
 class BedRockLLM:
     def __init__(
         self,
         model_id: str = "claude.3.haiku", #Titan
-        region_name: str = "us-east-1",
+        region_name: Optional[str] = None,
         temperature: float = 0.7,
-        max_tokens: int = 1000
+        max_tokens: int = 1000,
+        history_max_entries: Optional[int] = None,
+        history_max_bytes: Optional[int] = None,
+        history_store_prompt_hash: Optional[bool] = None
     ):
         """
         Inicializa la clase para interactuar con modelos LLM en Amazon Bedrock.
         
         Args:
             model_id (str): ID del modelo a usar (default: "anthropic.claude-v2")
-            region_name (str): Región de AWS (default: "us-east-1")
+            region_name (str): Región de AWS (default: settings.BEDROCK_REGION)
             temperature (float): Temperatura para la generación (default: 0.7)
             max_tokens (int): Máximo número de tokens en la respuesta (default: 1000)
+            history_max_entries (int): Máximo de entradas en el historial, 0 lo
+                desactiva (default: settings.BEDROCK_HISTORY_MAX_ENTRIES)
+            history_max_bytes (int): Máximo de bytes en el historial
+                (default: settings.BEDROCK_HISTORY_MAX_BYTES)
+            history_store_prompt_hash (bool): Guardar solo el hash de cada prompt
+                (default: settings.BEDROCK_HISTORY_STORE_PROMPT_HASH)
         """
         self.model_id = model_id
         self.temperature = temperature
         self.max_tokens = max_tokens
         
-        # Inicializar el cliente de Bedrock usando el rol IAM
-        self.client = boto3.client(
-            service_name="bedrock-runtime",
-            region_name=region_name
-        )
+        # Cliente compartido por el proceso (usa el rol IAM y reutiliza conexiones)
+        self.client = get_bedrock_client(region_name)
 
-        # Historial de conversaciones
-        self.conversation_history = []
+        # Historial de conversaciones, acotado para no crecer sin límite en
+        # workers de larga vida
+        if history_max_entries is None:
+            history_max_entries = settings.BEDROCK_HISTORY_MAX_ENTRIES
+        if history_max_bytes is None:
+            history_max_bytes = settings.BEDROCK_HISTORY_MAX_BYTES
+        if history_store_prompt_hash is None:
+            history_store_prompt_hash = settings.BEDROCK_HISTORY_STORE_PROMPT_HASH
+        self.conversation_history = ConversationHistory(
+            max_entries=history_max_entries,
+            max_bytes=history_max_bytes,
+            store_prompt_hash=history_store_prompt_hash,
+        )
 
     def _get_model_params(self, prompt: str) -> Dict:
         """
@@ -109,13 +130,13 @@ class BedRockLLM:
         """
         Obtiene el historial de la conversación.
         """
-        return self.conversation_history
+        return self.conversation_history.as_list()
     
     def clear_conversation_history(self):
         """
         Limpia el historial de la conversación.
         """
-        self.conversation_history = []
+        self.conversation_history.clear()
 
 
     def invoke_model(self, body, accept="application/json", content_type="application/json"):
@@ -154,10 +175,7 @@ class BedRockLLM:
             
             # Guardar en el historial si está activado
             if store_history:
-                self.conversation_history.append({
-                    "prompt": prompt,
-                    "response": response_text
-                })
+                self.conversation_history.append(prompt, response_text)
             
             return response_text
             
@@ -0,0 +1,113 @@
+import hashlib
+import json
+import logging
+from collections import Counter
+from typing import Any, Callable, Dict, Iterable, List
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.db.models import F, Sum
+
+from apps.helpers.cache_counters import incr_counter
+from apps.models import BankAccount
+
+logger = logging.getLogger(__name__)
+
+_KEY_PREFIX = "dashboard"
+RESOLVERS = ("distinct_ruts_count", "all_bank_movements")
+# Per-process counts of the same lookups.
+stats = Counter()
+
+# Used while the configured cache is unreachable (e.g. Redis down).
+_local_cache = LocMemCache("dashboard-fallback", {"OPTIONS": {"MAX_ENTRIES": 1000}})
+
+
+def data_version(user_id: int) -> int:
+    """
+    Sum of the `data_version` of the user's accounts. Every write of their
+    movements bumps one (see `bump_data_version`), in whatever process it
+    ran, so cached results keyed on it never need deleting.
+    """
+    version = BankAccount.objects.filter(user_id=user_id).aggregate(
+        version=Sum("data_version")
+    )["version"]
+    return version or 0
+
+
+def bump_data_version(bank_account_ids: Iterable[int]):
+    """
+    Call after inserting or updating movements of these accounts, so
+    dashboard results cached for their users are no longer read.
+    """
+    bank_account_ids = set(bank_account_ids)
+    if bank_account_ids:
+        BankAccount.objects.filter(id__in=bank_account_ids).update(
+            data_version=F("data_version") + 1
+        )
+
+
+def _call(method: str, *args):
+    try:
+        return getattr(caches[settings.DASHBOARD_CACHE], method)(*args)
+    except ValueError:
+        # `incr` of a missing key, not an outage
+        raise
+    except Exception as e:
+        logger.warning("Dashboard cache unavailable, using local memory: %s", e)
+        return getattr(_local_cache, method)(*args)
+
+
+def cached_result(name: str, user_id: int, arguments: Dict[str, Any], compute: Callable[[], Any]):
+    """
+    `compute()` for the user and resolver arguments, cached in the
+    DASHBOARD_CACHE alias until the user's `data_version` changes or
+    DASHBOARD_CACHE_TTL passes. Lists longer than DASHBOARD_CACHE_MAX_ROWS
+    are returned without caching.
+    """
+    if settings.DASHBOARD_CACHE_TTL <= 0:
+        return compute()
+    digest = hashlib.sha256(
+        json.dumps(arguments, sort_keys=True, default=str).encode()
+    ).hexdigest()[:16]
+    key = f"{_KEY_PREFIX}:{name}:{user_id}:{data_version(user_id)}:{digest}"
+    # Wrapped so that falsy results (0, []) are told apart from a miss.
+    entry = _call("get", key)
+    if entry is not None:
+        _count(name, "hits")
+        return entry[0]
+    _count(name, "misses")
+    result = compute()
+    if not (isinstance(result, list) and len(result) > settings.DASHBOARD_CACHE_MAX_ROWS):
+        _call("set", key, (result,), settings.DASHBOARD_CACHE_TTL)
+    return result
+
+
+def _count(name: str, outcome: str):
+    stats[f"{name}:{outcome}"] += 1
+    key = f"{_KEY_PREFIX}:stats:{name}:{outcome}"
+    try:
+        incr_counter(key, caches[settings.DASHBOARD_CACHE])
+    except Exception as e:
+        logger.warning("Dashboard cache unavailable, using local memory: %s", e)
+        incr_counter(key, _local_cache)
+
+
+def dashboard_cache_stats() -> List[Dict[str, Any]]:
+    """
+    Hits and misses per resolver across every process sharing the cache.
+    """
+    results = []
+    for name in RESOLVERS:
+        hits = _call("get", f"{_KEY_PREFIX}:stats:{name}:hits") or 0
+        misses = _call("get", f"{_KEY_PREFIX}:stats:{name}:misses") or 0
+        lookups = hits + misses
+        results.append(
+            {
+                "resolver": name,
+                "hits": hits,
+                "misses": misses,
+                "hit_ratio": hits / lookups if lookups else 0.0,
+            }
+        )
+    return results
@@ -1 +1,6 @@
-from .get_master_entity_from_description import retrieve_national_identifier_from_description
\ No newline at end of file
+from .get_master_entity_from_description import (
+    extract_ruts,
+    retrieve_counterparty_rut,
+    retrieve_national_identifier_from_description,
+    rut_cache,
+)
@@ -0,0 +1,14 @@
+from django.core.cache import cache as default_cache
+
+
+def incr_counter(key: str, cache=default_cache):
+    """
+    Add one to a counter in `cache`, creating it without expiry. With a
+    shared cache (Redis) the count covers every process.
+    """
+    cache.add(key, 0, timeout=None)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # Evicted between add and incr; losing one sample is fine.
+        pass
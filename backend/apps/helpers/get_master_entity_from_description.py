@@ -1,13 +1,20 @@
-from typing import Union
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, List, Optional, Sequence, Union
 import re
 from re import sub, compile, escape
 
+from django.conf import settings
+
 
 class IdentifierError(Exception):
     pass
 
 
 class NationalIdentifier:
+    # Cached by the million during imports; no per-instance __dict__.
+    __slots__ = ("_rut",)
+
     def __init__(self, rut: Union[str, int], check_dv=False):
         """
         Initialize with Chilean RUT (national ID)
@@ -21,6 +28,13 @@ class NationalIdentifier:
     def __repr__(self) -> str:
         return self._rut
 
+    @classmethod
+    def _from_valid(cls, rut: str) -> "NationalIdentifier":
+        # For RUTs that already went through validation (`rut_cache`)
+        national_identifier = cls.__new__(cls)
+        national_identifier._rut = rut
+        return national_identifier
+
     def validate_rut(self, check_dv):
         self.check_valid_rut(self.rut, check_dv)
 
@@ -68,9 +82,189 @@ class NationalIdentifier:
                 return None
 
 
-def retrieve_national_identifier_from_description(description: str) -> Union[None, NationalIdentifier]:
-    """Search for Chilean RUT in different parts of the description"""
+class RutCache:
+    """
+    Bounded LRU map from a description to its RUT ("" when it has none),
+    in front of both the per-row and the batch extraction. Observations
+    repeat a lot (the same sender every month), so most lookups are hits.
+    Values are the RUT strings rather than `NationalIdentifier`s, so callers
+    never share a mutable object. Counters are per process.
+    """
+
+    def __init__(self, maxsize: Optional[int] = None):
+        self._maxsize = maxsize
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def maxsize(self) -> int:
+        # Read from the settings on first use, not on every lookup.
+        if self._maxsize is None:
+            self._maxsize = settings.RUT_CACHE_SIZE
+        return self._maxsize
+
+    def get(self, description: str) -> Optional[str]:
+        return self.get_many([description])[0]
+
+    def get_many(self, descriptions: Sequence[str]) -> List[Optional[str]]:
+        entries = self._entries
+        with self._lock:
+            ruts = [entries.get(description) for description in descriptions]
+            for description, rut in zip(descriptions, ruts):
+                if rut is not None:
+                    entries.move_to_end(description)
+            hits = len(ruts) - ruts.count(None)
+            self.hits += hits
+            self.misses += len(ruts) - hits
+        return ruts
+
+    def put(self, description: str, rut: str):
+        self.put_many([description], [rut])
+
+    def put_many(self, descriptions: Sequence[str], ruts: Sequence[str]):
+        maxsize = self.maxsize
+        if maxsize <= 0:
+            return
+        entries = self._entries
+        with self._lock:
+            for description, rut in zip(descriptions, ruts):
+                entries[description] = rut
+                entries.move_to_end(description)
+            while len(entries) > maxsize:
+                entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self._maxsize = None
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "entries": len(self._entries),
+            "maxsize": self.maxsize,
+        }
+
+
+rut_cache = RutCache()
+
+
+def _retrieve_national_identifier(description: str) -> Union[None, NationalIdentifier]:
     national_identifier = NationalIdentifier.from_description(description[:14])
     if national_identifier:
         return national_identifier
     return NationalIdentifier.from_description(description[14:])
+
+
+def retrieve_national_identifier_from_description(description: str) -> Union[None, NationalIdentifier]:
+    """Search for Chilean RUT in different parts of the description"""
+    rut = retrieve_counterparty_rut(description)
+    return NationalIdentifier._from_valid(rut) if rut else None
+
+
+def retrieve_counterparty_rut(description: str, use_cache: bool = True) -> str:
+    """RUT of a movement description as stored in `BankMovement.counterparty_rut`"""
+    rut = rut_cache.get(description) if use_cache else None
+    if rut is None:
+        national_identifier = _retrieve_national_identifier(description)
+        rut = national_identifier.rut if national_identifier else ""
+        if use_cache:
+            rut_cache.put(description, rut)
+    return rut
+
+
+_NON_RUT_CHARS_RE = compile(r"[^0-9kK]")
+_K_RUN_RE = compile(r"k+")
+# What `NationalIdentifier.from_description` accepts once cleaned: 6 to 8
+# digits and an optional check digit. Whether the check digit is right only
+# decides between "12345678-9" and "123456789".
+_CLEAN_RUT_RE = compile(r"\d{6,8}[\dk]?")
+_FACTORS = (2, 3, 4, 5, 6, 7, 2, 3)
+_VERIFICATORS = "0123456789K"
+
+
+def _clean_rut(text: str) -> str:
+    rut = _NON_RUT_CHARS_RE.sub("", text).replace("K", "k").lstrip("0")
+    return _K_RUN_RE.sub("k", rut) if "k" in rut else rut
+
+
+def _numpy():
+    # Imported on first use only: loading NumPy with the schema costs every
+    # web worker about 12 MiB and 90 ms. Optional, not a dependency.
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def verificators(rut_numbers: Sequence[str], use_numpy: bool = False) -> List[str]:
+    """
+    `NationalIdentifier.calculate_verificator` of many RUT numbers (up to 8
+    digits) at once. With `use_numpy`, and NumPy installed, the digits are
+    summed as arrays; `manage.py bench_rut_extraction` found it no faster
+    overall, so pure Python is the default.
+    """
+    if not rut_numbers:
+        return []
+    np = _numpy() if use_numpy else None
+    if np is not None:
+        numbers = np.array(rut_numbers).astype(np.int64)
+        total = np.zeros(len(numbers), dtype=np.int64)
+        for factor in _FACTORS:
+            total += numbers % 10 * factor
+            numbers //= 10
+        return np.array(list(_VERIFICATORS))[-total % 11].tolist()
+    results = []
+    for rut_number in rut_numbers:
+        number = int(rut_number)
+        total = 0
+        for factor in _FACTORS:
+            number, digit = divmod(number, 10)
+            total += digit * factor
+        results.append(_VERIFICATORS[-total % 11])
+    return results
+
+
+def extract_ruts(
+    descriptions: Sequence[str], use_numpy: bool = False, use_cache: bool = True
+) -> List[str]:
+    """
+    `retrieve_counterparty_rut` of many descriptions: the RUT in each one
+    (with its check digit after a dash when the digit is right, as
+    `NationalIdentifier.from_description` returns it) or "".
+
+    The patterns are compiled once and the check digits of the whole batch
+    are computed together (see `verificators`), without building
+    `NationalIdentifier` objects or raising exceptions per description.
+    Descriptions in `rut_cache` are not parsed again.
+    """
+    candidates = rut_cache.get_many(descriptions) if use_cache else [None] * len(descriptions)
+    parsed = [index for index, rut in enumerate(candidates) if rut is None]
+    for index in parsed:
+        description = descriptions[index]
+        rut = _clean_rut(description[:14])
+        if not _CLEAN_RUT_RE.fullmatch(rut):
+            rut = _clean_rut(description[14:])
+            if not _CLEAN_RUT_RE.fullmatch(rut):
+                rut = ""
+        candidates[index] = rut
+    # Only 7 to 9 characters leave a 6 to 8 digit number before the check digit.
+    checked = [index for index in parsed if len(candidates[index]) >= 7]
+    expected = verificators([candidates[index][:-1] for index in checked], use_numpy)
+    for index, verificator in zip(checked, expected):
+        rut = candidates[index]
+        if rut[-1].upper() == verificator:
+            candidates[index] = f"{rut[:-1]}-{rut[-1]}"
+    if use_cache:
+        rut_cache.put_many(
+            [descriptions[index] for index in parsed], [candidates[index] for index in parsed]
+        )
+    return candidates
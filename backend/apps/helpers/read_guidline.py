@@ -1,8 +1,7 @@
-    
 
 class ReadGuidance:
     @staticmethod
-    def extract_guidance_list(text):
+    def find_guidance_list(text):
         import re
         # Look for content between square brackets
         match = re.search(r'\[(.*?)\]', text)
@@ -10,4 +9,20 @@ class ReadGuidance:
             # Split the content by comma and strip whitespace
             items = [item.strip() for item in match.group(1).split(',')]
             return items
-        raise Exception("Could not find guidance list in response")
\ No newline at end of file
+        return None
+
+    @classmethod
+    def extract_guidance_list(cls, text):
+        items = cls.find_guidance_list(text)
+        if items is not None:
+            return items
+        raise Exception("Could not find guidance list in response")
+
+    @staticmethod
+    def find_numbered_guidance_lists(text):
+        import re
+        # One "n. [Rubro, categoria]" line per item of a batch prompt
+        lists = {}
+        for match in re.finditer(r'^\s*(\d+)\s*[.)-]\s*\[(.*?)\]', text, re.MULTILINE):
+            lists.setdefault(int(match.group(1)), [item.strip() for item in match.group(2).split(',')])
+        return lists
@@ -0,0 +1,144 @@
+import hashlib
+import re
+from datetime import timedelta
+from typing import Dict, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import F
+from django.utils import timezone
+
+from apps.helpers.cache_counters import incr_counter
+from apps.integrations.sii_catalog import get_catalog
+from apps.integrations.sii_search import strip_accents
+from apps.models import ActivityGuidanceCacheEntry
+
+_NON_WORD_RE = re.compile(r"[^a-z0-9ñ]+")
+
+_FRONT_KEY_PREFIX = "activity-guidance"
+_TOUCH_KEY_PREFIX = "activity-guidance:touched"
+_EVICT_KEY = "activity-guidance:evicted"
+_HITS_KEY = "activity-guidance:stats:hits"
+_MISSES_KEY = "activity-guidance:stats:misses"
+
+
+def normalize_description(description: str) -> str:
+    """
+    Case, accent, punctuation and whitespace insensitive form of a description,
+    so "Vendo  empanadas!" and "vendo empanadas" share a cache entry.
+    """
+    return _NON_WORD_RE.sub(" ", strip_accents(description)).strip()
+
+
+class ActivityGuidanceCache:
+    """
+    Persistent cache of LLM activity classifications.
+
+    Entries live in `ActivityGuidanceCacheEntry` and are keyed on the
+    normalized description, the model id and the SII catalog version. A Django
+    cache front answers repeats without reading the table; its hits still
+    refresh the entry's `last_used_at`, at most once per
+    SII_GUIDANCE_CACHE_TOUCH_INTERVAL, so the LRU eviction keeps the hot
+    entries.
+    """
+
+    def __init__(
+        self,
+        model_id: Optional[str] = None,
+        catalog_version: Optional[str] = None,
+        ttl: Optional[timedelta] = None,
+        max_entries: Optional[int] = None,
+    ):
+        self.model_id = model_id or settings.SII_GUIDANCE_MODEL_ID
+        self.catalog_version = catalog_version or get_catalog().version
+        self.ttl = ttl or timedelta(seconds=settings.SII_GUIDANCE_CACHE_TTL)
+        self.max_entries = max_entries or settings.SII_GUIDANCE_CACHE_MAX_ENTRIES
+
+    def key(self, description: str) -> str:
+        raw = f"{normalize_description(description)}|{self.model_id}|{self.catalog_version}"
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def get(self, description: str) -> Optional[Dict[str, str]]:
+        key = self.key(description)
+        front_key = f"{_FRONT_KEY_PREFIX}:{key}"
+        value = cache.get(front_key)
+        if value is not None:
+            self._touch(key)
+        else:
+            now = timezone.now()
+            entry = ActivityGuidanceCacheEntry.objects.filter(key=key, expires_at__gt=now).first()
+            if entry is not None:
+                ActivityGuidanceCacheEntry.objects.filter(pk=entry.pk).update(
+                    hits=F("hits") + 1, last_used_at=now
+                )
+                value = {"activity": entry.activity, "iva_code": entry.iva_code, "code": entry.code}
+                cache.set(front_key, value, self._front_timeout(entry.expires_at - now))
+                cache.set(
+                    f"{_TOUCH_KEY_PREFIX}:{key}", 1, settings.SII_GUIDANCE_CACHE_TOUCH_INTERVAL
+                )
+        incr_counter(_HITS_KEY if value is not None else _MISSES_KEY)
+        return value
+
+    def set(self, description: str, activity: str, iva_code: str, code: Optional[str] = None):
+        key = self.key(description)
+        now = timezone.now()
+        ActivityGuidanceCacheEntry.objects.update_or_create(
+            key=key,
+            defaults={
+                "normalized_description": normalize_description(description),
+                "model_id": self.model_id,
+                "catalog_version": self.catalog_version,
+                "activity": activity,
+                "iva_code": iva_code,
+                "code": code,
+                "last_used_at": now,
+                "expires_at": now + self.ttl,
+            },
+        )
+        cache.set(
+            f"{_FRONT_KEY_PREFIX}:{key}",
+            {"activity": activity, "iva_code": iva_code, "code": code},
+            self._front_timeout(self.ttl),
+        )
+        # One eviction per interval across processes, not one per write: the
+        # table may run over `max_entries` by the writes of an interval.
+        if cache.add(_EVICT_KEY, 1, settings.SII_GUIDANCE_CACHE_EVICT_INTERVAL):
+            self.evict()
+
+    @staticmethod
+    def _touch(key: str):
+        if cache.add(f"{_TOUCH_KEY_PREFIX}:{key}", 1, settings.SII_GUIDANCE_CACHE_TOUCH_INTERVAL):
+            ActivityGuidanceCacheEntry.objects.filter(key=key).update(
+                hits=F("hits") + 1, last_used_at=timezone.now()
+            )
+
+    def evict(self):
+        """
+        Drop expired entries, then, when the table holds more than
+        `max_entries`, the least recently used ones above it.
+        """
+        entries = ActivityGuidanceCacheEntry.objects
+        entries.filter(expires_at__lte=timezone.now()).delete()
+        excess = entries.count() - self.max_entries
+        if excess <= 0:
+            return
+        stale_ids = list(
+            entries.order_by("last_used_at").values_list("id", flat=True)[:excess]
+        )
+        entries.filter(id__in=stale_ids).delete()
+
+    @staticmethod
+    def _front_timeout(remaining: timedelta) -> int:
+        return max(1, int(min(remaining.total_seconds(), settings.SII_GUIDANCE_CACHE_FRONT_TTL)))
+
+    @staticmethod
+    def stats() -> Dict[str, float]:
+        hits = cache.get(_HITS_KEY, 0)
+        misses = cache.get(_MISSES_KEY, 0)
+        lookups = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": hits / lookups if lookups else 0.0,
+            "entries": ActivityGuidanceCacheEntry.objects.count(),
+        }
@@ -0,0 +1,277 @@
+import logging
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple, Union
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+
+from apps.helpers.cache_counters import incr_counter
+from apps.helpers.read_guidline import ReadGuidance
+from apps.integrations.activity_cache import ActivityGuidanceCache, normalize_description
+from apps.integrations.sii_search import LexicalMatch, get_activity_search
+
+logger = logging.getLogger(__name__)
+
+SOURCE_LEXICAL = "lexical"
+SOURCE_CACHE = "cache"
+SOURCE_LLM = "llm"
+
+MODE_AUTO = "auto"
+MODE_LLM = "llm"
+MODE_LEXICAL = "lexical"
+
+_STATS_KEY_PREFIX = "activity-classifier"
+SOURCES = (SOURCE_LEXICAL, SOURCE_CACHE, SOURCE_LLM)
+
+
+@dataclass(frozen=True)
+class ActivityGuidance:
+    activity: str
+    iva_code: str
+    source: str
+    code: Optional[str] = None
+
+
+class ActivityClassifier:
+    """
+    Classifies a free-text activity description into an SII activity.
+
+    In "auto" mode near-verbatim catalog names are answered straight from the
+    BM25 index and only ambiguous descriptions reach Bedrock; "llm" always asks
+    the model and "lexical" never does. Model answers are remembered in
+    `ActivityGuidanceCache` unless `use_cache` is off.
+    """
+
+    # Per-process count of answers by source; `classifier_stats` has the
+    # count across processes.
+    stats = Counter()
+
+    def __init__(
+        self,
+        mode: Optional[str] = None,
+        min_margin: Optional[float] = None,
+        min_coverage: Optional[float] = None,
+        use_cache: bool = True,
+    ):
+        self.mode = mode or settings.SII_CLASSIFIER_MODE
+        self.min_margin = settings.SII_FAST_PATH_MARGIN if min_margin is None else min_margin
+        self.min_coverage = (
+            settings.SII_FAST_PATH_COVERAGE if min_coverage is None else min_coverage
+        )
+        self.cache = ActivityGuidanceCache() if use_cache else None
+
+    def is_confident(self, match: LexicalMatch) -> bool:
+        """
+        The best match must contain the description's terms and either be the
+        catalog name verbatim or lead the runner-up by `min_margin`. Being the
+        only candidate with every term is not enough: "venta de ropa" covers
+        just "ropa usada" while plain clothing retail sits below it.
+        """
+        if match.coverage < self.min_coverage:
+            return False
+        return match.exact or match.margin >= self.min_margin
+
+    def lexical_guidance(self, activity_description: str) -> Optional[ActivityGuidance]:
+        match = get_activity_search().best_match(activity_description)
+        if match is None or (self.mode != MODE_LEXICAL and not self.is_confident(match)):
+            return None
+        return ActivityGuidance(
+            activity=match.activity.description.capitalize(),
+            iva_code=match.activity.tax_category,
+            source=SOURCE_LEXICAL,
+            code=match.activity.code,
+        )
+
+    def cached_guidance(self, activity_description: str) -> Optional[ActivityGuidance]:
+        if self.cache is None:
+            return None
+        cached = self.cache.get(activity_description)
+        if cached is None:
+            return None
+        return ActivityGuidance(source=SOURCE_CACHE, **cached)
+
+    def _remember(self, activity_description: str, guidance: ActivityGuidance):
+        if self.cache is not None:
+            self.cache.set(activity_description, guidance.activity, guidance.iva_code)
+
+    def _guidance_from_list(self, guidance_list: List[str]) -> ActivityGuidance:
+        try:
+            activity, iva_code = guidance_list[0], guidance_list[1]
+        except Exception:
+            raise Exception("Error parsing activity guidance")
+        return ActivityGuidance(activity=activity, iva_code=iva_code, source=SOURCE_LLM)
+
+    def _parse_llm_guidance(self, guidance: str) -> ActivityGuidance:
+        return self._guidance_from_list(ReadGuidance().extract_guidance_list(guidance))
+
+    def llm_guidance(self, activity_description: str) -> ActivityGuidance:
+        from apps.integrations.bedrock_chat_sii_rubro import BedRockLLM
+
+        guidance = BedRockLLM.for_activity_guidance().ask_activity_guidance(activity_description)
+        result = self._parse_llm_guidance(guidance)
+        self._remember(activity_description, result)
+        return result
+
+    async def allm_guidance(self, activity_description: str) -> ActivityGuidance:
+        from apps.integrations.bedrock_chat_sii_rubro import BedRockLLM
+
+        guidance = await BedRockLLM.for_activity_guidance().aask_activity_guidance(
+            activity_description
+        )
+        result = self._parse_llm_guidance(guidance)
+        await sync_to_async(self._remember)(activity_description, result)
+        return result
+
+    def _local_guidance(self, activity_description: str) -> Optional[ActivityGuidance]:
+        guidance = None
+        if self.mode in (MODE_AUTO, MODE_LEXICAL):
+            guidance = self.lexical_guidance(activity_description)
+        if guidance is None and self.mode == MODE_LEXICAL:
+            raise Exception("No SII activity matches the description")
+        return guidance
+
+    def _record(self, guidance: ActivityGuidance) -> ActivityGuidance:
+        self.stats[guidance.source] += 1
+        incr_counter(f"{_STATS_KEY_PREFIX}:{guidance.source}")
+        logger.info("Activity guidance answered by %s", guidance.source)
+        return guidance
+
+    def classify(self, activity_description: str) -> ActivityGuidance:
+        guidance = self._local_guidance(activity_description)
+        if guidance is None:
+            guidance = self.cached_guidance(activity_description)
+        if guidance is None:
+            guidance = self.llm_guidance(activity_description)
+        return self._record(guidance)
+
+    async def aclassify(self, activity_description: str) -> ActivityGuidance:
+        """
+        `classify` for async views: the cache lookup runs in a worker thread
+        and the Bedrock call does not hold the event loop.
+        """
+        guidance = self._local_guidance(activity_description)
+        if guidance is None:
+            guidance = await sync_to_async(self.cached_guidance)(activity_description)
+        if guidance is None:
+            guidance = await self.allm_guidance(activity_description)
+        return self._record(guidance)
+
+    def llm_batch_guidance(
+        self, activity_descriptions: List[str]
+    ) -> List[Union[ActivityGuidance, Exception]]:
+        """
+        Classify several descriptions with one Bedrock call. Descriptions the
+        model left out of its answer come back as exceptions. Nothing is
+        cached here so it can run outside the request thread.
+        """
+        from apps.integrations.bedrock_chat_sii_rubro import BedRockLLM
+
+        llm = BedRockLLM.for_activity_guidance(
+            max_tokens=max(500, settings.SII_BATCH_TOKENS_PER_ITEM * len(activity_descriptions))
+        )
+        answer = llm.ask_activity_guidance_batch(activity_descriptions)
+        guidance_lists = ReadGuidance.find_numbered_guidance_lists(answer)
+        results = []
+        for number in range(1, len(activity_descriptions) + 1):
+            try:
+                guidance_list = guidance_lists.get(number)
+                if guidance_list is None:
+                    raise Exception("Could not find guidance list in response")
+                results.append(self._guidance_from_list(guidance_list))
+            except Exception as error:
+                results.append(error)
+        return results
+
+    def classify_batch(
+        self,
+        activity_descriptions: List[str],
+        concurrency: Optional[int] = None,
+        batch_size: Optional[int] = None,
+    ) -> List[Union[ActivityGuidance, Exception]]:
+        """
+        Classify many descriptions, in input order. Repeats (after
+        `normalize_description`) are classified once, lexical and cached
+        answers are resolved locally, and the rest go to Bedrock in prompts of
+        `batch_size` descriptions with at most `concurrency` calls in flight.
+        Descriptions without lexical candidates need the whole catalog, so
+        they go in chunks of their own instead of widening the prompts of
+        descriptions with a shortlist. A failure is returned in place of its
+        description's result.
+        """
+        concurrency = concurrency or settings.SII_BATCH_CONCURRENCY
+        batch_size = batch_size or settings.SII_BATCH_PROMPT_SIZE
+
+        unique: Dict[str, str] = {}
+        for activity_description in activity_descriptions:
+            unique.setdefault(normalize_description(activity_description), activity_description)
+
+        results: Dict[str, Union[ActivityGuidance, Exception]] = {}
+        pending: List[Tuple[str, str]] = []
+        for key, activity_description in unique.items():
+            try:
+                guidance = self._local_guidance(activity_description)
+                if guidance is None:
+                    guidance = self.cached_guidance(activity_description)
+            except Exception as error:
+                results[key] = error
+                continue
+            if guidance is None:
+                pending.append((key, activity_description))
+            else:
+                results[key] = self._record(guidance)
+
+        search = get_activity_search()
+        shortlisted: List[Tuple[str, str]] = []
+        unmatched: List[Tuple[str, str]] = []
+        for key, activity_description in pending:
+            if search.search(activity_description, k=1):
+                shortlisted.append((key, activity_description))
+            else:
+                unmatched.append((key, activity_description))
+        chunks = [
+            group[start : start + batch_size]
+            for group in (shortlisted, unmatched)
+            for start in range(0, len(group), batch_size)
+        ]
+        if chunks:
+            with ThreadPoolExecutor(
+                max_workers=min(concurrency, len(chunks)), thread_name_prefix="guidance-batch"
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        self.llm_batch_guidance, [description for _, description in chunk]
+                    )
+                    for chunk in chunks
+                ]
+                for chunk, future in zip(chunks, futures):
+                    try:
+                        answers = future.result()
+                    except Exception as error:
+                        answers = [error] * len(chunk)
+                    for (key, activity_description), answer in zip(chunk, answers):
+                        if isinstance(answer, ActivityGuidance):
+                            # Cache writes stay on this thread and its DB connection.
+                            self._remember(activity_description, answer)
+                            answer = self._record(answer)
+                        results[key] = answer
+
+        return [
+            results[normalize_description(activity_description)]
+            for activity_description in activity_descriptions
+        ]
+
+
+def classifier_stats() -> Dict[str, float]:
+    """
+    Answers by source across every process sharing the cache, and the share
+    answered by the lexical fast path.
+    """
+    counts = {source: cache.get(f"{_STATS_KEY_PREFIX}:{source}", 0) for source in SOURCES}
+    total = sum(counts.values())
+    return {
+        **counts,
+        "lexical_ratio": counts[SOURCE_LEXICAL] / total if total else 0.0,
+    }
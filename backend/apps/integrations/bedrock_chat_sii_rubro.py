@@ -1,6144 +1,63 @@
-import boto3
+import asyncio
 import json
-from typing import Optional, Dict, Any, List
+from functools import partial
+from typing import Optional, Dict, Any, Callable, List
 
+from django.conf import settings
 
-data = [
-"""
-Todos los cŠdigos de actividad econŠmica
-Esta opciŠn permite ver todos los cŠdigos de actividad econŠmica.
-AGRICULTURA, GANADERêA, SILVICULTURA Y 
-PESCA
-CŠdigo
-CULTIVO DE PLANTAS NO PERENNES
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-011101
-CULTIVO DE TRIGO
-SI
-1
-SI
-011102
-CULTIVO DE MAêZ
-SI
-1Co
-SI
-011103
-CULTIVO DE AVENA
-SI
-1
-SI
-011104
-CULTIVO DE CEBADA
-SI
-1
-SI
-011105
-CULTIVO DE OTROS CEREALES (EXCEPTO TRIGO, MAêZ, AVENA Y CEBADA)
-SI
-1
-SI
-011106
-CULTIVO DE POROTOS
-SI
-1
-SI
-011107
-CULTIVO DE LUPINO
-SI
-1
-SI
-011108
-CULTIVO DE OTRAS LEGUMBRES (EXCEPTO POROTOS Y LUPINO)
-SI
-1
-SI
-011109
-CULTIVO DE SEMILLAS DE RAPS
-SI
-1
-SI
-011110
-CULTIVO DE SEMILLAS DE MARAVILLA (GIRASOL)
-SI
-1
-SI
-011111
-CULTIVO DE SEMILLAS DE CEREALES, LEGUMBRES Y OLEAGINOSAS (EXCEPTO SEMILLAS 
-DE RAPS Y
-MARAVILLA)
-SI
-1
-SI
-011200
-CULTIVO DE ARROZ
-SI
-1
-SI
-011301
-CULTIVO DE PAPAS
-SI
-1
-SI
-011302
-CULTIVO DE CAMOTES
-SI
-1
-SI
-011303
-CULTIVO DE OTROS TUB…RCULOS (EXCEPTO PAPAS Y CAMOTES)
-SI
-1
-SI
-011304
-CULTIVO DE REMOLACHA AZUCARERA
-SI
-1
-SI
-011305
-CULTIVO DE SEMILLAS DE HORTALIZAS
-SI
-1
-SI
-011306
-CULTIVO DE HORTALIZAS Y MELONES
-!
-SI
-1
-SI
-011400
-CULTIVO DE CA—A DE AZòCAR
-SI
-1
-SI
-011500
-CULTIVO DE TABACO
-SI
-1
-SI
-011600
-CULTIVO DE PLANTAS DE FIBRA
-SI
-1
-SI
-011901
-CULTIVO DE FLORES
-SI
-1
-SI
-011902
-CULTIVOS FORRAJEROS EN PRADERAS MEJORADAS O SEMBRADAS; CULTIVOS 
-SUPLEMENTARIOS
-FORRAJEROS
-SI
-1
-SI
-011903
-CULTIVOS DE SEMILLAS DE FLORES; CULTIVO DE SEMILLAS DE PLANTAS FORRAJERAS
-SI
-1
-SI
-CŠdigo
-CULTIVO DE PLANTAS PERENNES
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-012111
-CULTIVO DE UVA DESTINADA A LA PRODUCCIîN DE PISCO Y AGUARDIENTE
-SI
-1
-SI
-012112
-CULTIVO DE UVA DESTINADA A LA PRODUCCIîN DE VINO
-SI
-1
-SI
-012120
-CULTIVO DE UVA PARA MESA
-SI
-1
-SI
-012200
-CULTIVO DE FRUTAS TROPICALES Y SUBTROPICALES (INCLUYE EL CULTIVO DE PALTAS)
-SI
-1
-SI
-012300
-CULTIVO DE CêTRICOS
-SI
-1
-SI
-012400
-CULTIVO DE FRUTAS DE PEPITA Y DE HUESO
-SI
-1
-SI
-012501
-CULTIVO DE SEMILLAS DE FRUTAS
-SI
-1
-SI
-012502
-CULTIVO DE OTROS FRUTOS Y NUECES DE çRBOLES Y ARBUSTOS
-SI
-1
-SI
-012600
-CULTIVO DE FRUTOS OLEAGINOSOS (INCLUYE EL CULTIVO DE ACEITUNAS)
-SI
-1
-SI
-012700
-CULTIVO DE PLANTAS CON LAS QUE SE PREPARAN BEBIDAS (INCLUYE EL CULTIVO DE 
-CAF…, T… Y MATE)
-SI
-1
-SI
-012801
-CULTIVO DE ESPECIAS
-SI
-1
-SI
-012802
-CULTIVO DE PLANTAS AROMçTICAS, MEDICINALES Y FARMAC…UTICAS
-SI
-1
-SI
-012900
-CULTIVO DE OTRAS PLANTAS PERENNES
-SI
-1
-SI
-CŠdigo
-PROPAGACIîN DE PLANTAS
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-013000
-CULTIVO DE PLANTAS VIVAS INCLUIDA LA PRODUCCIîN EN VIVEROS (EXCEPTO 
-VIVEROS FORESTALES)
-SI
-1
-SI
-CŠdigo
-GANADERêA
-!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-014101
-CRêA DE GANADO BOVINO PARA LA PRODUCCIîN LECHERA
-SI
-1
-SI
-014102
-CRêA DE GANADO BOVINO PARA LA PRODUCCIîN DE CARNE O COMO 
-GANADO REPRODUCTOR
-SI
-1
-SI
-014200
-CRêA DE CABALLOS Y OTROS EQUINOS
-SI
-1
-SI
-014300
-CRêA DE LLAMAS, ALPACAS, VICU—AS, GUANACOS Y OTROS 
-CAM…LIDOS
-SI
-1
-SI
-014410
-CRêA DE OVEJAS (OVINOS)
-SI
-1
-SI
-014420
-CRêA DE CABRAS (CAPRINOS)
-SI
-1
-SI
-014500
-CRêA DE CERDOS
-SI
-1
-SI
-014601
-CRêA DE AVES DE CORRAL PARA LA PRODUCCIîN DE CARNE
-SI
-1
-SI
-014602
-CRêA DE AVES DE CORRAL PARA LA PRODUCCIîN DE HUEVOS
-SI
-1
-SI
-014901
-APICULTURA
-SI
-1
-SI
-014909
-CRêA DE OTROS ANIMALES N.C.P.
-SI
-1
-SI
-CŠdigo
-CULTIVO DE PRODUCTOS AGRêCOLAS EN COMBINACIîN CON LA 
-CRêA DE ANIMALES
-!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-015000
-CULTIVO DE PRODUCTOS AGRêCOLAS EN COMBINACIîN CON LA 
-CRêA DE ANIMALES (EXPLOTACIîN MIXTA)
-SI
-1
-SI
-CŠdigo
-ACTIVIDADES DE APOYO A LA AGRICULTURA Y LA GANADERêA Y 
-ACTIVIDADES POSCOSECHA
-!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-016100
-ACTIVIDADES DE APOYO A LA AGRICULTURA
-SI
-1
-SI
-016200
-ACTIVIDADES DE APOYO A LA GANADERêA
-SI
-1
-SI
-016300
-ACTIVIDADES POSCOSECHA
-SI
-1
-SI
-016400
-TRATAMIENTO DE SEMILLAS PARA PROPAGACIîN
-SI
-1
-SI
-CŠdigo
-CAZA ORDINARIA Y MEDIANTE TRAMPAS Y ACTIVIDADES DE SERVICIOS 
-CONEXAS
-!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-017000
-CAZA ORDINARIA Y MEDIANTE TRAMPAS Y ACTIVIDADES DE SERVICIOS CONEXAS
-SI
-1
-SI
-CŠdigo
-SILVICULTURA Y OTRAS ACTIVIDADES 
-FORESTALES
-!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-021001
-EXPLOTACIîN DE VIVEROS FORESTALES
-SI
-1
-SI
-021002
-SILVICULTURA Y OTRAS ACTIVIDADES FORESTALES (EXCEPTO EXPLOTACIîN DE 
-VIVEROS FORESTALES)
-SI
-1
-SI
-CŠdigo
-EXTRACCIîN DE 
-MADERA
-!!!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-022000
-EXTRACCIîN DE MADERA
-SI
-1
-SI
-CŠdigo
-RECOLECCIîN DE PRODUCTOS FORESTALES DISTINTOS DE LA 
-MADERA
-!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-023000
-RECOLECCIîN DE PRODUCTOS FORESTALES DISTINTOS DE LA MADERA
-SI
-1
-SI
-CŠdigo
-SERVICIOS DE APOYO A LA 
-SILVICULTURA
-!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-024001
-SERVICIOS DE FORESTACIîN A CAMBIO DE UNA RETRIBUCIîN O POR 
-CONTRATA
-SI
-1
-SI
-024002
-SERVICIOS DE CORTA DE MADERA A CAMBIO DE UNA RETRIBUCIîN O POR 
-CONTRATA
-SI
-1
-SI
-024003
-SERVICIOS DE EXTINCIîN Y PREVENCIîN DE INCENDIOS FORESTALES
-SI
-1
-SI
-024009
-OTROS SERVICIOS DE APOYO A LA SILVICULTURA N.C.P.
-SI
-1
-SI
-CŠdigo
-PESCA
-!!!!!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-031110
-PESCA MARêTIMA INDUSTRIAL, EXCEPTO DE BARCOS FACTORêA
-SI
-1
-SI
-031120
-PESCA MARêTIMA ARTESANAL
-SI
-1
-SI
-031130
-RECOLECCIîN Y EXTRACCIîN DE PRODUCTOS MARINOS
-SI
-1
-SI
-031140
-SERVICIOS RELACIONADOS CON LA PESCA MARêTIMA
-SI
-1
-SI
-031200
-PESCA DE AGUA DULCE
-SI
-1
-SI
-CŠdigo
-ACUICULTURA
-!!!!!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-032110
-CULTIVO Y CRIANZA DE PECES MARINOS
-SI
-1
-SI
-032120
-CULTIVO, REPRODUCCIîN Y MANEJO DE ALGAS MARINAS
-SI
-1
-SI
-032130
-REPRODUCCIîN Y CRêA DE MOLUSCOS, CRUSTçCEOS Y GUSANOS 
-MARINOS
-SI
-1
-SI
-032140
-SERVICIOS RELACIONADOS CON LA ACUICULTURA MARINA
-SI
-1
-SI
-032200
-ACUICULTURA DE AGUA DULCE
-SI
-1
-SI
-EXPLOTACIîN DE MINAS Y CANTERAS
-CŠdigo
-EXTRACCIîN Y PROCESAMIENTO DE 
-COBRE
-!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-040000
-EXTRACCIîN Y PROCESAMIENTO DE COBRE
-SI
-1
-SI
-CŠdigo
-EXTRACCIîN DE CARBîN DE 
-PIEDRA
-!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-051000
-EXTRACCIîN DE CARBîN DE PIEDRA
-SI
-1
-SI
-CŠdigo
-EXTRACCIîN DE 
-LIGNITO
-!!!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-052000
-EXTRACCIîN DE LIGNITO
-SI
-1
-SI
-CŠdigo
-EXTRACCIîN DE PETRîLEO 
-CRUDO
-!!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-061000
-EXTRACCIîN DE PETRîLEO CRUDO
-SI
-1
-SI
-CŠdigo
-EXTRACCIîN DE GAS 
-NATURAL
-!!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-062000
-EXTRACCIîN DE GAS NATURAL
-SI
-1
-SI
-CŠdigo
-EXTRACCIîN DE MINERALES DE 
-HIERRO
-!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-071000
-EXTRACCIîN DE MINERALES DE HIERRO
-SI
-1
-SI
-072100
-EXTRACCIîN DE MINERALES DE URANIO Y TORIO
-SI
-1
-SI
-072910
-EXTRACCIîN DE ORO Y PLATA
-SI
-1
-SI
-072991
-EXTRACCIîN DE ZINC Y PLOMO
-SI
-1
-SI
-072992
-EXTRACCIîN DE MANGANESO
-SI
-1
-SI
-072999
-EXTRACCIîN DE OTROS MINERALES METALêFEROS NO FERROSOS N.C.P. 
-(EXCEPTO ZINC, PLOMO Y
-MANGANESO)
-SI
-1
-SI
-CŠdigo
-EXTRACCIîN DE PIEDRA, ARENA Y 
-ARCILLA
-!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-081000
-EXTRACCIîN DE PIEDRA, ARENA Y ARCILLA
-SI
-1
-SI
-CŠdigo
-EXPLOTACIîN DE MINAS Y CANTERAS 
-N.C.P.
-!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-089110
-EXTRACCIîN Y PROCESAMIENTO DE LITIO
-SI
-1
-SI
-089190
-EXTRACCIîN DE MINERALES PARA LA FABRICACIîN DE ABONOS Y 
-PRODUCTOS QUêMICOS N.C.P.
-SI
-1
-SI
-089200
-EXTRACCIîN DE TURBA
-SI
-1
-SI
-089300
-EXTRACCIîN DE SAL
-SI
-1
-SI
-089900
-EXPLOTACIîN DE OTRAS MINAS Y CANTERAS N.C.P.
-SI
-1
-SI
-CŠdigo
-ACTIVIDADES DE APOYO PARA LA EXTRACCIîN DE PETRîLEO Y 
-GAS 
-NATURAL
-!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-091001
-ACTIVIDADES DE APOYO PARA LA EXTRACCIîN DE PETRîLEO Y GAS 
-NATURAL PRESTADOS POR
-EMPRESAS
-SI
-1
-SI
-091002
-ACTIVIDADES DE APOYO PARA LA EXTRACCIîN DE PETRîLEO Y GAS 
-NATURAL PRESTADOS POR
-PROFESIONALES
-G
-G
-SI
-CŠdigo
-ACTIVIDADES DE APOYO PARA LA EXPLOTACIîN DE OTRAS MINAS Y 
-CANTERAS
-!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-099001
-ACTIVIDADES DE APOYO PARA LA EXPLOTACIîN DE OTRAS MINAS Y CANTERAS 
-PRESTADOS POR
-EMPRESAS
-SI
-1
-SI
-099002
-ACTIVIDADES DE APOYO PARA LA EXPLOTACIîN DE OTRAS MINAS Y CANTERAS 
-PRESTADOS POR
-PROFESIONALES
-G
-G
-SI
-INDUSTRIA MANUFACTURERA
-CŠdigo
-ELABORACIîN Y CONSERVACIîN DE 
-CARNE
-!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-101011
-EXPLOTACIîN DE MATADEROS DE BOVINOS, OVINOS, EQUINOS, CAPRINOS, 
-PORCINOS Y CAM…LIDOS
-!
-SI
-1
-SI
-101019
-EXPLOTACIîN DE MATADEROS DE AVES Y DE OTROS TIPOS DE ANIMALES N.C.P.
-SI
-1
-SI
-101020
-ELABORACIîN Y CONSERVACIîN DE CARNE Y PRODUCTOS 
-CçRNICOS
-SI
-1
-SI
-CŠdigo
-ELABORACIîN Y CONSERVACIîN DE PESCADO, 
-CRUSTçCEOS Y 
-MOLUSCOS
-!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-102010
-PRODUCCIîN DE HARINA DE PESCADO
-SI
-1
-SI
-102020
-ELABORACIîN Y CONSERVACIîN DE SALMîNIDOS
-SI
-1
-SI
-102030
-ELABORACIîN Y CONSERVACIîN DE OTROS PESCADOS, EN PLANTAS EN 
-TIERRA (EXCEPTO BARCOS
-FACTORêA)
-SI
-1
-SI
-102040
-ELABORACIîN Y CONSERVACIîN DE CRUSTçCEOS, MOLUSCOS Y 
-OTROS PRODUCTOS ACUçTICOS, EN
-PLANTAS EN TIERRA
-SI
-1
-SI
-102050
-ACTIVIDADES DE ELABORACIîN Y CONSERVACIîN DE PESCADO, 
-REALIZADAS EN BARCOS FACTORêA
-SI
-1
-SI
-102060
-ELABORACIîN Y PROCESAMIENTO DE ALGAS
-SI
-1
-SI
-CŠdigo
-ELABORACIîN Y CONSERVACIîN DE FRUTAS, LEGUMBRES Y 
-HORTALIZAS
-!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-103000
-ELABORACIîN Y CONSERVACIîN DE FRUTAS, LEGUMBRES Y HORTALIZAS
-SI
-1
-SI
-CŠdigo
-ELABORACIîN DE ACEITES Y GRASAS DE ORIGEN VEGETAL Y 
-ANIMAL
-!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-104000
-ELABORACIîN DE ACEITES Y GRASAS DE ORIGEN VEGETAL Y ANIMAL (EXCEPTO 
-ELABORACIîN DE
-MANTEQUILLA)
-SI
-1
-SI
-CŠdigo
-ELABORACIîN DE PRODUCTOS 
-LçCTEOS
-!!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-105000
-ELABORACIîN DE PRODUCTOS LçCTEOS
-SI
-1
-SI
-CŠdigo
-ELABORACIîN DE PRODUCTOS DE MOLINERêA, ALMIDONES Y 
-PRODUCTOS DERIVADOS DEL
-ALMIDîN
-!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-106101
-MOLIENDA DE TRIGO: PRODUCCIîN DE HARINA, S…MOLA Y 
-GRçNULOS
-SI
-1
-SI
-106102
-MOLIENDA DE ARROZ; PRODUCCIîN DE HARINA DE ARROZ
-SI
-1
-SI
-106109
-ELABORACIîN DE OTROS PRODUCTOS DE MOLINERêA N.C.P.
-SI
-1
-SI
-106200
-ELABORACIîN DE ALMIDONES Y PRODUCTOS DERIVADOS DEL ALMIDîN
-SI
-1
-SI
-CŠdigo
-ELABORACIîN DE OTROS PRODUCTOS 
-ALIMENTICIOS
-!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-107100
-ELABORACIîN DE PRODUCTOS DE PANADERêA Y PASTELERêA
-SI
-1
-SI
-107200
-ELABORACIîN DE AZòCAR
-SI
-1
-SI
-107300
-ELABORACIîN DE CACAO, CHOCOLATE Y DE PRODUCTOS DE CONFITERêA
-SI
-1
-SI
-107400
-ELABORACIîN DE MACARRONES, FIDEOS, ALCUZCUZ Y PRODUCTOS 
-FARINçCEOS SIMILARES
-SI
-1
-SI
-107500
-ELABORACIîN DE COMIDAS Y PLATOS PREPARADOS ENVASADOS, ROTULADOS Y CON 
-INFORMACIîN
-NUTRICIONAL
-SI
-1
-SI
-107901
-ELABORACIîN DE T…, CAF…, MATE E INFUSIONES DE HIERBAS
-SI
-1
-SI
-107902
-ELABORACIîN DE LEVADURAS NATURALES O ARTIFICIALES
-SI
-1
-SI
-107903
-ELABORACIîN DE VINAGRES, MOSTAZAS, MAYONESAS Y CONDIMENTOS EN GENERAL
-SI
-1
-SI
-107909
-ELABORACIîN DE OTROS PRODUCTOS ALIMENTICIOS N.C.P.
-SI
-1
-SI
-CŠdigo
-ELABORACIîN DE PIENSOS PREPARADOS PARA 
-ANIMALES
-!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-108000
-ELABORACIîN DE PIENSOS PREPARADOS PARA ANIMALES
-SI
-1
-SI
-CŠdigo
-ELABORACIîN DE BEBIDAS ALCOHîLICAS Y NO 
-ALCOHîLICAS
-!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-110110
-ELABORACIîN DE PISCO (INDUSTRIAS PISQUERAS)
-SI
-1
-SI
-110120
-DESTILACIîN, RECTIFICACIîN Y MEZCLAS DE BEBIDAS 
-ALCOHîLICAS; EXCEPTO PISCO
-SI
-1
-SI
-110200
-ELABORACIîN DE VINOS
-SI
-1
-SI
-110300
-ELABORACIîN DE BEBIDAS MALTEADAS Y DE MALTA
-SI
-1
-SI
-110401
-ELABORACIîN DE BEBIDAS NO ALCOHîLICAS
-SI
-1
-SI
-110402
-PRODUCCIîN DE AGUAS MINERALES Y OTRAS AGUAS EMBOTELLADAS
-SI
-1
-SI
-CŠdigo
-ELABORACIîN DE PRODUCTOS DE 
-TABACO
-!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-120001
-ELABORACIîN DE CIGARROS Y CIGARRILLOS
-SI
-1
-SI
-120009
-ELABORACIîN DE OTROS PRODUCTOS DE TABACO N.C.P.
-SI
-1
-SI
-CŠdigo
-HILATURA, TEJEDURA Y ACABADO DE PRODUCTOS 
-TEXTILES
-!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-131100
-PREPARACIîN E HILATURA DE FIBRAS TEXTILES
-SI
-1
-SI
-131200
-TEJEDURA DE PRODUCTOS TEXTILES
-SI
-1
-SI
-131300
-ACABADO DE PRODUCTOS TEXTILES
-SI
-1
-SI
-CŠdigo
-FABRICACIîN DE OTROS PRODUCTOS 
-TEXTILES
-!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-139100
-FABRICACIîN DE TEJIDOS DE PUNTO Y GANCHILLO
-SI
-1
-SI
-139200
-FABRICACIîN DE ARTêCULOS CONFECCIONADOS DE MATERIALES 
-TEXTILES, EXCEPTO PRENDAS DE
-VESTIR
-SI
-1
-SI
-139300
-FABRICACIîN DE TAPICES Y ALFOMBRAS
-SI
-1
-SI
-139400
-FABRICACIîN DE CUERDAS, CORDELES, BRAMANTES Y REDES
-SI
-1
-SI
-139900
-FABRICACIîN DE OTROS PRODUCTOS TEXTILES N.C.P.
-SI
-1
-SI
-CŠdigo
-FABRICACIîN DE PRENDAS DE VESTIR, EXCEPTO PRENDAS DE 
-PIEL
-!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-141001
-FABRICACIîN DE PRENDAS DE VESTIR DE MATERIALES TEXTILES Y SIMILARES
-SI
-1
-SI
-141002
-FABRICACIîN DE PRENDAS DE VESTIR DE CUERO NATURAL O ARTIFICIAL
-SI
-1
-SI
-141003
-FABRICACIîN DE ACCESORIOS DE VESTIR
-SI
-1
-SI
-141004
-FABRICACIîN DE ROPA DE TRABAJO
-SI
-1
-SI
-CŠdigo
-FABRICACIîN DE ARTêCULOS DE 
-PIEL
-!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-142000
-FABRICACIîN DE ARTêCULOS DE PIEL
-SI
-1
-SI
-CŠdigo
-FABRICACIîN DE ARTêCULOS DE PUNTO Y 
-GANCHILLO
-!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-143000
-FABRICACIîN DE ARTêCULOS DE PUNTO Y GANCHILLO
-SI
-1
-SI
-CŠdigo
-CURTIDO Y ADOBO DE CUEROS; FABRICACIîN PRODUCTOS DE CUERO; 
-ADOBO Y TE—IDO DE PIELES
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-151100
-CURTIDO Y ADOBO DE CUEROS; ADOBO Y TE—IDO DE PIELES
-SI
-1
-SI
-151200
-FABRICACIîN DE MALETAS, BOLSOS Y ARTêCULOS SIMILARES, 
-ARTêCULOS DE TALABARTERêA Y
-GUARNICIONERêA
-SI
-1
-SI
-CŠdigo
-FABRICACIîN DE 
-CALZADO
-!!!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-152000
-FABRICACIîN DE CALZADO
-SI
-1
-SI
-CŠdigo
-ASERRADO Y ACEPILLADURA DE 
-MADERA
-!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-161000
-ASERRADO Y ACEPILLADURA DE MADERA
-SI
-1
-SI
-CŠdigo
-FABRICACIîN DE PRODUCTOS DE MADERA, CORCHO, PAJA Y MATERIALES 
-TRENZABLES
-!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-162100
-FABRICACIîN DE HOJAS DE MADERA PARA ENCHAPADO Y TABLEROS A BASE DE 
-MADERA
-SI
-1
-SI
-162200
-FABRICACIîN DE PARTES Y PIEZAS DE CARPINTERêA PARA EDIFICIOS Y 
-CONSTRUCCIONES
-SI
-1
-SI
-162300
-FABRICACIîN DE RECIPIENTES DE MADERA
-SI
-1
-SI
-162900
-FABRICACIîN DE OTROS PRODUCTOS DE MADERA, DE ARTêCULOS DE 
-CORCHO, PAJA Y MATERIALES
-TRENZABLES
-SI
-1
-SI
-CŠdigo
-FABRICACIîN DE PAPEL Y DE PRODUCTOS DE 
-PAPEL
-!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-170110
-FABRICACIîN DE CELULOSA Y OTRAS PASTAS DE MADERA
-SI
-1
-SI
-170190
-FABRICACIîN DE PAPEL Y CARTîN PARA SU POSTERIOR USO INDUSTRIAL 
-N.C.P.
-SI
-1
-SI
-170200
-FABRICACIîN DE PAPEL Y CARTîN ONDULADO Y DE ENVASES DE PAPEL Y 
-CARTîN
-SI
-1
-SI
-170900
-FABRICACIîN DE OTROS ARTêCULOS DE PAPEL Y CARTîN
-SI
-1
-SI
-CŠdigo
-IMPRESIîN Y ACTIVIDADES DE SERVICIOS RELACIONADAS CON LA 
-IMPRESIîN
-!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-181101
-IMPRESIîN DE LIBROS
-SI
-1
-SI
-181109
-OTRAS ACTIVIDADES DE IMPRESIîN N.C.P.
-SI
-1
-SI
-181200
-ACTIVIDADES DE SERVICIOS RELACIONADAS CON LA IMPRESIîN
-SI
-1
-SI
-CŠdigo
-REPRODUCCIîN DE 
-GRABACIONES
-!!!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-182000
-REPRODUCCIîN DE GRABACIONES
-SI
-1
-SI
-CŠdigo
-FABRICACIîN DE PRODUCTOS DE HORNOS DE 
-COQUE
-!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-191000
-FABRICACIîN DE PRODUCTOS DE HORNOS DE COQUE
-SI
-1
-SI
-CŠdigo
-FABRICACIîN DE PRODUCTOS DE LA REFINACIîN DEL 
-PETRîLEO
-!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-192000
-FABRICACIîN DE PRODUCTOS DE LA REFINACIîN DEL PETRîLEO
-SI
-1
-SI
-CŠdigo
-FABRICACIîN SUSTANCIAS QUêMICAS BçSICAS, ABONOS 
-Y COMPUESTOS DE NITRîGENO, PLçSTICOS
-Y CAUCHO 
-SINT.
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-201101
-FABRICACIîN DE CARBîN VEGETAL (EXCEPTO ACTIVADO); 
-FABRICACIîN DE BRIQUETAS DE CARBîN
-VEGETAL
-SI
-1
-SI
-201109
-FABRICACIîN DE OTRAS SUSTANCIAS QUêMICAS BçSICAS N.C.P.
-SI
-1
-SI
-201200
-FABRICACIîN DE ABONOS Y COMPUESTOS DE NITRîGENO
-SI
-1
-SI
-201300
-FABRICACIîN DE PLçSTICOS Y CAUCHO SINT…TICO EN FORMAS 
-PRIMARIAS
-SI
-1
-SI
-CŠdigo
-FABRICACIîN DE OTROS PRODUCTOS 
-QUêMICOS
-!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-202100
-FABRICACIîN DE PLAGUICIDAS Y OTROS PRODUCTOS QUêMICOS DE USO 
-AGROPECUARIO
-SI
-1
-SI
-202200
-FABRICACIîN DE PINTURAS, BARNICES Y PRODUCTOS DE REVESTIMIENTO, 
-TINTAS DE IMPRENTA Y
-MASILLAS
-SI
-1
-SI
-202300
-FABRICACIîN DE JABONES Y DETERGENTES, PREPARADOS PARA LIMPIAR, 
-PERFUMES Y PREPARADOS DE
-TOCADOR
-SI
-1
-SI
-202901
-FABRICACIîN DE EXPLOSIVOS Y PRODUCTOS PIROT…CNICOS
-SI
-1
-SI
-202909
-FABRICACIîN DE OTROS PRODUCTOS QUêMICOS N.C.P.
-SI
-1
-SI
-CŠdigo
-FABRICACIîN DE FIBRAS 
-ARTIFICIALES
-!!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-203000
-FABRICACIîN DE FIBRAS ARTIFICIALES
-SI
-1
-SI
-CŠdigo
-FABRICACIîN DE PRODUCTOS FARMAC…UTICOS, SUSTANCIAS 
-QUêMICAS MEDICINALES Y PRODUCTOS
-BOTçNICOS
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-210000
-FABRICACIîN DE PRODUCTOS FARMAC…UTICOS, SUSTANCIAS 
-QUêMICAS MEDICINALES Y PRODUCTOS
-BOTçNICOS
-SI
-1
-SI
-CŠdigo
-FABRICACIîN DE PRODUCTOS DE 
-CAUCHO
-!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-221100
-FABRICACIîN DE CUBIERTAS Y CçMARAS DE CAUCHO; RECAUCHUTADO Y 
-RENOVACIîN DE CUBIERTAS DE
-CAUCHO
-SI
-1
-SI
-221900
-FABRICACIîN DE OTROS PRODUCTOS DE CAUCHO
-SI
-1
-SI
-CŠdigo
-FABRICACIîN DE PRODUCTOS DE 
-PLçSTICO
-!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-222000
-FABRICACIîN DE PRODUCTOS DE PLçSTICO
-SI
-1
-SI
-CŠdigo
-FABRICACIîN DE VIDRIO Y PRODUCTOS DE 
-VIDRIO
-!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-231001
-FABRICACIîN DE VIDRIO PLANO
-SI
-1
-SI
-231002
-FABRICACIîN DE VIDRIO HUECO
-SI
-1
-SI
-231003
-FABRICACIîN DE FIBRAS DE VIDRIO
-SI
-1
-SI
-231009
-FABRICACIîN DE PRODUCTOS DE VIDRIO N.C.P.
-SI
-1
-SI
-CŠdigo
-FABRICACIîN DE PRODUCTOS MINERALES NO METçLICOS 
-N.C.P.
-!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-239100
-FABRICACIîN DE PRODUCTOS REFRACTARIOS
-SI
-1
-SI
-239200
-FABRICACIîN DE MATERIALES DE CONSTRUCCIîN DE ARCILLA
-SI
-1
-SI
-239300
-FABRICACIîN DE OTROS PRODUCTOS DE PORCELANA Y DE CERçMICA
-SI
-1
-SI
-239400
-FABRICACIîN DE CEMENTO, CAL Y YESO
-SI
-1
-SI
-239500
-FABRICACIîN DE ARTêCULOS DE HORMIGîN, CEMENTO Y YESO
-SI
-1
-SI
-239600
-CORTE, TALLA Y ACABADO DE LA PIEDRA
-SI
-1
-SI
-239900
-FABRICACIîN DE OTROS PRODUCTOS MINERALES NO METçLICOS N.C.P.
-SI
-1
-SI
-CŠdigo
-INDUSTRIAS BçSICAS DE HIERRO Y 
-ACERO
-!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-241000
-INDUSTRIAS BçSICAS DE HIERRO Y ACERO
-SI
-1
-SI
-CŠdigo
-FABRICACIîN DE PRODUCTOS PRIMARIOS DE METALES PRECIOSOS Y 
-OTROS METALES NO
-FERROSOS
-!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-242001
-FABRICACIîN DE PRODUCTOS PRIMARIOS DE COBRE
-SI
-1
-SI
-242002
-FABRICACIîN DE PRODUCTOS PRIMARIOS DE ALUMINIO
-SI
-1
-SI
-242009
-FABRICACIîN DE PRODUCTOS PRIMARIOS DE METALES PRECIOSOS Y DE OTROS 
-METALES NO FERROSOS
-N.C.P.
-SI
-1
-SI
-CŠdigo
-FUNDICIîN DE 
-METALES
-!!!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-243100
-FUNDICIîN DE HIERRO Y ACERO
-SI
-1
-SI
-243200
-FUNDICIîN DE METALES NO FERROSOS
-SI
-1
-SI
-CŠdigo
-FABRICACIîN DE PRODUCTOS METçLICOS PARA USO 
-ESTRUCTURAL, TANQUES, DEPîSITOS,
-RECIPIENTES DE METAL
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-251100
-FABRICACIîN DE PRODUCTOS METçLICOS PARA USO ESTRUCTURAL
-SI
-1
-SI
-251201
-FABRICACIîN DE RECIPIENTES DE METAL PARA GASES COMPRIMIDOS O LICUADOS
-SI
-1
-SI
-251209
-FABRICACIîN DE TANQUES, DEPîSITOS Y RECIPIENTES DE METAL 
-N.C.P.
-SI
-1
-SI
-251300
-FABRICACIîN DE GENERADORES DE VAPOR, EXCEPTO CALDERAS DE AGUA 
-CALIENTE PARA CALEFACCIîN
-CENTRAL
-SI
-1
-SI
-CŠdigo
-FABRICACIîN DE ARMAS Y 
-MUNICIONES
-!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-252000
-FABRICACIîN DE ARMAS Y MUNICIONES
-SI
-1
-SI
-CŠdigo
-FABRICACIîN DE OTROS PRODUCTOS ELABORADOS DE METAL; 
-ACTIVIDADES DE SERVICIOS DE
-TRABAJO DE METALES
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-259100
-FORJA, PRENSADO, ESTAMPADO Y LAMINADO DE METALES; PULVIMETALURGIA
-SI
-1
-SI
-259200
-TRATAMIENTO Y REVESTIMIENTO DE METALES; MAQUINADO
-SI
-1
-SI
-259300
-FABRICACIîN DE ARTêCULOS DE CUCHILLERêA, HERRAMIENTAS 
-DE MANO Y ARTêCULOS DE FERRETERêA
-SI
-1
-SI
-259900
-FABRICACIîN DE OTROS PRODUCTOS ELABORADOS DE METAL N.C.P.
-SI
-1
-SI
-CŠdigo
-FABRICACIîN DE COMPONENTES Y TABLEROS 
-ELECTRîNICOS
-!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-261000
-FABRICACIîN DE COMPONENTES Y TABLEROS ELECTRîNICOS
-SI
-1
-SI
-CŠdigo
-FABRICACIîN DE COMPUTADORES Y EQUIPO 
-PERIF…RICO
-!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-262000
-FABRICACIîN DE COMPUTADORES Y EQUIPO PERIF…RICO
-SI
-1
-SI
-CŠdigo
-FABRICACIîN DE EQUIPO DE 
-COMUNICACIONES
-!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-263000
-FABRICACIîN DE EQUIPO DE COMUNICACIONES
-SI
-1
-SI
-CŠdigo
-FABRICACIîN DE APARATOS ELECTRîNICOS DE 
-CONSUMO
-!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-264000
-FABRICACIîN DE APARATOS ELECTRîNICOS DE CONSUMO
-SI
-1
-SI
-CŠdigo
-FABRICACIîN DE EQUIPO DE MEDICIîN, PRUEBA, 
-NAVEGACIîN Y CONTROL Y DE 
-RELOJES
-!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-265100
-FABRICACIîN DE EQUIPO DE MEDICIîN, PRUEBA, NAVEGACIîN Y 
-CONTROL
-SI
-1
-SI
-265200
-FABRICACIîN DE RELOJES
-SI
-1
-SI
-CŠdigo
-FABRICACIîN DE EQUIPO DE IRRADIACIîN Y EQUIPO 
-ELECTRîNICO DE USO M…DICO Y
-TERAP…UTICO
-!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-266000
-FABRICACIîN DE EQUIPO DE IRRADIACIîN Y EQUIPO 
-ELECTRîNICO DE USO M…DICO Y TERAP…UTICO
-SI
-1
-SI
-CŠdigo
-FABRICACIîN DE INSTRUMENTOS îPTICOS Y EQUIPO 
-FOTOGRçFICO
-!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-267000
-FABRICACIîN DE INSTRUMENTOS îPTICOS Y EQUIPO 
-FOTOGRçFICO
-SI
-1
-SI
-CŠdigo
-FABRICACIîN DE SOPORTES MAGN…TICOS Y 
-îPTICOS
-!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-268000
-FABRICACIîN DE SOPORTES MAGN…TICOS Y îPTICOS
-SI
-1
-SI
-CŠdigo
-FABRICACIîN DE MOTORES, GENERADORES Y TRANSFORMADORES 
-EL…CTRICOS, APARATOS DE
-DISTRIBUCIîN Y CONTROL
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-271000
-FABRICACIîN DE MOTORES, GENERADORES Y TRANSFORMADORES 
-EL…CTRICOS, APARATOS DE
-DISTRIBUCIîN Y CONTROL
-SI
-1
-SI
-CŠdigo
-FABRICACIîN DE PILAS, BATERêAS Y 
-ACUMULADORES
-!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-272000
-FABRICACIîN DE PILAS, BATERêAS Y ACUMULADORES
-SI
-1
-SI
-CŠdigo
-FABRICACIîN DE CABLES Y DISPOSITIVOS DE 
-CABLEADO
-!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-273100
-FABRICACIîN DE CABLES DE FIBRA îPTICA
-SI
-1
-SI
-273200
-FABRICACIîN DE OTROS HILOS Y CABLES EL…CTRICOS
-SI
-1
-SI
-273300
-FABRICACIîN DE DISPOSITIVOS DE CABLEADO
-SI
-1
-SI
-CŠdigo
-FABRICACIîN DE EQUIPO EL…CTRICO DE 
-ILUMINACIîN
-!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-274000
-FABRICACIîN DE EQUIPO EL…CTRICO DE ILUMINACIîN
-SI
-1
-SI
-CŠdigo
-FABRICACIîN DE APARATOS DE USO 
-DOM…STICO
-!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-275000
-FABRICACIîN DE APARATOS DE USO DOM…STICO
-SI
-1
-SI
-CŠdigo
-FABRICACIîN DE OTROS TIPOS DE EQUIPO 
-EL…CTRICO
-!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-279000
-FABRICACIîN DE OTROS TIPOS DE EQUIPO EL…CTRICO
-SI
-1
-SI
-CŠdigo
-FABRICACIîN DE MAQUINARIA DE USO 
-GENERAL
-!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-281100
-FABRICACIîN DE MOTORES Y TURBINAS, EXCEPTO PARA AERONAVES, 
-VEHêCULOS AUTOMOTORES Y
-MOTOCICLETAS
-SI
-1
-SI
-281200
-FABRICACIîN DE EQUIPO DE PROPULSIîN DE FLUIDOS
-SI
-1
-SI
-281300
-FABRICACIîN DE OTRAS BOMBAS, COMPRESORES, GRIFOS Y VçLVULAS
-SI
-1
-SI
-281400
-FABRICACIîN DE COJINETES, ENGRANAJES, TRENES DE ENGRANAJES Y PIEZAS 
-DE TRANSMISIîN
-SI
-1
-SI
-281500
-FABRICACIîN DE HORNOS, CALDERAS Y QUEMADORES
-SI
-1
-SI
-281600
-FABRICACIîN DE EQUIPO DE ELEVACIîN Y MANIPULACIîN
-SI
-1
-SI
-281700
-FABRICACIîN DE MAQUINARIA Y EQUIPO DE OFICINA (EXCEPTO COMPUTADORES Y 
-EQUIPO PERIF…RICO)
-SI
-1
-SI
-281800
-FABRICACIîN DE HERRAMIENTAS DE MANO MOTORIZADAS
-SI
-1
-SI
-281900
-FABRICACIîN DE OTROS TIPOS DE MAQUINARIA DE USO GENERAL
-SI
-1
-SI
-CŠdigo
-FABRICACIîN DE MAQUINARIA DE USO 
-ESPECIAL
-!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-282100
-FABRICACIîN DE MAQUINARIA AGROPECUARIA Y FORESTAL
-SI
-1
-SI
-282200
-FABRICACIîN DE MAQUINARIA PARA LA CONFORMACIîN DE METALES Y DE 
-MçQUINAS HERRAMIENTA
-SI
-1
-SI
-282300
-FABRICACIîN DE MAQUINARIA METALòRGICA
-SI
-1
-SI
-282400
-FABRICACIîN DE MAQUINARIA PARA LA EXPLOTACIîN DE MINAS Y 
-CANTERAS Y PARA OBRAS DE
-CONSTRUCCIîN
-SI
-1
-SI
-282500
-FABRICACIîN DE MAQUINARIA PARA LA ELABORACIîN DE ALIMENTOS, 
-BEBIDAS Y TABACO
-SI
-1
-SI
-282600
-FABRICACIîN DE MAQUINARIA PARA LA ELABORACIîN DE PRODUCTOS 
-TEXTILES, PRENDAS DE VESTIR Y
-CUEROS
-SI
-1
-SI
-282900
-FABRICACIîN DE OTROS TIPOS DE MAQUINARIA DE USO ESPECIAL
-SI
-1
-SI
-CŠdigo
-FABRICACIîN DE VEHêCULOS 
-AUTOMOTORES
-!!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-291000
-FABRICACIîN DE VEHêCULOS AUTOMOTORES
-SI
-1
-SI
-CŠdigo
-FABRICACIîN DE CARROCERêAS PARA VEHêCULOS 
-AUTOMOTORES; FABRICACIîN DE REMOLQUES Y
-SEMIRREMOLQUES
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-292000
-FABRICACIîN DE CARROCERêAS PARA VEHêCULOS AUTOMOTORES; 
-FABRICACIîN DE REMOLQUES Y
-SEMIRREMOLQUES
-SI
-1
-SI
-CŠdigo
-FABRICACIîN DE PARTES, PIEZAS Y ACCESORIOS PARA 
-VEHêCULOS 
-AUTOMOTORES
-!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-293000
-FABRICACIîN DE PARTES, PIEZAS Y ACCESORIOS PARA VEHêCULOS 
-AUTOMOTORES
-SI
-1
-SI
-CŠdigo
-CONSTRUCCIîN DE BUQUES Y OTRAS 
-EMBARCACIONES
-!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-301100
-CONSTRUCCIîN DE BUQUES, EMBARCACIONES MENORES Y ESTRUCTURAS FLOTANTES
-SI
-1
-SI
-301200
-CONSTRUCCIîN DE EMBARCACIONES DE RECREO Y DE DEPORTE
-SI
-1
-SI
-CŠdigo
-FABRICACIîN DE LOCOMOTORAS Y MATERIAL 
-RODANTE
-!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-302000
-FABRICACIîN DE LOCOMOTORAS Y MATERIAL RODANTE
-SI
-1
-SI
-CŠdigo
-FABRICACIîN DE AERONAVES, NAVES ESPACIALES Y MAQUINARIA 
-CONEXA
-!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-303000
-FABRICACIîN DE AERONAVES, NAVES ESPACIALES Y MAQUINARIA CONEXA
-SI
-1
-SI
-CŠdigo
-FABRICACIîN DE VEHêCULOS MILITARES DE 
-COMBATE
-!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-304000
-FABRICACIîN DE VEHêCULOS MILITARES DE COMBATE
-SI
-1
-SI
-CŠdigo
-FABRICACIîN DE EQUIPO DE TRANSPORTE 
-N.C.P.
-!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-309100
-FABRICACIîN DE MOTOCICLETAS
-SI
-1
-SI
-309200
-FABRICACIîN DE BICICLETAS Y DE SILLAS DE RUEDAS
-SI
-1
-SI
-309900
-FABRICACIîN DE OTROS TIPOS DE EQUIPO DE TRANSPORTE N.C.P.
-SI
-1
-SI
-CŠdigo
-FABRICACIîN DE 
-MUEBLES
-!!!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-310001
-FABRICACIîN DE MUEBLES PRINCIPALMENTE DE MADERA
-SI
-1
-SI
-310009
-FABRICACIîN DE COLCHONES; FABRICACIîN DE OTROS MUEBLES N.C.P.
-SI
-1
-SI
-CŠdigo
-FABRICACIîN DE JOYAS, BISUTERêA Y ARTêCULOS 
-CONEXOS
-!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-321100
-FABRICACIîN DE JOYAS Y ARTêCULOS CONEXOS
-SI
-1
-SI
-321200
-FABRICACIîN DE BISUTERêA Y ARTêCULOS CONEXOS
-SI
-1
-SI
-CŠdigo
-FABRICACIîN DE INSTRUMENTOS 
-MUSICALES
-!!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-322000
-FABRICACIîN DE INSTRUMENTOS MUSICALES
-SI
-1
-SI
-CŠdigo
-FABRICACIîN DE ARTêCULOS DE 
-DEPORTE
-!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-323000
-FABRICACIîN DE ARTêCULOS DE DEPORTE
-SI
-1
-SI
-CŠdigo
-FABRICACIîN DE JUEGOS Y 
-JUGUETES
-!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-324000
-FABRICACIîN DE JUEGOS Y JUGUETES
-SI
-1
-SI
-CŠdigo
-FABRICACIîN DE INSTRUMENTOS Y MATERIALES M…DICOS Y 
-ODONTOLîGICOS
-!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-325001
-ACTIVIDADES DE LABORATORIOS DENTALES
-SI
-1
-SI
-325009
-FABRICACIîN DE INSTRUMENTOS Y MATERIALES M…DICOS, 
-OFTALMOLîGICOS Y ODONTOLîGICOS N.C.P.
-SI
-1
-SI
-CŠdigo
-OTRAS INDUSTRIAS MANUFACTURERAS 
-N.C.P.
-!!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-329000
-OTRAS INDUSTRIAS MANUFACTURERAS N.C.P.
-SI
-1
-SI
-CŠdigo
-REPARACIîN DE PRODUCTOS ELABORADOS DE METAL, MAQUINARIA Y 
-EQUIPO
-!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-331100
-REPARACIîN DE PRODUCTOS ELABORADOS DE METAL
-SI
-1
-SI
-331201
-REPARACIîN DE MAQUINARIA AGROPECUARIA Y FORESTAL
-SI
-1
-SI
-331202
-REPARACIîN DE MAQUINARIA METALòRGICA, PARA LA MINERêA, 
-EXTRACCIîN DE PETRîLEO Y PARA LA
-CONSTRUCCIîN
-SI
-1
-SI
-331203
-REPARACIîN DE MAQUINARIA PARA LA ELABORACIîN DE ALIMENTOS, 
-BEBIDAS Y TABACO
-SI
-1
-SI
-331204
-REPARACIîN DE MAQUINARIA PARA PRODUCIR TEXTILES, PRENDAS DE VESTIR, 
-ARTêCULOS DE CUERO Y
-CALZADO
-!!
-SI
-1
-SI
-331209
-REPARACIîN DE OTRO TIPO DE MAQUINARIA Y EQUIPOS INDUSTRIALES N.C.P.
-SI
-1
-SI
-331301
-REPARACIîN DE EQUIPO DE MEDICIîN, PRUEBA, NAVEGACIîN Y 
-CONTROL
-SI
-1
-SI
-331309
-REPARACIîN DE OTROS EQUIPOS ELECTRîNICOS Y îPTICOS 
-N.C.P.
-SI
-1
-SI
-331400
-REPARACIîN DE EQUIPO EL…CTRICO (EXCEPTO REPARACIîN DE 
-EQUIPO Y ENSERES DOM…STICOS)
-SI
-1
-SI
-331501
-REPARACIîN DE BUQUES, EMBARCACIONES MENORES Y ESTRUCTURAS FLOTANTES
-SI
-1
-SI
-331502
-REPARACIîN DE AERONAVES Y NAVES ESPACIALES
-SI
-1
-SI
-331509
-REPARACIîN DE OTROS EQUIPOS DE TRANSPORTE N.C.P., EXCEPTO 
-VEHêCULOS AUTOMOTORES
-SI
-1
-SI
-331900
-REPARACIîN DE OTROS TIPOS DE EQUIPO
-SI
-1
-SI
-CŠdigo
-INSTALACIîN DE MAQUINARIA Y EQUIPOS 
-INDUSTRIALES
-!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-332000
-INSTALACIîN DE MAQUINARIA Y EQUIPOS INDUSTRIALES
-SI
-1
-SI
-SUMINISTRO DE ELECTRICIDAD, GAS, VAPOR Y AIRE 
-ACONDICIONADO
-CŠdigo
-GENERACIîN, TRANSMISIîN Y DISTRIBUCIîN DE 
-ENERGêA 
-EL…CTRICA
-!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-351011
-GENERACIîN DE ENERGêA EL…CTRICA EN CENTRALES 
-HIDROEL…CTRICAS
-SI
-1
-SI
-351012
-GENERACIîN DE ENERGêA EL…CTRICA EN CENTRALES 
-TERMOEL…CTRICAS
-SI
-1
-SI
-351019
-GENERACIîN DE ENERGêA EL…CTRICA EN OTRAS CENTRALES 
-N.C.P.
-SI
-1
-SI
-351020
-TRANSMISIîN DE ENERGêA EL…CTRICA
-SI
-1
-SI
-Seleccione el rubro
-!
-351020
-TRANSMISIîN DE ENERGêA EL…CTRICA
-SI
-1
-SI
-351030
-DISTRIBUCIîN DE ENERGêA EL…CTRICA
-SI
-1
-SI
-CŠdigo
-FABRICACIîN DE GAS; DISTRIBUCIîN DE COMBUSTIBLES 
-GASEOSOS POR 
-TUBERêAS
-!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-352010
-REGASIFICACIîN DE GAS NATURAL LICUADO (GNL)
-SI
-1
-SI
-352020
-FABRICACIîN DE GAS; DISTRIBUCIîN DE COMBUSTIBLES GASEOSOS POR 
-TUBERêA, EXCEPTO
-REGASIFICACIîN DE GNL
-SI
-1
-SI
-CŠdigo
-SUMINISTRO DE VAPOR Y DE AIRE 
-ACONDICIONADO
-!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-353001
-SUMINISTRO DE VAPOR Y DE AIRE ACONDICIONADO
-SI
-1
-SI
-353002
-ELABORACIîN DE HIELO (EXCEPTO FABRICACIîN DE HIELO SECO)
-SI
-1
-SI
-SUMINISTRO DE AGUA; EVACUACIîN DE AGUAS 
-RESIDUALES, GESTIîN DE DESECHOS Y DESCONTAMINACIîN
-CŠdigo
-CAPTACIîN, TRATAMIENTO Y DISTRIBUCIîN DE 
-AGUA
-!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-360000
-CAPTACIîN, TRATAMIENTO Y DISTRIBUCIîN DE AGUA
-SI
-1
-SI
-CŠdigo
-EVACUACIîN DE AGUAS 
-RESIDUALES
-!!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-370000
-EVACUACIîN Y TRATAMIENTO DE AGUAS SERVIDAS
-SI
-1
-SI
-CŠdigo
-RECOGIDA DE 
-DESECHOS
-!!!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-381100
-RECOGIDA DE DESECHOS NO PELIGROSOS
-SI
-1
-SI
-381200
-RECOGIDA DE DESECHOS PELIGROSOS
-SI
-1
-SI
-CŠdigo
-TRATAMIENTO Y ELIMINACIîN DE 
-DESECHOS
-!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-382100
-TRATAMIENTO Y ELIMINACIîN DE DESECHOS NO PELIGROSOS
-SI
-1
-SI
-382200
-TRATAMIENTO Y ELIMINACIîN DE DESECHOS PELIGROSOS
-SI
-1
-SI
-CŠdigo
-RECUPERACIîN DE 
-MATERIALES
-!!!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-383001
-RECUPERACIîN Y RECICLAMIENTO DE DESPERDICIOS Y DESECHOS 
-METçLICOS
-SI
-1
-SI
-383002
-RECUPERACIîN Y RECICLAMIENTO DE PAPEL
-SI
-1
-SI
-383003
-RECUPERACIîN Y RECICLAMIENTO DE VIDRIO
-SI
-1
-SI
-383009
-RECUPERACIîN Y RECICLAMIENTO DE OTROS DESPERDICIOS Y DESECHOS N.C.P.
-SI
-1
-SI
-CŠdigo
-ACTIVIDADES DE DESCONTAMINACIîN Y OTROS SERVICIOS DE 
-GESTIîN DE 
-DESECHOS
-!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-390000
-ACTIVIDADES DE DESCONTAMINACIîN Y OTROS SERVICIOS DE GESTIîN 
-DE DESECHOS
-SI
-1
-SI
-CONSTRUCCIîN
-CŠdigo
-CONSTRUCCIîN DE 
-EDIFICIOS
-!!!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-410010
-CONSTRUCCIîN DE EDIFICIOS PARA USO RESIDENCIAL
-SI
-1
-SI
-410020
-CONSTRUCCIîN DE EDIFICIOS PARA USO NO RESIDENCIAL
-SI
-1
-SI
-CŠdigo
-CONSTRUCCIîN DE CARRETERAS Y LêNEAS DE 
-FERROCARRIL
-!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-421000
-CONSTRUCCIîN DE CARRETERAS Y LêNEAS DE FERROCARRIL
-SI
-1
-SI
-CŠdigo
-CONSTRUCCIîN DE PROYECTOS DE SERVICIO 
-PòBLICO
-!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-422000
-CONSTRUCCIîN DE PROYECTOS DE SERVICIO PòBLICO
-SI
-1
-SI
-CŠdigo
-CONSTRUCCIîN DE OTRAS OBRAS DE INGENIERêA 
-CIVIL
-!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-429000
-CONSTRUCCIîN DE OTRAS OBRAS DE INGENIERêA CIVIL
-SI
-1
-SI
-CŠdigo
-DEMOLICIîN Y PREPARACIîN DEL 
-TERRENO
-!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-431100
-DEMOLICIîN
-SI
-1
-SI
-431200
-PREPARACIîN DEL TERRENO
-SI
-1
-SI
-CŠdigo
-INSTALACIONES EL…CTRICAS, DE GASFITERêA Y OTRAS INSTALACIONES 
-PARA OBRAS DE CONSTRUCCIîN
-!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-432100
-INSTALACIONES EL…CTRICAS
-SI
-1
-SI
-432200
-INSTALACIONES DE GASFITERêA, CALEFACCIîN Y AIRE ACONDICIONADO
-SI
-1
-SI
-432900
-OTRAS INSTALACIONES PARA OBRAS DE CONSTRUCCIîN
-SI
-1
-SI
-CŠdigo
-TERMINACIîN Y ACABADO DE 
-EDIFICIOS
-!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-433000
-TERMINACIîN Y ACABADO DE EDIFICIOS
-SI
-1
-SI
-CŠdigo
-OTRAS ACTIVIDADES ESPECIALIZADAS DE 
-CONSTRUCCIîN
-!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-439000
-OTRAS ACTIVIDADES ESPECIALIZADAS DE CONSTRUCCIîN
-SI
-1
-SI
-COMERCIO AL POR MAYOR Y AL POR MENOR; 
-REPARACIîN DE VEHICULOS AUTOMOTORES Y MOTOCICLETAS
-CŠdigo
-VENTA DE VEHêCULOS 
-AUTOMOTORES
-!!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-451001
-VENTA AL POR MAYOR DE VEHêCULOS AUTOMOTORES
-SI
-1
-SI
-451002
-VENTA AL POR MENOR DE VEHêCULOS AUTOMOTORES NUEVOS O USADOS (INCLUYE 
-COMPRAVENTA)
-SI
-1
-SI
-CŠdigo
-MANTENIMIENTO Y REPARACIîN DE VEHêCULOS 
-AUTOMOTORES
-!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-452001
-SERVICIO DE LAVADO DE VEHêCULOS AUTOMOTORES
-SI
-1
-SI
-452002
-MANTENIMIENTO Y REPARACIîN DE VEHêCULOS AUTOMOTORES
-SI
-1
-SI
-CŠdigo
-VENTA DE PARTES, PIEZAS Y ACCESORIOS PARA VEHêCULOS 
-AUTOMOTORES
-!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-453000
-VENTA DE PARTES, PIEZAS Y ACCESORIOS PARA VEHêCULOS AUTOMOTORES
-SI
-1
-SI
-CŠdigo
-VENTA, MANTENIMIENTO Y REPARACIîN DE MOTOCICLETAS Y SUS PARTES, 
-PIEZAS Y 
-ACCESORIOS
-!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-454001
-VENTA DE MOTOCICLETAS
-SI
-1
-SI
-454002
-VENTA DE PARTES, PIEZAS Y ACCESORIOS DE MOTOCICLETAS
-SI
-1
-SI
-454003
-MANTENIMIENTO Y REPARACIîN DE MOTOCICLETAS
-SI
-1
-SI
-CŠdigo
-VENTA AL POR MAYOR A CAMBIO DE UNA RETRIBUCIîN O POR 
-CONTRATA
-!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-461001
-CORRETAJE AL POR MAYOR DE PRODUCTOS AGRêCOLAS
-SI
-1
-SI
-461002
-CORRETAJE AL POR MAYOR DE GANADO
-SI
-1
-SI
-461009
-OTROS TIPOS DE CORRETAJES O REMATES AL POR MAYOR N.C.P.
-SI
-1
-SI
-CŠdigo
-VENTA AL POR MAYOR DE MATERIAS PRIMAS AGROPECUARIAS Y ANIMALES 
-VIVOS
-!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-462010
-VENTA AL POR MAYOR DE MATERIAS PRIMAS AGRêCOLAS
-SI
-1
-SI
-462020
-VENTA AL POR MAYOR DE ANIMALES VIVOS
-SI
-1
-SI
-462090
-VENTA AL POR MAYOR DE OTRAS MATERIAS PRIMAS AGROPECUARIAS N.C.P.
-SI
-1
-SI
-CŠdigo
-VENTA AL POR MAYOR DE ALIMENTOS, BEBIDAS Y 
-TABACO
-!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-463011
-VENTA AL POR MAYOR DE FRUTAS Y VERDURAS
-SI
-1
-SI
-463012
-VENTA AL POR MAYOR DE CARNE Y PRODUCTOS CçRNICOS
-SI
-1
-SI
-463013
-VENTA AL POR MAYOR DE PRODUCTOS DEL MAR (PESCADOS, MARISCOS Y ALGAS)
-SI
-1
-SI
-463014
-VENTA AL POR MAYOR DE PRODUCTOS DE CONFITERêA
-SI
-1
-SI
-463019
-VENTA AL POR MAYOR DE HUEVOS, LçCTEOS, ABARROTES Y DE OTROS ALIMENTOS 
-N.C.P.
-SI
-1
-SI
-463020
-VENTA AL POR MAYOR DE BEBIDAS ALCOHîLICAS Y NO ALCOHîLICAS
-SI
-1
-SI
-463030
-VENTA AL POR MAYOR DE TABACO
-SI
-1
-SI
-CŠdigo
-VENTA AL POR MAYOR DE ENSERES 
-DOM…STICOS
-!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-464100
-VENTA AL POR MAYOR DE PRODUCTOS TEXTILES, PRENDAS DE VESTIR Y CALZADO
-SI
-1
-SI
-464901
-VENTA AL POR MAYOR DE MUEBLES, EXCEPTO MUEBLES DE OFICINA
-SI
-1
-SI
-464902
-VENTA AL POR MAYOR DE ARTêCULOS EL…CTRICOS Y 
-ELECTRîNICOS PARA EL HOGAR
-SI
-1
-SI
-464903
-VENTA AL POR MAYOR DE ARTêCULOS DE PERFUMERêA, DE TOCADOR Y 
-COSM…TICOS
-SI
-1
-SI
-464904
-VENTA AL POR MAYOR DE ARTêCULOS DE PAPELERêA Y ESCRITORIO
-SI
-1
-SI
-464905
-VENTA AL POR MAYOR DE LIBROS
-SI
-1
-SI
-464906
-VENTA AL POR MAYOR DE DIARIOS Y REVISTAS
-SI
-1
-SI
-464907
-VENTA AL POR MAYOR DE PRODUCTOS FARMAC…UTICOS Y MEDICINALES
-!
-SI
-1
-SI
-464908
-VENTA AL POR MAYOR DE INSTRUMENTOS CIENTêFICOS Y QUIRòRGICOS
-SI
-1
-SI
-464909
-VENTA AL POR MAYOR DE OTROS ENSERES DOM…STICOS N.C.P.
-SI
-1
-SI
-CŠdigo
-VENTA AL POR MAYOR DE MAQUINARIA, EQUIPO Y 
-MATERIALES
-!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-465100
-VENTA AL POR MAYOR DE COMPUTADORES, EQUIPO PERIF…RICO Y PROGRAMAS 
-INFORMçTICOS
-SI
-1
-SI
-465200
-VENTA AL POR MAYOR DE EQUIPO, PARTES Y PIEZAS ELECTRîNICOS Y DE 
-TELECOMUNICACIONES
-SI
-1
-SI
-465300
-VENTA AL POR MAYOR DE MAQUINARIA, EQUIPO Y MATERIALES AGROPECUARIOS
-SI
-1
-SI
-465901
-VENTA AL POR MAYOR DE MAQUINARIA METALòRGICA, PARA LA MINERêA, 
-EXTRACCIîN DE PETRîLEO Y
-CONSTRUCCIîN
-SI
-1
-SI
-465902
-VENTA AL POR MAYOR DE MAQUINARIA PARA LA ELABORACIîN DE ALIMENTOS, 
-BEBIDAS Y TABACO
-SI
-1
-SI
-465903
-VENTA AL POR MAYOR DE MAQUINARIA PARA LA INDUSTRIA TEXTIL, DEL CUERO Y DEL 
-CALZADO
-SI
-1
-SI
-465904
-VENTA AL POR MAYOR DE MAQUINARIA Y EQUIPO DE OFICINA; VENTA AL POR MAYOR DE 
-MUEBLES DE
-OFICINA
-SI
-1
-SI
-465905
-VENTA AL POR MAYOR DE EQUIPO DE TRANSPORTE(EXCEPTO VEHêCULOS 
-AUTOMOTORES,
-MOTOCICLETAS Y BICICLETAS)
-SI
-1
-SI
-465909
-VENTA AL POR MAYOR DE OTROS TIPOS DE MAQUINARIA Y EQUIPO N.C.P.
-SI
-1
-SI
-CŠdigo
-OTRAS ACTIVIDADES DE VENTA AL POR MAYOR 
-ESPECIALIZADA
-!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-466100
-VENTA AL POR MAYOR DE COMBUSTIBLES SîLIDOS, LêQUIDOS Y 
-GASEOSOS Y PRODUCTOS CONEXOS
-SI
-1
-SI
-466200
-VENTA AL POR MAYOR DE METALES Y MINERALES METALêFEROS
-SI
-1
-SI
-466301
-VENTA AL POR MAYOR DE MADERA EN BRUTO Y PRODUCTOS PRIMARIOS DE LA 
-ELABORACIîN DE
-MADERA
-SI
-1
-SI
-466302
-VENTA AL POR MAYOR DE MATERIALES DE CONSTRUCCIîN, ARTêCULOS DE 
-FERRETERêA, GASFITERêA Y
-CALEFACCIîN
-SI
-1
-SI
-466901
-VENTA AL POR MAYOR DE PRODUCTOS QUêMICOS
-SI
-1
-SI
-466902
-VENTA AL POR MAYOR DE DESECHOS METçLICOS (CHATARRA)
-SI
-1
-SI
-466909
-VENTA AL POR MAYOR DE DESPERDICIOS, DESECHOS Y OTROS PRODUCTOS N.C.P.
-SI
-1
-NO
-CŠdigo
-VENTA AL POR MAYOR NO 
-ESPECIALIZADA
-!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-469000
-VENTA AL POR MAYOR NO ESPECIALIZADA
-SI
-1
-NO
-CŠdigo
-VENTA AL POR MENOR EN COMERCIOS NO 
-ESPECIALIZADOS
-!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-471100
-VENTA AL POR MENOR EN COMERCIOS DE ALIMENTOS, BEBIDAS O TABACO 
-(SUPERMERCADOS E
-HIPERMERCADOS)
-SI
-1
-SI
-471910
-VENTA AL POR MENOR EN COMERCIOS DE VESTUARIO Y PRODUCTOS PARA EL HOGAR 
-(GRANDES
-TIENDAS)
-SI
-1
-SI
-471990
-OTRAS ACTIVIDADES DE VENTA AL POR MENOR EN COMERCIOS NO ESPECIALIZADOS 
-N.C.P.
-SI
-1
-SI
-CŠdigo
-VENTA AL POR MENOR DE ALIMENTOS, BEBIDAS Y TABACO EN COMERCIOS 
-ESPECIALIZADOS
-!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-472101
-VENTA AL POR MENOR DE ALIMENTOS EN COMERCIOS ESPECIALIZADOS (ALMACENES 
-PEQUE—OS Y
-MINIMARKET)
-SI
-1
-SI
-472102
-VENTA AL POR MENOR EN COMERCIOS ESPECIALIZADOS DE CARNE Y PRODUCTOS 
-CçRNICOS
-!
-SI
-1
-SI
-472103
-VENTA AL POR MENOR EN COMERCIOS ESPECIALIZADOS DE FRUTAS Y VERDURAS 
-(VERDULERêAS)
-SI
-1
-SI
-472104
-VENTA AL POR MENOR EN COMERCIOS ESPECIALIZADOS DE PESCADO, MARISCOS Y 
-PRODUCTOS
-CONEXOS
-SI
-1
-SI
-472105
-VENTA AL POR MENOR EN COMERCIOS ESPECIALIZADOS DE PRODUCTOS DE 
-PANADERêA Y PASTELERêA
-SI
-1
-SI
-472109
-VENTA AL POR MENOR EN COMERCIOS ESPECIALIZADOS DE HUEVOS, CONFITES Y 
-PRODUCTOS
-ALIMENTICIOS N.C.P.
-SI
-1
-SI
-472200
-VENTA AL POR MENOR DE BEBIDAS ALCOHîLICAS Y NO ALCOHîLICAS EN 
-COMERCIOS ESPECIALIZADOS
-(BOTILLERêAS)
-SI
-1
-SI
-472300
-VENTA AL POR MENOR DE TABACO Y PRODUCTOS DE TABACO EN COMERCIOS 
-ESPECIALIZADOS
-SI
-1
-SI
-CŠdigo
-VENTA AL POR MENOR DE COMBUSTIBLES PARA VEHêCULOS AUTOMOTORES EN 
-COMERCIOS
-ESPECIALIZADOS
-!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-473000
-VENTA AL POR MENOR DE COMBUSTIBLES PARA VEHêCULOS AUTOMOTORES EN 
-COMERCIOS
-ESPECIALIZADOS
-SI
-1
-SI
-474100
-VENTA AL POR MENOR DE COMPUTADORES, EQUIPO PERIF…RICO, PROGRAMAS 
-INFORMçTICOS Y EQUIPO
-DE TELECOM.
-SI
-1
-SI
-474200
-VENTA AL POR MENOR DE EQUIPO DE SONIDO Y DE VIDEO EN COMERCIOS 
-ESPECIALIZADOS
-SI
-1
-SI
-CŠdigo
-VENTA AL POR MENOR DE OTROS ENSERES DOM…STICOS EN COMERCIOS 
-ESPECIALIZADOS
-!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-475100
-VENTA AL POR MENOR DE TELAS, LANAS, HILOS Y SIMILARES EN COMERCIOS 
-ESPECIALIZADOS
-SI
-1
-SI
-475201
-VENTA AL POR MENOR DE ARTêCULOS DE FERRETERêA Y MATERIALES DE 
-CONSTRUCCIîN
-!
-SI
-1
-SI
-475202
-VENTA AL POR MENOR DE PINTURAS, BARNICES Y LACAS EN COMERCIOS ESPECIALIZADOS
-SI
-1
-SI
-475203
-VENTA AL POR MENOR DE PRODUCTOS DE VIDRIO EN COMERCIOS ESPECIALIZADOS
-SI
-1
-SI
-475300
-VENTA AL POR MENOR DE TAPICES, ALFOMBRAS Y CUBRIMIENTOS PARA PAREDES Y PISOS
-SI
-1
-SI
-475901
-VENTA AL POR MENOR DE MUEBLES Y COLCHONES EN COMERCIOS ESPECIALIZADOS
-SI
-1
-SI
-475902
-VENTA AL POR MENOR DE INSTRUMENTOS MUSICALES EN COMERCIOS ESPECIALIZADOS
-SI
-1
-SI
-475909
-VENTA AL POR MENOR DE APARATOS EL…CTRICOS, TEXTILES PARA EL HOGAR Y 
-OTROS ENSERES
-DOM…STICOS N.C.P.
-SI
-1
-SI
-CŠdigo
-VENTA AL POR MENOR DE PRODUCTOS CULTURALES Y RECREATIVOS EN COMERCIOS
-ESPECIALIZADOS
-!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-476101
-VENTA AL POR MENOR DE LIBROS EN COMERCIOS ESPECIALIZADOS
-SI
-1
-SI
-476102
-VENTA AL POR MENOR DE DIARIOS Y REVISTAS EN COMERCIOS ESPECIALIZADOS
-SI
-1
-SI
-476103
-VENTA AL POR MENOR DE ARTêCULOS DE PAPELERêA Y ESCRITORIO EN 
-COMERCIOS ESPECIALIZADOS
-SI
-1
-SI
-476200
-VENTA AL POR MENOR DE GRABACIONES DE MòSICA Y DE VIDEO EN COMERCIOS 
-ESPECIALIZADOS
-SI
-1
-SI
-476301
-VENTA AL POR MENOR DE ARTêCULOS DE CAZA Y PESCA EN COMERCIOS 
-ESPECIALIZADOS
-SI
-1
-SI
-476302
-VENTA AL POR MENOR DE BICICLETAS Y SUS REPUESTOS EN COMERCIOS ESPECIALIZADOS
-SI
-1
-SI
-476309
-VENTA AL POR MENOR DE OTROS ARTêCULOS Y EQUIPOS DE DEPORTE N.C.P.
-SI
-1
-SI
-476400
-VENTA AL POR MENOR DE JUEGOS Y JUGUETES EN COMERCIOS ESPECIALIZADOS
-SI
-1
-SI
-CŠdigo
-VENTA AL POR MENOR DE OTROS PRODUCTOS EN COMERCIOS 
-ESPECIALIZADOS
-!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-477101
-VENTA AL POR MENOR DE CALZADO EN COMERCIOS ESPECIALIZADOS
-SI
-1
-SI
-477102
-VENTA AL POR MENOR DE PRENDAS Y ACCESORIOS DE VESTIR EN COMERCIOS 
-ESPECIALIZADOS
-SI
-1
-SI
-477103
-VENTA AL POR MENOR DE CARTERAS, MALETAS Y OTROS ACCESORIOS DE VIAJE EN 
-COMERCIOS
-ESPECIALIZADOS
-SI
-1
-SI
-477201
-VENTA AL POR MENOR DE PRODUCTOS FARMAC…UTICOS Y MEDICINALES EN 
-COMERCIOS
-ESPECIALIZADOS
-SI
-1
-SI
-477202
-VENTA AL POR MENOR DE ARTêCULOS ORTOP…DICOS EN COMERCIOS 
-ESPECIALIZADOS
-SI
-1
-SI
-477203
-VENTA AL POR MENOR DE ARTêCULOS DE PERFUMERêA, DE TOCADOR Y 
-COSM…TICOS EN COMERCIOS
-ESPECIALIZADOS
-SI
-1
-SI
-477310
-VENTA AL POR MENOR DE GAS LICUADO EN BOMBONAS (CILINDROS) EN COMERCIOS 
-ESPECIALIZADOS
-SI
-1
-SI
-477391
-VENTA AL POR MENOR DE ALIMENTO Y ACCESORIOS PARA MASCOTAS EN COMERCIOS 
-ESPECIALIZADOS
-SI
-1
-SI
-477392
-VENTA AL POR MENOR DE ARMAS Y MUNICIONES EN COMERCIOS ESPECIALIZADOS
-SI
-1
-SI
-477393
-VENTA AL POR MENOR DE ARTêCULOS îPTICOS EN COMERCIOS 
-ESPECIALIZADOS
-SI
-1
-SI
-477394
-VENTA AL POR MENOR DE ARTêCULOS DE JOYERêA, BISUTERêA Y 
-RELOJERêA EN COMERCIOS
-ESPECIALIZADOS
-SI
-1
-SI
-477395
-VENTA AL POR MENOR DE CARBîN, LE—A Y OTROS COMBUSTIBLES DE USO 
-DOM…STICO EN COMERCIOS
-ESPECIALIZADOS
-SI
-1
-SI
-477396
-VENTA AL POR MENOR DE RECUERDOS, ARTESANêAS Y ARTêCULOS 
-RELIGIOSOS EN COMERCIOS
-ESPECIALIZADOS
-SI
-1
-SI
-477397
-VENTA AL POR MENOR DE FLORES, PLANTAS, ARBOLES, SEMILLAS Y ABONOS EN 
-COMERCIOS
-ESPECIALIZADOS
-SI
-1
-SI
-477398
-VENTA AL POR MENOR DE MASCOTAS EN COMERCIOS ESPECIALIZADOS
-SI
-1
-SI
-477399
-VENTA AL POR MENOR DE OTROS PRODUCTOS EN COMERCIOS ESPECIALIZADOS N.C.P.
-SI
-1
-SI
-477401
-VENTA AL POR MENOR DE ANTIGƒEDADES EN COMERCIOS
-SI
-1
-SI
-477402
-VENTA AL POR MENOR DE ROPA USADA EN COMERCIOS
-SI
-1
-SI
-477409
-VENTA AL POR MENOR DE OTROS ARTêCULOS DE SEGUNDA MANO EN COMERCIOS 
-N.C.P.
-SI
-1
-SI
-CŠdigo
-VENTA AL POR MENOR EN PUESTOS DE VENTA Y 
-MERCADOS
-!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-478100
-VENTA AL POR MENOR DE ALIMENTOS, BEBIDAS Y TABACO EN PUESTOS DE VENTA Y 
-MERCADOS (INCLUYE
-FERIAS)
-SI
-1
-SI
-478200
-VENTA AL POR MENOR DE PRODUCTOS TEXTILES, PRENDAS DE VESTIR Y CALZADO EN 
-PUESTOS DE VENTA
-Y MERCADOS
-SI
-1
-SI
-478900
-VENTA AL POR MENOR DE OTROS PRODUCTOS EN PUESTOS DE VENTA Y MERCADOS 
-(INCLUYE FERIAS)
-SI
-1
-SI
-CŠdigo
-VENTA AL POR MENOR NO REALIZADA EN COMERCIOS, PUESTOS DE VENTA O 
-MERCADOS
-!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-479100
-VENTA AL POR MENOR POR CORREO, POR INTERNET Y VêA TELEFîNICA
-SI
-1
-SI
-479901
-VENTA AL POR MENOR REALIZADA POR INDEPENDIENTES EN LA LOCOMOCIîN 
-COLECTIVA (LEY 20.388)
-SI
-1
-SI
-479902
-VENTA AL POR MENOR MEDIANTE MAQUINAS EXPENDEDORAS
-SI
-1
-SI
-479903
-VENTA AL POR MENOR POR COMISIONISTAS (NO DEPENDIENTES DE COMERCIOS)
-SI
-1
-SI
-479909
-OTRAS ACTIVIDADES DE VENTA POR MENOR NO REALIZADAS EN COMERCIOS, PUESTOS DE 
-VENTA O
-MERCADOS N.C.P.
-SI
-1
-SI
-TRANSPORTE Y ALMACENAMIENTO
-CŠdigo
-TRANSPORTE POR 
-FERROCARRIL
-!!!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-491100
-TRANSPORTE INTERURBANO DE PASAJEROS POR FERROCARRIL
-NO
-1
-SI
-491200
-TRANSPORTE DE CARGA POR FERROCARRIL
-SI
-1
-SI
-CŠdigo
-OTRAS ACTIVIDADES DE TRANSPORTE POR VêA 
-TERRESTRE
-!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-492110
-TRANSPORTE URBANO Y SUBURBANO DE PASAJEROS VêA METRO Y METROTREN
-NO
-1
-SI
-492120
-TRANSPORTE URBANO Y SUBURBANO DE PASAJEROS VêA LOCOMOCIîN 
-COLECTIVA
-NO
-1
-SI
-492130
-TRANSPORTE DE PASAJEROS VêA TAXI COLECTIVO
-NO
-1
-SI
-492190
-OTRAS ACTIVIDADES DE TRANSPORTE URBANO Y SUBURBANO DE PASAJEROS POR 
-VêA TERRESTRE N.C.P.
-NO
-1
-SI
-492210
-SERVICIOS DE TRANSPORTE DE ESCOLARES
-NO
-1
-SI
-492220
-SERVICIOS DE TRANSPORTE DE TRABAJADORES
-NO
-1
-SI
-492230
-SERVICIOS DE TRANSPORTE DE PASAJEROS EN TAXIS LIBRES Y RADIOTAXIS
-NO
-1
-SI
-492240
-SERVICIOS DE TRANSPORTE A TURISTAS
-NO
-1
-SI
-492250
-TRANSPORTE DE PASAJEROS EN BUSES INTERURBANOS
-!
-NO
-1
-SI
-492290
-OTRAS ACTIVIDADES DE TRANSPORTE DE PASAJEROS POR VêA TERRESTRE N.C.P.
-NO
-1
-SI
-492300
-TRANSPORTE DE CARGA POR CARRETERA
-SI
-1
-SI
-CŠdigo
-TRANSPORTE POR 
-TUBERêAS
-!!!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-493010
-TRANSPORTE POR OLEODUCTOS
-SI
-1
-SI
-493020
-TRANSPORTE POR GASODUCTOS
-SI
-1
-SI
-493090
-OTRAS ACTIVIDADES DE TRANSPORTE POR TUBERêAS N.C.P.
-SI
-1
-SI
-CŠdigo
-TRANSPORTE MARêTIMO Y DE 
-CABOTAJE
-!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-501100
-TRANSPORTE DE PASAJEROS MARêTIMO Y DE CABOTAJE
-NO
-1
-SI
-501200
-TRANSPORTE DE CARGA MARêTIMO Y DE CABOTAJE
-SI
-1
-SI
-CŠdigo
-TRANSPORTE POR VêAS DE NAVEGACIîN 
-INTERIORES
-!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-502100
-TRANSPORTE DE PASAJEROS POR VêAS DE NAVEGACIîN INTERIORES
-NO
-1
-SI
-502200
-TRANSPORTE DE CARGA POR VêAS DE NAVEGACIîN INTERIORES
-SI
-1
-SI
-CŠdigo
-TRANSPORTE DE PASAJEROS POR VêA 
-A…REA
-!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-511000
-TRANSPORTE DE PASAJEROS POR VêA A…REA
-NO
-1
-SI
-CŠdigo
-TRANSPORTE DE CARGA POR VêA 
-A…REA
-!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-512000
-TRANSPORTE DE CARGA POR VêA A…REA
-SI
-1
-SI
-CŠdigo
-ALMACENAMIENTO Y 
-DEPîSITO
-!!!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-521001
-EXPLOTACIîN DE FRIGORêFICOS PARA ALMACENAMIENTO Y 
-DEPîSITO
-SI
-1
-SI
-521009
-OTROS SERVICIOS DE ALMACENAMIENTO Y DEPîSITO N.C.P.
-SI
-1
-SI
-CŠdigo
-ACTIVIDADES DE APOYO AL 
-TRANSPORTE
-!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-522110
-EXPLOTACIîN DE TERMINALES TERRESTRES DE PASAJEROS
-SI
-1
-SI
-522120
-EXPLOTACIîN DE ESTACIONAMIENTOS DE VEHêCULOS AUTOMOTORES Y 
-PARQUêMETROS
-SI
-1
-SI
-522130
-SERVICIOS PRESTADOS POR CONCESIONARIOS DE CARRETERAS
-SI
-1
-SI
-522190
-ACTIVIDADES DE SERVICIOS VINCULADAS AL TRANSPORTE TERRESTRE N.C.P.
-SI
-1
-SI
-522200
-ACTIVIDADES DE SERVICIOS VINCULADAS AL TRANSPORTE ACUçTICO
-SI
-1
-SI
-522300
-ACTIVIDADES DE SERVICIOS VINCULADAS AL TRANSPORTE A…REO
-SI
-1
-SI
-522400
-MANIPULACIîN DE LA CARGA
-SI
-1
-SI
-522910
-AGENCIAS DE ADUANAS
-SI
-1
-SI
-522920
-AGENCIAS DE NAVES
-SI
-1
-SI
-522990
-OTRAS ACTIVIDADES DE APOYO AL TRANSPORTE N.C.P.
-SI
-1
-SI
-CŠdigo
-ACTIVIDADES 
-POSTALES
-!!!!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-531000
-ACTIVIDADES POSTALES
-SI
-1
-SI
-CŠdigo
-ACTIVIDADES DE 
-MENSAJERêA
-!!!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-532000
-ACTIVIDADES DE MENSAJERêA
-SI
-1
-SI
-ACTIVIDADES DE ALOJAMIENTO Y DE SERVICIO DE 
-COMIDAS
-CŠdigo
-ACTIVIDADES DE ALOJAMIENTO PARA ESTANCIAS 
-CORTAS
-!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-551001
-ACTIVIDADES DE HOTELES
-SI
-1
-SI
-551002
-ACTIVIDADES DE MOTELES
-SI
-1
-SI
-551003
-ACTIVIDADES DE RESIDENCIALES PARA TURISTAS
-SI
-1
-SI
-551009
-OTRAS ACTIVIDADES DE ALOJAMIENTO PARA TURISTAS N.C.P.
-SI
-1
-SI
-CŠdigo
-ACTIVIDADES DE CAMPAMENTOS, PARQUES DE VEHêCULOS DE RECREO Y PARQUES 
-DE CARAVANAS
-!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-552000
-ACTIVIDADES DE CAMPING Y DE PARQUES PARA CASAS RODANTES
-SI
-1
-SI
-CŠdigo
-OTRAS ACTIVIDADES DE 
-ALOJAMIENTO
-!!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-559001
-ACTIVIDADES DE RESIDENCIALES PARA ESTUDIANTES Y TRABAJADORES
-!
-SI
-1
-SI
-559009
-OTRAS ACTIVIDADES DE ALOJAMIENTO N.C.P.
-SI
-1
-SI
-CŠdigo
-ACTIVIDADES DE RESTAURANTES Y DE SERVICIO MîVIL DE 
-COMIDAS
-!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-561000
-ACTIVIDADES DE RESTAURANTES Y DE SERVICIO MîVIL DE COMIDAS
-SI
-1
-SI
-CŠdigo
-SUMINISTRO DE COMIDAS POR ENCARGO Y OTRAS ACTIVIDADES DE SERVICIO DE 
-COMIDAS
-!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-562100
-SUMINISTRO DE COMIDAS POR ENCARGO (SERVICIOS DE BANQUETERêA)
-SI
-1
-SI
-562900
-SUMINISTRO INDUSTRIAL DE COMIDAS POR ENCARGO; CONCESIîN DE SERVICIOS 
-DE ALIMENTACIîN
-!
-SI
-1
-SI
-CŠdigo
-ACTIVIDADES DE SERVICIO DE 
-BEBIDAS
-!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-563001
-ACTIVIDADES DE DISCOTECAS Y CABARET (NIGHT CLUB), CON PREDOMINIO DEL 
-SERVICIO DE BEBIDAS
-SI
-1
-SI
-563009
-OTRAS ACTIVIDADES DE SERVICIO DE BEBIDAS N.C.P.
-SI
-1
-SI
-INFORMACIîN Y COMUNICACIONES
-CŠdigo
-EDICIîN DE LIBROS Y PUBLICACIONES PERIîDICAS Y OTRAS 
-ACTIVIDADES DE 
-EDICIîN
-!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-581100
-EDICIîN DE LIBROS
-SI
-1
-SI
-581200
-EDICIîN DE DIRECTORIOS Y LISTAS DE CORREO
-SI
-1
-SI
-581300
-EDICIîN DE DIARIOS, REVISTAS Y OTRAS PUBLICACIONES PERIîDICAS
-SI
-1
-SI
-581900
-OTRAS ACTIVIDADES DE EDICIîN
-SI
-1
-SI
-CŠdigo
-EDICIîN DE PROGRAMAS 
-INFORMçTICOS
-!!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-582000
-EDICIîN DE PROGRAMAS INFORMçTICOS
-SI
-1
-SI
-CŠdigo
-ACTIVIDADES DE PRODUCCIîN DE PELêCULAS 
-CINEMATOGRçFICAS, VIDEOS Y PROGRAMAS DE
-TELEVISIîN
-!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-591100
-ACTIVIDADES DE PRODUCCIîN DE PELêCULAS 
-CINEMATOGRçFICAS, VIDEOS Y PROGRAMAS DE
-TELEVISIîN
-SI
-1
-SI
-591200
-ACTIVIDADES DE POSTPRODUCCIîN DE PELêCULAS 
-CINEMATOGRçFICAS, VIDEOS Y PROGRAMAS DE
-TELEVISIîN
-SI
-1
-SI
-591300
-ACTIVIDADES DE DISTRIBUCIîN DE PELêCULAS 
-CINEMATOGRçFICAS, VIDEOS Y PROGRAMAS DE
-TELEVISIîN
-SI
-1
-SI
-591400
-ACTIVIDADES DE EXHIBICIîN DE PELêCULAS CINEMATOGRçFICAS 
-Y CINTAS DE VIDEO
-SI
-1
-SI
-CŠdigo
-ACTIVIDADES DE GRABACIîN DE SONIDO Y EDICIîN DE 
-MòSICA
-!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-592000
-ACTIVIDADES DE GRABACIîN DE SONIDO Y EDICIîN DE MòSICA
-SI
-1
-SI
-CŠdigo
-TRANSMISIONES DE 
-RADIO
-!!!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-601000
-TRANSMISIONES DE RADIO
-NO
-1
-SI
-CŠdigo
-PROGRAMACIîN Y TRANSMISIONES DE 
-TELEVISIîN
-!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-602000
-PROGRAMACIîN Y TRANSMISIONES DE TELEVISIîN
-NO
-1
-SI
-CŠdigo
-ACTIVIDADES DE TELECOMUNICACIONES 
-ALçMBRICAS
-!!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-611010
-TELEFONêA FIJA
-SI
-1
-SI
-611020
-TELEFONêA LARGA DISTANCIA
-SI
-1
-SI
-611030
-TELEVISIîN DE PAGO POR CABLE
-SI
-1
-SI
-611090
-OTROS SERVICIOS DE TELECOMUNICACIONES ALçMBRICAS N.C.P.
-SI
-1
-SI
-CŠdigo
-ACTIVIDADES DE TELECOMUNICACIONES 
-INALçMBRICAS
-!!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-612010
-TELEFONêA MîVIL CELULAR
-SI
-1
-SI
-612020
-RADIOCOMUNICACIONES MîVILES
-SI
-1
-SI
-612030
-TELEVISIîN DE PAGO INALçMBRICA
-SI
-1
-SI
-612090
-OTROS SERVICIOS DE TELECOMUNICACIONES INALçMBRICAS N.C.P.
-SI
-1
-SI
-CŠdigo
-ACTIVIDADES DE TELECOMUNICACIONES POR 
-SAT…LITE
-!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-613010
-TELEFONêA MîVIL SATELITAL
-SI
-1
-SI
-613020
-TELEVISIîN DE PAGO SATELITAL
-SI
-1
-SI
-613090
-OTROS SERVICIOS DE TELECOMUNICACIONES POR SAT…LITE N.C.P.
-SI
-1
-SI
-CŠdigo
-OTRAS ACTIVIDADES DE 
-TELECOMUNICACIONES
-!!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-619010
-CENTROS DE LLAMADOS Y CENTROS DE ACCESO A INTERNET
-SI
-1
-SI
-619090
-OTRAS ACTIVIDADES DE TELECOMUNICACIONES N.C.P.
-SI
-1
-SI
-CŠdigo
-ACTIVIDADES DE PROGRAMACIîN INFORMçTICA, CONSULTORêA 
-INFORMçTICA Y ACTIVIDADES
-CONEXAS
-!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-620100
-ACTIVIDADES DE PROGRAMACIîN INFORMçTICA
-G
-G
-SI
-620200
-ACTIVIDADES DE CONSULTORêA DE INFORMçTICA Y DE GESTIîN 
-DE INSTALACIONES INFORMçTICAS
-SI
-1
-SI
-620900
-OTRAS ACTIVIDADES DE TECNOLOGêA DE LA INFORMACIîN Y DE 
-SERVICIOS INFORMçTICOS
-SI
-1
-SI
-CŠdigo
-PROCESAMIENTO DE DATOS, HOSPEDAJE Y ACTIVIDADES CONEXAS; PORTALES 
-WEB
-!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-631100
-PROCESAMIENTO DE DATOS, HOSPEDAJE Y ACTIVIDADES CONEXAS
-SI
-1
-SI
-631200
-PORTALES WEB
-SI
-1
-SI
-CŠdigo
-OTRAS ACTIVIDADES DE SERVICIOS DE 
-INFORMACIîN
-!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-639100
-ACTIVIDADES DE AGENCIAS DE NOTICIAS
-NO
-1
-SI
-639900
-OTRAS ACTIVIDADES DE SERVICIOS DE INFORMACIîN N.C.P.
-SI
-1
-SI
-ACTIVIDADES FINANCIERAS Y DE SEGUROS
-CŠdigo
-INTERMEDIACIîN 
-MONETARIA
-!!!!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-641100
-BANCA CENTRAL
-SI
-1
-NO
-641910
-ACTIVIDADES BANCARIAS
-SI
-1
-NO
-641990
-OTROS TIPOS DE INTERMEDIACIîN MONETARIA N.C.P.
-SI
-1
-SI
-CŠdigo
-ACTIVIDADES DE SOCIEDADES DE 
-CARTERA
-!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-642000
-ACTIVIDADES DE SOCIEDADES DE CARTERA
-SI
-1
-SI
-CŠdigo
-FONDOS Y SOCIEDADES DE INVERSIîN Y ENTIDADES FINANCIERAS 
-SIMILARES
-!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-643000
-FONDOS Y SOCIEDADES DE INVERSIîN Y ENTIDADES FINANCIERAS SIMILARES
-SI
-1
-SI
-CŠdigo
-OTRAS ACTIVIDADES DE SERVICIOS FINANCIEROS, EXCEPTO LAS DE SEGUROS Y FONDOS 
-DE
-PENSIONES
-!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-649100
-LEASING FINANCIERO
-SI
-1
-SI
-649201
-FINANCIERAS
-SI
-1
-SI
-649202
-ACTIVIDADES DE CR…DITO PRENDARIO
-SI
-1
-SI
-649203
-CAJAS DE COMPENSACIîN
-G
-1
-SI
-649209
-OTRAS ACTIVIDADES DE CONCESIîN DE CR…DITO N.C.P.
-SI
-1
-SI
-649900
-OTRAS ACTIVIDADES DE SERVICIOS FINANCIEROS, EXCEPTO LAS DE SEGUROS Y FONDOS 
-DE PENSIONES
-N.C.P.
-SI
-1
-SI
-CŠdigo
-SEGUROS
-!!!!!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-651100
-SEGUROS DE VIDA
-SI
-1
-NO
-651210
-SEGUROS GENERALES, EXCEPTO ACTIVIDADES DE ISAPRES
-SI
-1
-NO
-651220
-ACTIVIDADES DE ISAPRES
-SI
-1
-NO
-CŠdigo
-REASEGUROS
-!!!!!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-652000
-REASEGUROS
-SI
-1
-NO
-CŠdigo
-FONDOS DE 
-PENSIONES
-!!!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-653000
-FONDOS DE PENSIONES
-SI
-1
-NO
-CŠdigo
-ACTIVIDADES AUXILIARES DE SERVICIOS FINANCIEROS, EXCEPTO LAS DE SEGUROS Y 
-FONDOS DE
-PENSIONES
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-661100
-ADMINISTRACIîN DE MERCADOS FINANCIEROS
-SI
-1
-SI
-661201
-ACTIVIDADES DE SECURITIZADORAS
-SI
-1
-NO
-661202
-CORREDORES DE BOLSA
-SI
-1
-SI
-661203
-AGENTES DE VALORES
-SI
-1
-SI
-661204
-ACTIVIDADES DE CASAS DE CAMBIO Y OPERADORES DE DIVISA
-G
-1
-SI
-661209
-OTROS SERVICIOS DE CORRETAJE DE VALORES Y COMMODITIES N.C.P.
-SI
-1
-SI
-661901
-ACTIVIDADES DE CçMARAS DE COMPENSACIîN
-SI
-1
-SI
-661902
-ADMINISTRACIîN DE TARJETAS DE CR…DITO
-SI
-1
-SI
-661903
-EMPRESAS DE ASESORêA Y CONSULTORêA EN INVERSIîN 
-FINANCIERA; SOCIEDADES DE APOYO AL GIRO
-SI
-1
-SI
-661904
-ACTIVIDADES DE CLASIFICADORAS DE RIESGO
-SI
-1
-SI
-661909
-OTRAS ACTIVIDADES AUXILIARES DE LAS ACTIVIDADES DE SERVICIOS FINANCIEROS 
-N.C.P.
-SI
-1
-SI
-CŠdigo
-ACTIVIDADES AUXILIARES DE LAS ACTIVIDADES DE SEGUROS Y FONDOS DE 
-PENSIONES
-!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-662100
-EVALUACIîN DE RIESGOS Y DA—OS (INCLUYE ACTIVIDADES DE 
-LIQUIDADORES DE SEGUROS)
-G
-G
-SI
-662200
-ACTIVIDADES DE AGENTES Y CORREDORES DE SEGUROS
-SI
-1
-SI
-662900
-OTRAS ACTIVIDADES AUXILIARES DE LAS ACTIVIDADES DE SEGUROS Y FONDOS DE 
-PENSIONES
-G
-G
-SI
-CŠdigo
-ACTIVIDADES DE GESTIîN DE 
-FONDOS
-!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-663010
-ADMINISTRADORAS DE FONDOS DE PENSIONES (AFP)
-SI
-1
-NO
-663091
-ADMINISTRADORAS DE FONDOS DE INVERSIîN
-SI
-1
-SI
-663092
-ADMINISTRADORAS DE FONDOS MUTUOS
-SI
-1
-SI
-663093
-ADMINISTRADORAS DE FICES (FONDOS DE INVERSIîN DE CAPITAL EXTRANJERO)
-SI
-1
-SI
-663094
-ADMINISTRADORAS DE FONDOS PARA LA VIVIENDA
-SI
-1
-SI
-663099
-ADMINISTRADORAS DE FONDOS PARA OTROS FINES N.C.P.
-SI
-1
-SI
-ACTIVIDADES INMOBILIARIAS
-CŠdigo
-ACTIVIDADES INMOBILIARIAS REALIZADAS CON BIENES PROPIOS O 
-ARRENDADOS
-!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-681011
-ALQUILER DE BIENES INMUEBLES AMOBLADOS O CON EQUIPOS Y MAQUINARIAS
-SI
-1
-SI
-681012
-COMPRA, VENTA Y ALQUILER (EXCEPTO AMOBLADOS) DE INMUEBLES
-G
-1
-SI
-681020
-SERVICIOS IMPUTADOS DE ALQUILER DE VIVIENDAS
-G
-1
-SI
-CŠdigo
-ACTIVIDADES INMOBILIARIAS REALIZADAS A CAMBIO DE UNA 
-RETRIBUCIîN O POR 
-CONTRATA
-!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-682000
-ACTIVIDADES INMOBILIARIAS REALIZADAS A CAMBIO DE UNA RETRIBUCIîN O 
-POR CONTRATA
-G
-G
-SI
-ACTIVIDADES PROFESIONALES, CIENTIFICAS Y 
-T…CNICAS
-CŠdigo
-ACTIVIDADES 
-JURêDICAS
-!!!!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-691001
-SERVICIOS DE ASESORAMIENTO Y REPRESENTACIîN JURêDICA
-G
-G
-SI
-691002
-SERVICIO NOTARIAL
-NO
-2
-NO
-691003
-CONSERVADOR DE BIENES RAêCES
-NO
-2
-NO
-691004
-RECEPTORES JUDICIALES
-NO
-2
-SI
-691009
-SERVICIOS DE ARBITRAJE; SêNDICOS DE QUIEBRA Y PERITOS JUDICIALES; 
-OTRAS ACTIVIDADES JURêDICAS
-N.C.P.
-G
-G
-SI
-CŠdigo
-ACTIVIDADES DE CONTABILIDAD, TENEDURêA DE LIBROS Y 
-AUDITORêA; CONSULTORêA 
-FISCAL
-!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-692000
-ACTIVIDADES DE CONTABILIDAD, TENEDURêA DE LIBROS Y AUDITORêA; 
-CONSULTORêA FISCAL
-G
-G
-SI
-CŠdigo
-ACTIVIDADES DE OFICINAS 
-PRINCIPALES
-!!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-701000
-ACTIVIDADES DE OFICINAS PRINCIPALES
-G
-G
-SI
-CŠdigo
-ACTIVIDADES DE CONSULTORêA DE 
-GESTIîN
-!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-702000
-ACTIVIDADES DE CONSULTORêA DE GESTIîN
-G
-G
-SI
-CŠdigo
-ACTIVIDADES DE ARQUITECTURA E INGENIERêA Y ACTIVIDADES 
-CONEXAS DE CONSULTORêA
-T…CNICA
-!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-711001
-SERVICIOS DE ARQUITECTURA (DISE—O DE EDIFICIOS, DIBUJO DE PLANOS DE 
-CONSTRUCCIîN, ENTRE
-OTROS)
-G
-G
-SI
-711002
-EMPRESAS DE SERVICIOS DE INGENIERêA Y ACTIVIDADES CONEXAS DE 
-CONSULTORêA T…CNICA
-!
-SI
-1
-SI
-711003
-SERVICIOS PROFESIONALES DE INGENIERêA Y ACTIVIDADES CONEXAS DE 
-CONSULTORêA T…CNICA
-!
-G
-G
-SI
-CŠdigo
-ENSAYOS Y ANçLISIS 
-T…CNICOS
-!!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-712001
-ACTIVIDADES DE PLANTAS DE REVISIîN T…CNICA PARA 
-VEHêCULOS AUTOMOTORES
-SI
-1
-SI
-712009
-OTROS SERVICIOS DE ENSAYOS Y ANçLISIS T…CNICOS (EXCEPTO 
-ACTIVIDADES DE PLANTAS DE REVISIîN
-T…CNICA)
-SI
-1
-SI
-CŠdigo
-INVESTIGACIONES Y DESARROLLO EXPERIMENTAL EN EL CAMPO DE LAS CIENCIAS 
-NATURALES Y LA
-INGENIERêA
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-721000
-INVESTIGACIONES Y DESARROLLO EXPERIMENTAL EN EL CAMPO DE LAS CIENCIAS 
-NATURALES Y LA
-INGENIERêA
-SI
-1
-SI
-CŠdigo
-INVESTIGACIONES Y DESARROLLO EXPERIMENTAL EN EL CAMPO DE LAS CIENCIAS 
-SOCIALES Y LAS
-HUMANIDADES
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-722000
-INVESTIGACIONES Y DESARROLLO EXPERIMENTAL EN EL CAMPO DE LAS CIENCIAS 
-SOCIALES Y LAS
-HUMANIDADES
-SI
-1
-SI
-CŠdigo
-PUBLICIDAD
-!!!!!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-731001
-SERVICIOS DE PUBLICIDAD PRESTADOS POR EMPRESAS
-SI
-1
-SI
-731002
-SERVICIOS DE PUBLICIDAD PRESTADOS POR PROFESIONALES
-G
-G
-SI
-CŠdigo
-ESTUDIOS DE MERCADO Y ENCUESTAS DE OPINIîN 
-PòBLICA
-!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-732000
-ESTUDIOS DE MERCADO Y ENCUESTAS DE OPINIîN PòBLICA
-G
-G
-S
-CŠdigo
-ACTIVIDADES ESPECIALIZADAS DE 
-DISE—O
-!!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-741001
-ACTIVIDADES DE DISE—O DE VESTUARIO
-G
-G
-SI
-741002
-ACTIVIDADES DE DISE—O Y DECORACIîN DE INTERIORES
-G
-G
-SI
-741009
-OTRAS ACTIVIDADES ESPECIALIZADAS DE DISE—O N.C.P.
-G
-G
-SI
-CŠdigo
-ACTIVIDADES DE 
-FOTOGRAFêA
-!!!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-742001
-SERVICIOS DE REVELADO, IMPRESIîN Y AMPLIACIîN DE 
-FOTOGRAFêAS
-SI
-1
-SI
-742002
-SERVICIOS Y ACTIVIDADES DE FOTOGRAFêA
-!
-G
-G
-SI
-742003
-SERVICIOS PERSONALES DE FOTOGRAFêA
-!
-G
-G
-SI
-CŠdigo
-OTRAS ACTIVIDADES PROFESIONALES, CIENTêFICAS Y T…CNICAS 
-N.C.P.
-!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-749001
-ASESORêA Y GESTIîN EN LA COMPRA O VENTA DE PEQUE—AS Y 
-MEDIANAS EMPRESAS
-SI
-1
-SI
-749002
-SERVICIOS DE TRADUCCIîN E INTERPRETACIîN PRESTADOS POR 
-EMPRESAS
-NO
-1
-SI
-749003
-SERVICIOS PERSONALES DE TRADUCCIîN E INTERPRETACIîN
-G
-G
-SI
-749004
-ACTIVIDADES DE AGENCIAS Y AGENTES DE REPRESENTACIîN DE ACTORES, 
-DEPORTISTAS Y OTRAS
-SI
-1
-SI
-749004
-ACTIVIDADES DE AGENCIAS Y AGENTES DE REPRESENTACIîN DE ACTORES, 
-DEPORTISTAS Y OTRAS
-FIGURAS PòBLICAS
-SI
-1
-SI
-749009
-OTRAS ACTIVIDADES PROFESIONALES, CIENTêFICAS Y T…CNICAS N.C.P.
-G
-G
-SI
-CŠdigo
-ACTIVIDADES 
-VETERINARIAS
-!!!!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-750001
-ACTIVIDADES DE CLêNICAS VETERINARIAS
-SI
-1
-SI
-750002
-ACTIVIDADES DE VETERINARIOS, T…CNICOS Y OTRO PERSONAL AUXILIAR, 
-PRESTADOS DE FORMA
-INDEPENDIENTE
-NO
-2
-SI
-ACTIVIDADES DE SERVICIOS ADMINISTRATIVOS Y DE 
-APOYO
-CŠdigo
-ALQUILER Y ARRENDAMIENTO DE VEHêCULOS 
-AUTOMOTORES
-!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-771000
-ALQUILER DE VEHêCULOS AUTOMOTORES SIN CHOFER
-SI
-1
-S
-CŠdigo
-ALQUILER Y ARRENDAMIENTO DE EFECTOS PERSONALES Y ENSERES 
-DOM…STICOS
-!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-772100
-ALQUILER Y ARRENDAMIENTO DE EQUIPO RECREATIVO Y DEPORTIVO
-SI
-1
-SI
-772200
-ALQUILER DE CINTAS DE VIDEO Y DISCOS
-SI
-1
-SI
-772900
-ALQUILER DE OTROS EFECTOS PERSONALES Y ENSERES DOM…STICOS (INCLUYE 
-MOBILIARIO PARA
-EVENTOS)
-SI
-1
-SI
-CŠdigo
-ALQUILER Y ARRENDAMIENTO DE OTROS TIPOS DE MAQUINARIA, EQUIPO Y BIENES 
-TANGIBLES
-!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-773001
-ALQUILER DE EQUIPOS DE TRANSPORTE SIN OPERARIO, EXCEPTO VEHêCULOS 
-AUTOMOTORES
-SI
-1
-SI
-773002
-ALQUILER DE MAQUINARIA Y EQUIPO AGROPECUARIO, FORESTAL, DE 
-CONSTRUCCIîN E ING. CIVIL, SIN
-OPERARIOS
-SI
-1
-SI
-773003
-ALQUILER DE MAQUINARIA Y EQUIPO DE OFICINA, SIN OPERARIOS (SIN SERVICIO 
-ADMINISTRATIVO)
-SI
-1
-SI
-773009
-ALQUILER DE OTROS TIPOS DE MAQUINARIAS Y EQUIPOS SIN OPERARIO N.C.P.
-SI
-1
-SI
-CŠdigo
-ARRENDAMIENTO DE PROPIEDAD INTELECTUAL Y SIMILARES, EXCEPTO OBRAS PROTEGIDAS 
-POR
-DERECHOS DE AUTOR
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-774000
-ARRENDAMIENTO DE PROPIEDAD INTELECTUAL Y SIMILARES, EXCEPTO OBRAS PROTEGIDAS 
-POR
-DERECHOS DE AUTOR
-SI
-1
-SI
-CŠdigo
-ACTIVIDADES DE AGENCIAS DE 
-EMPLEO
-!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-781000
-ACTIVIDADES DE AGENCIAS DE EMPLEO
-SI
-1
-SI
-CŠdigo
-ACTIVIDADES DE AGENCIAS DE EMPLEO 
-TEMPORAL
-!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-782000
-ACTIVIDADES DE AGENCIAS DE EMPLEO TEMPORAL (INCLUYE EMPRESAS DE SERVICIOS 
-TRANSITORIOS)
-SI
-1
-SI
-CŠdigo
-OTRAS ACTIVIDADES DE DOTACIîN DE RECURSOS 
-HUMANOS
-!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-783000
-OTRAS ACTIVIDADES DE DOTACIîN DE RECURSOS HUMANOS
-SI
-1
-SI
-CŠdigo
-ACTIVIDADES DE AGENCIAS DE VIAJES Y OPERADORES 
-TURêSTICOS
-!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-791100
-ACTIVIDADES DE AGENCIAS DE VIAJES
-SI
-1
-SI
-791200
-ACTIVIDADES DE OPERADORES TURêSTICOS
-SI
-1
-SI
-CŠdigo
-OTROS SERVICIOS DE RESERVAS Y ACTIVIDADES 
-CONEXAS
-!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-799000
-OTROS SERVICIOS DE RESERVAS Y ACTIVIDADES CONEXAS (INCLUYE VENTA DE ENTRADAS 
-PARA TEATRO,
-Y OTROS)
-SI
-1
-SI
-CŠdigo
-ACTIVIDADES DE SEGURIDAD 
-PRIVADA
-!!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-801001
-SERVICIOS DE SEGURIDAD PRIVADA PRESTADOS POR EMPRESAS
-SI
-1
-SI
-801002
-SERVICIO DE TRANSPORTE DE VALORES EN VEHêCULOS BLINDADOS
-SI
-1
-SI
-801003
-SERVICIOS DE SEGURIDAD PRIVADA PRESTADOS POR INDEPENDIENTES
-NO
-2
-SI
-CŠdigo
-ACTIVIDADES DE SERVICIOS DE SISTEMAS DE 
-SEGURIDAD
-!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-802000
-ACTIVIDADES DE SERVICIOS DE SISTEMAS DE SEGURIDAD (INCLUYE SERVICIOS DE 
-CERRAJERêA)
-SI
-1
-SI
-CŠdigo
-ACTIVIDADES DE 
-INVESTIGACIîN
-!!!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-803000
-ACTIVIDADES DE INVESTIGACIîN (INCLUYE ACTIVIDADES DE INVESTIGADORES Y 
-DETECTIVES PRIVADOS)
-G
-G
-SI
-CŠdigo
-ACTIVIDADES COMBINADAS DE APOYO A 
-INSTALACIONES
-!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-811000
-ACTIVIDADES COMBINADAS DE APOYO A INSTALACIONES
-G
-G
-SI
-CŠdigo
-ACTIVIDADES DE 
-LIMPIEZA
-!!!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-812100
-LIMPIEZA GENERAL DE EDIFICIOS
-SI
-1
-SI
-812901
-DESRATIZACIîN, DESINFECCIîN Y EXTERMINIO DE PLAGAS NO 
-AGRêCOLAS
-SI
-1
-SI
-812909
-OTRAS ACTIVIDADES DE LIMPIEZA DE EDIFICIOS E INSTALACIONES INDUSTRIALES 
-N.C.P.
-SI
-1
-SI
-CŠdigo
-ACTIVIDADES DE PAISAJISMO Y SERVICIOS DE MANTENIMIENTO 
-CONEXOS
-!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-813000
-ACTIVIDADES DE PAISAJISMO, SERVICIOS DE JARDINERêA Y SERVICIOS 
-CONEXOS
-SI
-1
-SI
-CŠdigo
-ACTIVIDADES ADMINISTRATIVAS Y DE APOYO DE 
-OFICINA
-!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-821100
-ACTIVIDADES COMBINADAS DE SERVICIOS ADMINISTRATIVOS DE OFICINA
-SI
-1
-SI
-821900
-FOTOCOPIADO, PREPARACIîN DE DOCUMENTOS Y OTRAS ACTIVIDADES 
-ESPECIALIZADAS DE APOYO DE
-OFICINA
-SI
-1
-SI
-CŠdigo
-ACTIVIDADES DE 
-CALL-CENTER
-!!!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-822000
-ACTIVIDADES DE CALL-CENTER
-SI
-1
-SI
-CŠdigo
-ORGANIZACIîN DE CONVENCIONES Y EXPOSICIONES 
-COMERCIALES
-!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-823000
-ORGANIZACIîN DE CONVENCIONES Y EXPOSICIONES COMERCIALES
-SI
-1
-SI
-CŠdigo
-ACTIVIDADES DE SERVICIOS DE APOYO A LAS EMPRESAS 
-N.C.P.
-!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-829110
-ACTIVIDADES DE AGENCIAS DE COBRO
-SI
-1
-SI
-829120
-ACTIVIDADES DE AGENCIAS DE CALIFICACIîN CREDITICIA
-SI
-1
-SI
-829200
-ACTIVIDADES DE ENVASADO Y EMPAQUETADO
-SI
-1
-SI
-829900
-OTRAS ACTIVIDADES DE SERVICIOS DE APOYO A LAS EMPRESAS N.C.P.
-SI
-1
-SI
-ADMINISTRACIîN PòBLICA Y DEFENSA; 
-PLANES DE SEGURIDAD SOCIAL DE AFILIACIîN OBLIGATORIA
-CŠdigo
-ADMINISTRACIîN DEL ESTADO Y APLICACIîN DE LA POLêTICA 
-ECONîMICA Y SOCIAL DE LA
-COMUNIDAD
-!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-841100
-ACTIVIDADES DE LA ADMINISTRACIîN PòBLICA EN GENERAL
-SI
-1
-NO
-841200
-REGULACIîN DE LAS ACTIVIDADES DE ORGANISMOS QUE PRESTAN SERVICIOS 
-SANITARIOS, EDUCATIVOS,
-CULTURALES
-SI
-1
-NO
-841300
-REGULACIîN Y FACILITACIîN DE LA ACTIVIDAD ECONîMICA
-SI
-1
-NO
-CŠdigo
-PRESTACIîN DE SERVICIOS A LA COMUNIDAD EN 
-GENERAL
-!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-842100
-RELACIONES EXTERIORES
-G
-1
-NO
-842200
-ACTIVIDADES DE DEFENSA
-G
-1
-NO
-842300
-ACTIVIDADES DE MANTENIMIENTO DEL ORDEN PòBLICO Y DE SEGURIDAD
-G
-1
-NO
-CŠdigo
-ACTIVIDADES DE PLANES DE SEGURIDAD SOCIAL DE AFILIACIîN 
-OBLIGATORIA
-!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-843010
-FONDO NACIONAL DE SALUD (FONASA)
-!
-G
-1
-NO
-843020
-INSTITUTO DE PREVISIîN SOCIAL (IPS)
-G
-1
-NO
-843090
-OTROS PLANES DE SEGURIDAD SOCIAL DE AFILIACIîN OBLIGATORIA N.C.P.
-G
-1
-NO
-ENSE—ANZA
-CŠdigo
-ENSE—ANZA PREESCOLAR, PRIMARIA, SECUNDARIA CIENTêFICO 
-HUMANISTA Y T…CNICO PROFESIONAL
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-850011
-ENSE—ANZA PREESCOLAR PòBLICA
-NO
-1
-SI
-850012
-ENSE—ANZA PRIMARIA, SECUNDARIA CIENTêFICO HUMANISTA Y 
-T…CNICO PROFESIONAL PòBLICA
-NO
-1
-SI
-850021
-ENSE—ANZA PREESCOLAR PRIVADA
-NO
-1
-SI
-850022
-ENSE—ANZA PRIMARIA, SECUNDARIA CIENTêFICO HUMANISTA Y 
-T…CNICO PROFESIONAL PRIVADA
-NO
-1
-SI
-CŠdigo
-ENSE—ANZA 
-SUPERIOR
-!!!!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-853110
-ENSE—ANZA SUPERIOR EN UNIVERSIDADES PòBLICAS
-NO
-1
-NO
-853120
-ENSE—ANZA SUPERIOR EN UNIVERSIDADES PRIVADAS
-NO
-1
-NO
-853201
-ENSE—ANZA SUPERIOR EN INSTITUTOS PROFESIONALES
-NO
-1
-NO
-853202
-ENSE—ANZA SUPERIOR EN CENTROS DE FORMACIîN T…CNICA
-NO
-1
-SI
-CŠdigo
-OTROS TIPOS DE 
-ENSE—ANZA
-!!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-854100
-ENSE—ANZA DEPORTIVA Y RECREATIVA
-SI
-1
-SI
-854200
-ENSE—ANZA CULTURAL
-NO
-G
-SI
-854901
-ENSE—ANZA PREUNIVERSITARIA
-NO
-1
-SI
-854902
-SERVICIOS PERSONALES DE EDUCACIîN
-NO
-2
-SI
-854909
-OTROS TIPOS DE ENSE—ANZA N.C.P.
-NO
-1
-SI
-CŠdigo
-ACTIVIDADES DE APOYO A LA 
-ENSE—ANZA
-!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-855000
-ACTIVIDADES DE APOYO A LA ENSE—ANZA
-G
-G
-SI
-ACTIVIDADES DE ATENCIîN DE LA SALUD HUMANA 
-Y DE ASISTENCIA SOCIAL
-CŠdigo
-ACTIVIDADES DE HOSPITALES PòBLICOS Y 
-PRIVADOS
-!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-861010
-ACTIVIDADES DE HOSPITALES Y CLêNICAS PòBLICAS
-SI
-1
-NO
-861020
-ACTIVIDADES DE HOSPITALES Y CLêNICAS PRIVADAS
-SI
-1
-SI
-CŠdigo
-ACTIVIDADES DE M…DICOS Y 
-ODONTîLOGOS
-!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-862010
-ACTIVIDADES DE CENTROS DE SALUD MUNICIPALIZADOS (SERVICIOS DE SALUD 
-PòBLICA)
-G
-1
-SI
-862021
-CENTROS M…DICOS PRIVADOS (ESTABLECIMIENTOS DE ATENCIîN 
-AMBULATORIA)
-NO
-1
-SI
-862022
-CENTROS DE ATENCIîN ODONTOLîGICA PRIVADOS (ESTABLECIMIENTOS DE 
-ATENCIîN AMBULATORIA)
-NO
-1
-SI
-862031
-SERVICIOS DE M…DICOS PRESTADOS DE FORMA INDEPENDIENTE
-NO
-2
-SI
-862032
-SERVICIOS DE ODONTîLOGOS PRESTADOS DE FORMA INDEPENDIENTE
-NO
-2
-SI
-CŠdigo
-OTRAS ACTIVIDADES DE ATENCIîN DE LA SALUD 
-HUMANA
-!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-869010
-ACTIVIDADES DE LABORATORIOS CLêNICOS Y BANCOS DE SANGRE
-SI
-1
-SI
-869091
-OTROS SERVICIOS DE ATENCIîN DE LA SALUD HUMANA PRESTADOS POR EMPRESAS
-G
-1
-SI
-869092
-SERVICIOS PRESTADOS DE FORMA INDEPENDIENTE POR OTROS PROFESIONALES DE LA 
-SALUD
-NO
-2
-SI
-CŠdigo
-ACTIVIDADES DE ATENCIîN DE ENFERMERêA EN 
-INSTITUCIONES
-!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-871000
-ACTIVIDADES DE ATENCIîN DE ENFERMERêA EN INSTITUCIONES
-NO
-1
-SI
-CŠdigo
-ACTIVIDADES DE ATENCIîN EN INSTITUCIONES PARA PERSONAS CON 
-DISCAPACIDAD MENTAL Y
-TOXICîMANOS
-!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-872000
-ACTIVIDADES DE ATENCIîN EN INSTITUCIONES PARA PERSONAS CON 
-DISCAPACIDAD MENTAL Y
-TOXICîMANOS
-SI
-1
-SI
-CŠdigo
-ACTIVIDADES DE ATENCIîN EN INSTITUCIONES PARA PERSONAS DE EDAD Y 
-PERSONAS CON
-DISCAPACIDAD
-!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-873000
-ACTIVIDADES DE ATENCIîN EN INSTITUCIONES PARA PERSONAS DE EDAD Y 
-PERSONAS CON
-DISCAPACIDAD FêSICA
-SI
-1
-SI
-CŠdigo
-OTRAS ACTIVIDADES DE ATENCIîN EN 
-INSTITUCIONES
-!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-879000
-OTRAS ACTIVIDADES DE ATENCIîN EN INSTITUCIONES
-SI
-1
-SI
-CŠdigo
-ACTIVIDADES DE ASISTENCIA SOCIAL SIN ALOJAMIENTO PARA PERSONAS DE EDAD Y 
-PERSONAS CON
-DISCAPACIDAD
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-881000
-ACTIVIDADES DE ASISTENCIA SOCIAL SIN ALOJAMIENTO PARA PERSONAS DE EDAD Y 
-PERSONAS CON
-DISCAPACIDAD
-SI
-1
-SI
-CŠdigo
-OTRAS ACTIVIDADES DE ASISTENCIA SOCIAL SIN 
-ALOJAMIENTO
-!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-889000
-OTRAS ACTIVIDADES DE ASISTENCIA SOCIAL SIN ALOJAMIENTO
-SI
-1
-SI
-ACTIVIDADES ARTêSTICAS, DE ENTRETENIMIENTO 
-Y RECREATIVAS
-CŠdigo
-ACTIVIDADES CREATIVAS, ARTêSTICAS Y DE 
-ENTRETENIMIENTO
-!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-900001
-SERVICIOS DE PRODUCCIîN DE OBRAS DE TEATRO, CONCIERTOS, 
-ESPECTçCULOS DE DANZA, OTRAS
-PROD. ESC…NICAS
-SI
-1
-SI
-900002
-ACTIVIDADES ARTêSTICAS REALIZADAS POR BANDAS DE MòSICA, 
-COMPA—êAS DE TEATRO, CIRCENSES Y
-SIMILARES
-SI
-1
-SI
-900003
-ACTIVIDADES DE ARTISTAS REALIZADAS DE FORMA INDEPENDIENTE: ACTORES, 
-MòSICOS, ESCRITORES,
-ENTRE OTROS
-NO
-2
-SI
-900004
-SERVICIOS PRESTADOS POR PERIODISTAS INDEPENDIENTES
-NO
-2
-SI
-900009
-OTRAS ACTIVIDADES CREATIVAS, ARTêSTICAS Y DE ENTRETENIMIENTO N.C.P.
-G
-G
-SI
-CŠdigo
-ACTIVIDADES DE BIBLIOTECAS, ARCHIVOS Y MUSEOS Y OTRAS ACTIVIDADES 
-CULTURALES
-!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-910100
-ACTIVIDADES DE BIBLIOTECAS Y ARCHIVOS
-SI
-1
-SI
-910200
-ACTIVIDADES DE MUSEOS, GESTIîN DE LUGARES Y EDIFICIOS 
-HISTîRICOS
-SI
-1
-SI
-910300
-ACTIVIDADES DE JARDINES BOTçNICOS, ZOOLîGICOS Y RESERVAS 
-NATURALES
-SI
-1
-SI
-CŠdigo
-ACTIVIDADES DE JUEGOS DE AZAR Y 
-APUESTAS
-!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-920010
-ACTIVIDADES DE CASINOS DE JUEGOS
-SI
-1
-NO
-920090
-OTRAS ACTIVIDADES DE JUEGOS DE AZAR Y APUESTAS N.C.P.
-SI
-1
-NO
-CŠdigo
-ACTIVIDADES 
-DEPORTIVAS
-!!!!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-931101
-HIPîDROMOS
-SI
-1
-SI
-931102
-GESTIîN DE SALAS DE BILLAR; GESTIîN DE SALAS DE BOLOS 
-(BOWLING)
-SI
-1
-SI
-931109
-GESTIîN DE OTRAS INSTALACIONES DEPORTIVAS N.C.P.
-SI
-1
-SI
-931201
-ACTIVIDADES DE CLUBES DE FòTBOL AMATEUR Y PROFESIONAL
-G
-1
-SI
-931209
-ACTIVIDADES DE OTROS CLUBES DEPORTIVOS N.C.P.
-G
-1
-SI
-931901
-PROMOCIîN Y ORGANIZACIîN DE COMPETENCIAS DEPORTIVAS
-SI
-1
-SI
-931909
-OTRAS ACTIVIDADES DEPORTIVAS N.C.P.
-SI
-1
-SI
-CŠdigo
-OTRAS ACTIVIDADES DE ESPARCIMIENTO Y 
-RECREATIVAS
-!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-932100
-ACTIVIDADES DE PARQUES DE ATRACCIONES Y PARQUES TEMçTICOS
-SI
-1
-SI
-932901
-GESTIîN DE SALAS DE POOL; GESTIîN (EXPLOTACIîN) DE 
-JUEGOS ELECTRîNICOS
-SI
-1
-SI
-932909
-OTRAS ACTIVIDADES DE ESPARCIMIENTO Y RECREATIVAS N.C.P.
-G
-G
-SI
-OTRAS ACTIVIDADES DE SERVICIOS
-CŠdigo
-ACTIVIDADES DE ASOCIACIONES EMPRESARIALES, PROFESIONALES Y DE 
-EMPLEADORES
-!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-941100
-ACTIVIDADES DE ASOCIACIONES EMPRESARIALES Y DE EMPLEADORES
-SI
-1
-SI
-941200
-ACTIVIDADES DE ASOCIACIONES PROFESIONALES
-SI
-1
-SI
-CŠdigo
-ACTIVIDADES DE 
-SINDICATOS
-!!!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-942000
-ACTIVIDADES DE SINDICATOS
-SI
-1
-SI
-CŠdigo
-ACTIVIDADES DE OTRAS 
-ASOCIACIONES
-!!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-949100
-ACTIVIDADES DE ORGANIZACIONES RELIGIOSAS
-SI
-1
-NO
-949200
-ACTIVIDADES DE ORGANIZACIONES POLêTICAS
-SI
-1
-SI
-949901
-ACTIVIDADES DE CENTROS DE MADRES
-SI
-1
-NO
-949902
-ACTIVIDADES DE CLUBES SOCIALES
-SI
-1
-NO
-949903
-FUNDACIONES Y CORPORACIONES; ASOCIACIONES QUE PROMUEVEN ACTIVIDADES 
-CULTURALES O
-RECREATIVAS
-SI
-1
-NO
-949904
-CONSEJO DE ADMINISTRACIîN DE EDIFICIOS Y CONDOMINIOS
-G
-1
-NO
-949909
-ACTIVIDADES DE OTRAS ASOCIACIONES N.C.P.
-SI
-1
-SI
-CŠdigo
-REPARACIîN DE COMPUTADORES Y EQUIPO DE 
-COMUNICACIONES
-!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-951100
-REPARACIîN DE COMPUTADORES Y EQUIPO PERIF…RICO
-SI
-1
-SI
-951200
-REPARACIîN DE EQUIPO DE COMUNICACIONES (INCLUYE LA REPARACIîN 
-TEL…FONOS CELULARES)
-SI
-1
-SI
-CŠdigo
-REPARACIîN DE EFECTOS PERSONALES Y ENSERES 
-DOM…STICOS
-!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-952100
-REPARACIîN DE APARATOS ELECTRîNICOS DE CONSUMO (INCLUYE 
-APARATOS DE TELEVISIîN Y RADIO)
-SI
-1
-SI
-952200
-REPARACIîN DE APARATOS DE USO DOM…STICO, EQUIPO 
-DOM…STICO Y DE JARDINERêA
-SI
-1
-SI
-952300
-REPARACIîN DE CALZADO Y DE ARTêCULOS DE CUERO
-SI
-1
-SI
-952400
-REPARACIîN DE MUEBLES Y ACCESORIOS DOM…STICOS
-SI
-1
-SI
-952900
-REPARACIîN DE OTROS EFECTOS PERSONALES Y ENSERES DOM…STICOS
-SI
-1
-SI
-CŠdigo
-OTRAS ACTIVIDADES DE SERVICIOS 
-PERSONALES
-!!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-960100
-LAVADO Y LIMPIEZA, INCLUIDA LA LIMPIEZA EN SECO, DE PRODUCTOS TEXTILES Y DE 
-PIEL
-SI
-1
-SI
-960200
-PELUQUERêA Y OTROS TRATAMIENTOS DE BELLEZA
-G
-G
-SI
-960310
-SERVICIOS FUNERARIOS
-SI
-1
-SI
-960320
-SERVICIOS DE CEMENTERIOS
-SI
-1
-SI
-960901
-SERVICIOS DE ADIESTRAMIENTO, GUARDERêA, PELUQUERêA, PASEO DE 
-MASCOTAS (EXCEPTO ACT.
-VETERINARIAS)
-SI
-1
-SI
-960902
-ACTIVIDADES DE SALONES DE MASAJES, BA—OS TURCOS, SAUNAS, SERVICIO DE 
-BA—OS PòBLICOS
-SI
-1
-SI
-960909
-OTRAS ACTIVIDADES DE SERVICIOS PERSONALES N.C.P.
-NO
-2
-SI
-ACTIVIDADES DE LOS HOGARES COMO EMPLEADORES; 
-ACTIVIDADES NO DIFERENCIADAS DE LOS HOGARES
-!
-CŠdigo
-ACTIVIDADES DE LOS HOGARES COMO EMPLEADORES DE PERSONAL 
-DOM…STICO
-!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-970000
-ACTIVIDADES DE LOS HOGARES COMO EMPLEADORES DE PERSONAL DOM…STICO
-NO
-G
-NO
-ACTIVIDADES DE ORGANIZACIONES Y îRGANOS 
-EXTRATERRITORIALES
-CŠdigo
-ACTIVIDADES DE ORGANIZACIONES Y îRGANOS 
-EXTRATERRITORIALES
-!!!!!!!!!!!!!!!!
-Afecto a
-IVA
-Categor™a
-Tributaria
-Disponible
-Inter net
-990000
-ACTIVIDADES DE ORGANIZACIONES Y îRGANOS EXTRATERRITORIALES
-G
-1
-NO
-!
-Glosario
-G
-: La categor™a tributaria y la calidad de Afecto a IVA, se determinar⁄ 
-por caracter™sticas propias de la actividad.
-Valores y fechas
-UF
-DŠlar
-UTM-UTA-IPC
-Datos y valores de Renta
-Datos y valores de IVA
-Otros valores
-Normativa y legislaciŠn
-Circulares
-Resoluciones
-Consulta pœblica de normas
-Administrador de contenido
-normativo
-Administrador de contenido de
-Jurisprudencia
-LegislaciŠn tributaria y
-convenios inter nacionales
-Jurisprudencia y tribunales
-Redes sociales
-Facebook
-X
-Youtube
-RSS
-APPs
-LinkedIn
-Instagram
-Sitios de inter”s
-Aplicaciones y documentos
-Web œtiles
-Sitios de gobier no relacionados
-Organismos relacionados
-Intercambios de InformaciŠn -
-Est⁄ndar CRS
-Sobre el SII
-Nuestro Servicio
-Trabaja con nosotros
-GestiŠn y estad™sticas
-CFiT Virtual
-Derechos de los contribuyentes
-T”rminos de uso del sitio web
-DeclaraciŠn de Privacidad
-Recomendaciones de seguridad
-
-"""
-]
+from apps.helpers.read_guidline import ReadGuidance
+from apps.integrations.bedrock_clients import get_bedrock_client, get_bedrock_executor
+from apps.integrations.conversation_history import ConversationHistory
+from apps.integrations.sii_catalog import get_catalog
+from apps.integrations.sii_search import get_activity_search
 
 
 class BedRockLLM:
     def __init__(
         self,
         model_id: str = "claude.3.haiku", #Titan
-        region_name: str = "us-east-1",
+        region_name: Optional[str] = None,
         temperature: float = 0.7,
-        max_tokens: int = 1000
+        max_tokens: int = 1000,
+        history_max_entries: Optional[int] = None,
+        history_max_bytes: Optional[int] = None,
+        history_store_prompt_hash: Optional[bool] = None
     ):
         """
         Inicializa la clase para interactuar con modelos LLM en Amazon Bedrock.
         
         Args:
             model_id (str): ID del modelo a usar (default: "anthropic.claude-v2")
-            region_name (str): Región de AWS (default: "us-east-1")
+            region_name (str): Región de AWS (default: settings.BEDROCK_REGION)
             temperature (float): Temperatura para la generación (default: 0.7)
             max_tokens (int): Máximo número de tokens en la respuesta (default: 1000)
+            history_max_entries (int): Máximo de entradas en el historial, 0 lo
+                desactiva (default: settings.BEDROCK_HISTORY_MAX_ENTRIES)
+            history_max_bytes (int): Máximo de bytes en el historial
+                (default: settings.BEDROCK_HISTORY_MAX_BYTES)
+            history_store_prompt_hash (bool): Guardar solo el hash de cada prompt
+                (default: settings.BEDROCK_HISTORY_STORE_PROMPT_HASH)
         """
         self.model_id = model_id
         self.temperature = temperature
         self.max_tokens = max_tokens
         
-        # Inicializar el cliente de Bedrock usando el rol IAM
-        self.client = boto3.client(
-            service_name="bedrock-runtime",
-            region_name=region_name
-        )
+        # Cliente compartido por el proceso (usa el rol IAM y reutiliza conexiones)
+        self.client = get_bedrock_client(region_name)
         
-        # Historial de conversaciones
-        self.conversation_history = []
+        # Historial de conversaciones, acotado para no crecer sin límite en
+        # workers de larga vida
+        if history_max_entries is None:
+            history_max_entries = settings.BEDROCK_HISTORY_MAX_ENTRIES
+        if history_max_bytes is None:
+            history_max_bytes = settings.BEDROCK_HISTORY_MAX_BYTES
+        if history_store_prompt_hash is None:
+            history_store_prompt_hash = settings.BEDROCK_HISTORY_STORE_PROMPT_HASH
+        self.conversation_history = ConversationHistory(
+            max_entries=history_max_entries,
+            max_bytes=history_max_bytes,
+            store_prompt_hash=history_store_prompt_hash,
+        )
 
     def _get_model_params(self, prompt: str) -> Dict:
         """
@@ -6227,10 +146,7 @@ class BedRockLLM:
             
             # Guardar en el historial si está activado
             if store_history:
-                self.conversation_history.append({
-                    "prompt": prompt,
-                    "response": response_text
-                })
+                self.conversation_history.append(prompt, response_text)
             
             return response_text
             
@@ -6238,6 +154,87 @@ class BedRockLLM:
             error_msg = f"Error al invocar el modelo: {str(e)}"
             raise Exception(error_msg)
     
+    def _extract_stream_chunk(self, event: Dict) -> str:
+        """
+        Extrae el texto de un evento de `invoke_model_with_response_stream`.
+        """
+        chunk = json.loads(event["chunk"]["bytes"])
+
+        if "anthropic.claude" in self.model_id:
+            return chunk.get('completion', '')
+
+        elif "meta.llama2" in self.model_id:
+            return chunk.get('generation', '')
+
+        elif "amazon.titan" in self.model_id:
+            return chunk.get('outputText', '')
+
+        elif "ai21" in self.model_id:
+            return chunk.get('completions', [{}])[0].get('data', {}).get('text', '')
+
+        else:
+            raise ValueError(f"Modelo no soportado: {self.model_id}")
+
+    def chat_stream(
+        self,
+        prompt: str,
+        stop_when: Optional[Callable[[str], Any]] = None,
+        store_history: bool = True
+    ) -> str:
+        """
+        Como `chat`, pero recibe la respuesta en streaming y corta apenas
+        `stop_when(texto_acumulado)` devuelve algo verdadero, sin esperar (ni
+        pagar) el resto de la generación.
+
+        Args:
+            prompt (str): Texto de entrada para el modelo
+            stop_when (callable): Condición de corte sobre el texto recibido
+            store_history (bool): Si se debe almacenar el histórico
+
+        Returns:
+            str: Respuesta del modelo (parcial si se cortó antes)
+        """
+        try:
+            body = self._get_model_params(prompt)
+            response = self.client.invoke_model_with_response_stream(
+                body=json.dumps(body),
+                modelId=self.model_id,
+                accept="application/json",
+                contentType="application/json"
+            )
+            stream = response["body"]
+            response_text = ""
+            try:
+                for event in stream:
+                    if "chunk" not in event:
+                        continue
+                    response_text += self._extract_stream_chunk(event)
+                    if stop_when is not None and stop_when(response_text):
+                        break
+            finally:
+                # Cerrar la conexión descarta lo que el modelo siga generando
+                stream.close()
+
+            if store_history:
+                self.conversation_history.append(prompt, response_text)
+
+            return response_text
+
+        except Exception as e:
+            error_msg = f"Error al invocar el modelo: {str(e)}"
+            raise Exception(error_msg)
+
+    async def achat(self, prompt: str, store_history: bool = True) -> str:
+        """
+        Versión asíncrona de `chat`. La llamada bloqueante corre en el pool de
+        threads de Bedrock, así el event loop atiende otras requests mientras
+        espera al modelo.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            get_bedrock_executor(), partial(self.chat, prompt, store_history)
+        )
+
     def get_available_models(self) -> List[str]:
         """
         Retorna una lista de los modelos disponibles más comunes en Bedrock.
@@ -6256,25 +253,70 @@ class BedRockLLM:
         """
         Obtiene el historial de la conversación.
         """
-        return self.conversation_history
+        return self.conversation_history.as_list()
     
     def clear_conversation_history(self):
         """
         Limpia el historial de la conversación.
         """
-        self.conversation_history = []
+        self.conversation_history.clear()
 
-    def ask_activity_guidance(self, activity_description: str) -> str:
+    def candidate_activities_prompt(self, activity_description: str, top_k: Optional[int] = None) -> str:
         """
-        Asks for guidance on a specific activity.
+        Catalog lines for the BM25 shortlist of `activity_description`, or the
+        whole catalog when nothing in it shares a term with the description.
+        """
+        top_k = top_k or settings.SII_CANDIDATES_TOP_K
+        candidates = [
+            activity
+            for activity, _ in get_activity_search().search(activity_description, k=top_k)
+        ]
+        return get_catalog().to_prompt(candidates or None)
+
+    def batch_candidate_activities_prompt(
+        self, activity_descriptions: List[str], top_k: Optional[int] = None
+    ) -> str:
+        """
+        Catalog lines for the union of the BM25 shortlists of every
+        description, or the whole catalog when one of them has no candidates.
+        """
+        top_k = top_k or settings.SII_CANDIDATES_TOP_K
+        search = get_activity_search()
+        candidates = {}
+        for activity_description in activity_descriptions:
+            shortlist = search.search(activity_description, k=top_k)
+            if not shortlist:
+                return get_catalog().to_prompt()
+            for activity, _ in shortlist:
+                candidates.setdefault(activity.code, activity)
+        return get_catalog().to_prompt(candidates.values())
+
+    @classmethod
+    def for_activity_guidance(cls, max_tokens: int = 500) -> "BedRockLLM":
+        """
+        Instancia configurada para `ask_activity_guidance`.
         """
-            # Crear instancia de BedRock (usando el rol IAM)
-        llm = BedRockLLM(
-            model_id="anthropic.claude-v2",
+        return cls(
+            model_id=settings.SII_GUIDANCE_MODEL_ID,
             temperature=0.7,
-            max_tokens=500
+            max_tokens=max_tokens,
+            # Clasificación de una sola vuelta: no hay conversación que recordar
+            history_max_entries=0
         )
 
+    def ask_activity_guidance(
+        self,
+        activity_description: str,
+        top_k: Optional[int] = None,
+        stream: Optional[bool] = None,
+    ) -> str:
+        """
+        Asks for guidance on a specific activity.
+
+        When streaming (default `settings.SII_GUIDANCE_STREAMING`) the answer
+        is cut as soon as the `[Rubro, categoria]` list has arrived.
+        """
+        stream = settings.SII_GUIDANCE_STREAMING if stream is None else stream
         try:
             # Solicitar input al usuario
             descripcion = activity_description
@@ -6295,8 +337,8 @@ class BedRockLLM:
         Ejemplo de salida:
         "Rubro: Venta al por menor de frutas y verduras en comercios especializados (verdulerías). Código: 472103."
 
-        La información de los rubros es la siguiente:
-        {data}
+        La información de los rubros es la siguiente (una línea por rubro):
+        {self.candidate_activities_prompt(descripcion, top_k)}
 
         La declaración del humano respecto a su trabajo es la siguiente:
         "{descripcion}"
@@ -6305,9 +347,51 @@ class BedRockLLM:
         La respuesta debe estar en el formato lista, es muy importante.
         [Rubro, categoria (1,2,G)]
         """
-            llm.clear_conversation_history()
-            respuesta = llm.chat(prompt)
+            if stream:
+                respuesta = self.chat_stream(
+                    prompt, stop_when=ReadGuidance.find_guidance_list, store_history=False
+                )
+            else:
+                respuesta = self.chat(prompt, store_history=False)
             return respuesta
 
         except Exception as e:
-            print(e)
\ No newline at end of file
+            print(e)
+
+    async def aask_activity_guidance(self, activity_description: str, top_k: Optional[int] = None) -> str:
+        """
+        Async version of `ask_activity_guidance`.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            get_bedrock_executor(), partial(self.ask_activity_guidance, activity_description, top_k)
+        )
+
+    def ask_activity_guidance_batch(
+        self, activity_descriptions: List[str], top_k: Optional[int] = None
+    ) -> str:
+        """
+        Asks for guidance on several activities in a single prompt. The answer
+        has one `n. [Rubro, categoria]` line per description, numbered from 1
+        in the given order (see `ReadGuidance.find_numbered_guidance_lists`).
+        """
+        declaraciones = "\n".join(
+            f'        {numero}. "{descripcion}"'
+            for numero, descripcion in enumerate(activity_descriptions, start=1)
+        )
+        prompt = f"""
+        Te proporcionaré varias descripciones numeradas del trabajo o actividad de distintas personas, y tú deberás analizar cada una y determinar cuál de los rubros listados corresponde mejor a esa actividad.
+        Los rubros disponibles están basados en códigos del Servicio de Impuestos Internos (SII).
+        Si no puedes identificar un rubro exacto, responde con el rubro más cercano.
+
+        La información de los rubros es la siguiente (una línea por rubro):
+        {self.batch_candidate_activities_prompt(activity_descriptions, top_k)}
+
+        Las declaraciones de los humanos respecto a su trabajo son las siguientes:
+{declaraciones}
+
+        ¿Cuál es el rubro de cada una?
+        La respuesta debe tener una línea por declaración, con su número y en el formato lista, es muy importante.
+        1. [Rubro, categoria (1,2,G)]
+        """
+        return self.chat(prompt, store_history=False)
@@ -0,0 +1,70 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from django.conf import settings
+
+from apps.integrations.process_registry import ProcessRegistry
+
+# Keyed on (region, endpoint URL).
+_clients = ProcessRegistry(close_item=lambda client: client.close())
+# Created after the clients so it is shut down first at exit.
+_executors = ProcessRegistry(close_item=lambda executor: executor.shutdown(wait=True))
+
+
+def get_bedrock_client(region_name: Optional[str] = None, endpoint_url: Optional[str] = None):
+    """
+    Process-wide `bedrock-runtime` client for a region.
+
+    botocore clients are thread-safe and keep a urllib3 connection pool, so one
+    client per region serves every model and request in the worker and reuses
+    TLS connections and resolved credentials. The model id is a per-call
+    parameter and does not need its own client.
+    """
+    region_name = region_name or settings.BEDROCK_REGION
+    endpoint_url = endpoint_url or settings.BEDROCK_ENDPOINT_URL
+    return _clients.get(
+        (region_name, endpoint_url), lambda: _create_client(region_name, endpoint_url)
+    )
+
+
+def _create_client(region_name: str, endpoint_url: Optional[str]):
+    # Imported lazily: workers that never call Bedrock should not load boto3.
+    import boto3
+    from botocore.config import Config
+
+    config = Config(
+        max_pool_connections=settings.BEDROCK_MAX_POOL_CONNECTIONS,
+        connect_timeout=settings.BEDROCK_CONNECT_TIMEOUT,
+        read_timeout=settings.BEDROCK_READ_TIMEOUT,
+        retries={"max_attempts": settings.BEDROCK_MAX_ATTEMPTS, "mode": "standard"},
+        tcp_keepalive=True,
+    )
+    # boto3's default session is not thread-safe, a private one is.
+    return boto3.session.Session().client(
+        service_name="bedrock-runtime",
+        region_name=region_name,
+        endpoint_url=endpoint_url,
+        config=config,
+    )
+
+
+def get_bedrock_executor() -> ThreadPoolExecutor:
+    """
+    Threads that run blocking Bedrock calls for async callers. Sized like the
+    connection pool so every in-flight call gets a connection.
+    """
+    return _executors.get(
+        None,
+        lambda: ThreadPoolExecutor(
+            max_workers=settings.BEDROCK_MAX_POOL_CONNECTIONS, thread_name_prefix="bedrock"
+        ),
+    )
+
+
+def close_bedrock_clients():
+    """
+    Stop the executor, then close pooled connections and forget every
+    client. Benchmarks call it to start from a cold registry.
+    """
+    _executors.close()
+    _clients.close()
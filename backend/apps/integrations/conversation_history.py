@@ -0,0 +1,60 @@
+import hashlib
+from collections import deque
+from typing import Dict, Iterator, List, Optional
+
+
+class ConversationHistory:
+    """
+    Prompt/response log with an upper bound on entries and bytes.
+
+    Oldest entries are dropped first. With `store_prompt_hash` only the SHA-256
+    of each prompt is kept, which is enough to correlate calls without holding
+    the (catalog-sized) prompt text. `max_entries=0` disables the history.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        store_prompt_hash: bool = False,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.store_prompt_hash = store_prompt_hash
+        self._entries = deque()
+        self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[Dict[str, str]]:
+        return (entry for entry, _ in self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def append(self, prompt: str, response: str):
+        if self.max_entries == 0:
+            return
+        if self.store_prompt_hash:
+            entry = {"prompt_hash": hashlib.sha256(prompt.encode()).hexdigest(), "response": response}
+        else:
+            entry = {"prompt": prompt, "response": response}
+        size = sum(len(value.encode()) for value in entry.values())
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        self._entries.append((entry, size))
+        self._bytes += size
+        while (self.max_entries is not None and len(self._entries) > self.max_entries) or (
+            self.max_bytes is not None and self._bytes > self.max_bytes
+        ):
+            _, dropped = self._entries.popleft()
+            self._bytes -= dropped
+
+    def clear(self):
+        self._entries.clear()
+        self._bytes = 0
+
+    def as_list(self) -> List[Dict[str, str]]:
+        return list(self)
@@ -0,0 +1,160 @@
+import base64
+import json
+import re
+import socket
+import struct
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Optional
+
+_INVOKE_PATH_RE = re.compile(
+    r"^/model/(?P<model_id>[^/]+)/(?P<action>invoke|invoke-with-response-stream)$"
+)
+
+DEFAULT_COMPLETION = " [Venta al por menor de frutas y verduras, 1]"
+# Numbered descriptions of a batch guidance prompt: `1. "vendo fruta"`.
+_BATCH_ITEM_RE = re.compile(r'^\s*(\d+)\. ".*"$', re.MULTILINE)
+
+
+def default_respond(prompt: str) -> str:
+    """
+    `DEFAULT_COMPLETION`, once per numbered description for batch prompts.
+    """
+    numbers = _BATCH_ITEM_RE.findall(prompt)
+    if not numbers:
+        return DEFAULT_COMPLETION
+    return "\n".join(f"{number}.{DEFAULT_COMPLETION}" for number in numbers)
+
+
+class _FakeBedrockHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        # Headers and body go out in separate writes; without this Nagle plus
+        # delayed ACKs add ~40 ms to every keep-alive request.
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        match = _INVOKE_PATH_RE.match(self.path)
+        if match is None:
+            self._reply(404, {"message": f"Unknown path {self.path}"})
+            return
+        self.server.requests += 1
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        prompt = json.loads(body or b"{}").get("prompt", "")
+        completion = self.server.respond(prompt)
+        if match.group("action") == "invoke":
+            self._reply(200, {"completion": completion, "stop_reason": "stop_sequence"})
+        else:
+            self._stream(completion)
+
+    def _stream(self, completion):
+        """
+        Send the completion word by word as `chunk` events in the AWS event
+        stream framing, pausing `token_latency` between them. Stops quietly
+        when the client hangs up early.
+        """
+        self.send_response(200)
+        self.send_header("Content-Type", "application/vnd.amazon.eventstream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        pieces = re.findall(r"\s*\S+", completion) or [completion]
+        try:
+            for index, piece in enumerate(pieces):
+                last = index == len(pieces) - 1
+                payload = {"completion": piece, "stop_reason": "stop_sequence" if last else None}
+                self._write_chunk(_event_message(json.dumps(payload).encode()))
+                self.server.streamed_chunks += 1
+                if self.server.token_latency and not last:
+                    time.sleep(self.server.token_latency)
+            self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True
+
+    def _write_chunk(self, data):
+        self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+
+    def _reply(self, status, payload):
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _event_message(chunk: bytes) -> bytes:
+    headers = b""
+    for name, value in (
+        (":event-type", "chunk"),
+        (":content-type", "application/json"),
+        (":message-type", "event"),
+    ):
+        headers += struct.pack("B", len(name)) + name.encode()
+        headers += struct.pack("!BH", 7, len(value)) + value.encode()
+    payload = json.dumps({"bytes": base64.b64encode(chunk).decode()}).encode()
+    total_length = 12 + len(headers) + len(payload) + 4
+    prelude = struct.pack("!II", total_length, len(headers))
+    message = prelude + struct.pack("!I", zlib.crc32(prelude)) + headers + payload
+    return message + struct.pack("!I", zlib.crc32(message))
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    # The default backlog of 5 makes concurrent clients wait on SYN retries.
+    request_queue_size = 256
+
+
+class FakeBedrockServer:
+    """
+    Local stand-in for the `bedrock-runtime` endpoint (Anthropic text
+    completion format, plain and streamed), for benchmarks that must not reach
+    AWS. `latency` delays every answer, `token_latency` every streamed word.
+
+    Point a client at it with `BEDROCK_ENDPOINT_URL` or
+    `get_bedrock_client(endpoint_url=server.endpoint_url)`; any credentials
+    will do since requests are not verified.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        respond: Optional[Callable[[str], str]] = None,
+        token_latency: float = 0.0,
+    ):
+        self.server = _Server(("127.0.0.1", 0), _FakeBedrockHandler)
+        self.server.latency = latency
+        self.server.requests = 0
+        self.server.token_latency = token_latency
+        self.server.streamed_chunks = 0
+        self.server.respond = respond or default_respond
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def endpoint_url(self) -> str:
+        host, port = self.server.server_address
+        return f"http://{host}:{port}"
+
+    @property
+    def requests(self) -> int:
+        return self.server.requests
+
+    @property
+    def streamed_chunks(self) -> int:
+        return self.server.streamed_chunks
+
+    def __enter__(self) -> "FakeBedrockServer":
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.server.shutdown()
+        self.server.server_close()
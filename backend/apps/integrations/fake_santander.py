@@ -0,0 +1,297 @@
+import ipaddress
+import json
+import os
+import random
+import socket
+import ssl
+import tempfile
+import threading
+import time
+from collections import Counter
+from datetime import date, datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List
+from urllib.parse import urlsplit
+
+from django.conf import settings
+
+from apps.helpers.get_master_entity_from_description import NationalIdentifier
+
+# settings name -> which stub answers it
+_ENDPOINTS = {
+    "SANTANDER_TOKEN_URL": "token",
+    "SANTANDER_ACCOUNTS_URL": "accounts",
+    "SANTANDER_MOVEMENTS_URL": "movements",
+}
+
+
+def fake_movements(account_number: str, start: int, stop: int) -> List[Dict[str, str]]:
+    """
+    Movements number `start + 1` to `stop` of an account in the open banking
+    format, most of them transfers whose observation starts with the payer's
+    RUT. Each movement only depends on the account and its number, so pages
+    can be generated independently.
+    """
+    first_day = date(2024, 1, 1)
+    movements = []
+    for number in range(start + 1, stop + 1):
+        rng = random.Random(f"{account_number}:{number}")
+        day = first_day + timedelta(days=rng.randrange(365))
+        rut = rng.randrange(5_000_000, 25_000_000)
+        dv = NationalIdentifier.calculate_verificator(str(rut))
+        amount = rng.randrange(1_000, 500_000) * 100
+        movements.append(
+            {
+                "accountingDate": day.isoformat(),
+                "transactionDate": day.isoformat(),
+                "observation": f"{rut:010d}{dv} Transf. de cliente {number}",
+                "expandedCode": "TEF",
+                "movementNumber": str(number),
+                "movementAmount": f"{amount:015d}" + ("-" if rng.random() < 0.3 else ""),
+            }
+        )
+    return movements
+
+
+class _FakeSantanderHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        endpoint = self.server.paths.get(self.path)
+        if endpoint is None:
+            self._reply(404, {"message": f"Unknown path {self.path}"})
+            return
+        with self.server.lock:
+            self.server.requests += 1
+            self.server.requests_by_endpoint[endpoint] += 1
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        if endpoint == "token" and self.server.reject_logins:
+            self._reply(401, {"error": "invalid_grant"})
+        elif endpoint == "token":
+            with self.server.lock:
+                self.server.logins += 1
+                login = self.server.logins
+            self._reply(
+                200,
+                {
+                    "access_token": f"fake-access-token-{login}",
+                    "tokenJWT": f"fake-jwt-{login}",
+                    "expires_in": 300,
+                },
+            )
+        elif self.server.error_rate and self.server.rng.random() < self.server.error_rate:
+            self._reply(503, {"message": "Service temporarily unavailable"})
+        elif not self._token_valid(endpoint):
+            self._reply(401, {"message": "Invalid token"})
+        elif endpoint == "accounts":
+            self._reply(200, self._accounts())
+        else:
+            request = json.loads(body or b"{}")
+            account_number = request.get("accountId", "")
+            if account_number in self.server.failing_accounts:
+                self._reply(500, {"message": "Service unavailable"})
+                return
+            self._reply(200, self._movements_page(account_number, request))
+
+    def _token_valid(self, endpoint):
+        token = (
+            self.headers.get("access-token", "")
+            if endpoint == "accounts"
+            else self.headers.get("Authorization", "")
+        )
+        login = token.rsplit("-", 1)[-1]
+        return login.isdigit() and int(login) > self.server.revoked_logins
+
+    def _movements_page(self, account_number, request):
+        total = self.server.movements_per_account
+        start = int(request.get("nextPageKey") or 0)
+        page_size = request.get("pageSize")
+        stop = min(total, start + page_size) if page_size else total
+        pagination = {"nextPageKey": str(stop)} if stop < total else {}
+        if self.server.newest_first:
+            movements = fake_movements(account_number, total - stop, total - start)[::-1]
+        else:
+            movements = fake_movements(account_number, start, stop)
+        return {"movements": movements, "pagination": pagination}
+
+    def _accounts(self):
+        accounts = [
+            {"OFICINACONTRATO": "0001", "NUMEROCONTRATO": f"{index:08d}"}
+            for index in range(1, self.server.accounts + 1)
+        ]
+        return {
+            "DATA": {
+                "OUTPUT": {
+                    "ESCALARES": {
+                        "NOMBREPERSONA": "JUANA",
+                        "APELLIDOPATERNO": "PEREZ",
+                        "APELLIDOMATERNO": "SOTO",
+                    },
+                    "MATRICES": {"MATRIZCAPTACIONES": {"e1": accounts}},
+                }
+            }
+        }
+
+    def _reply(self, status, payload):
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _wrap_with_self_signed_cert(server, directory: str) -> str:
+    """
+    Serve TLS with a new certificate for 127.0.0.1 and return its path.
+    """
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from cryptography.x509.oid import NameOID
+
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "127.0.0.1")])
+    now = datetime.now(timezone.utc)
+    certificate = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - timedelta(minutes=1))
+        .not_valid_after(now + timedelta(days=1))
+        .add_extension(
+            x509.SubjectAlternativeName([x509.IPAddress(ipaddress.ip_address("127.0.0.1"))]),
+            critical=False,
+        )
+        .add_extension(x509.BasicConstraints(ca=True, path_length=None), critical=True)
+        .sign(key, hashes.SHA256())
+    )
+    cert_path = os.path.join(directory, "cert.pem")
+    key_path = os.path.join(directory, "key.pem")
+    with open(cert_path, "wb") as cert_file:
+        cert_file.write(certificate.public_bytes(serialization.Encoding.PEM))
+    with open(key_path, "wb") as key_file:
+        key_file.write(
+            key.private_bytes(
+                serialization.Encoding.PEM,
+                serialization.PrivateFormat.PKCS8,
+                serialization.NoEncryption(),
+            )
+        )
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(cert_path, key_path)
+    # Handshakes happen on first read, in the handler thread, not in accept().
+    server.socket = context.wrap_socket(
+        server.socket, server_side=True, do_handshake_on_connect=False
+    )
+    return cert_path
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 256
+
+
+class FakeSantanderServer:
+    """
+    Local stand-in for the three Santander endpoints the scraper calls
+    (login, account listing, movements), for benchmarks that must not reach
+    the bank. Every user has `accounts` accounts with `movements_per_account`
+    movements each, served in pages of the requested `pageSize`. Accounts in
+    `failing_accounts` answer 500, and any read call answers 503 with
+    probability `error_rate`. With `reject_logins` every login answers 401,
+    as for a wrong password. Movements are listed oldest first, or with
+    `newest_first` newest first.
+
+    `settings_overrides` maps the `SANTANDER_*_URL` settings to this server,
+    for use with `override_settings`. `connections` counts the TCP
+    connections clients opened. With `tls` the server speaks HTTPS with a
+    throwaway self-signed certificate; trust it through `ca_bundle` (e.g.
+    `REQUESTS_CA_BUNDLE`).
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        accounts: int = 2,
+        movements_per_account: int = 50,
+        failing_accounts=(),
+        tls: bool = False,
+        error_rate: float = 0.0,
+        reject_logins: bool = False,
+        newest_first: bool = False,
+    ):
+        self.server = _Server(("127.0.0.1", 0), _FakeSantanderHandler)
+        self.server.latency = latency
+        self.server.accounts = accounts
+        self.server.movements_per_account = movements_per_account
+        self.server.failing_accounts = set(failing_accounts)
+        self.server.error_rate = error_rate
+        self.server.reject_logins = reject_logins
+        self.server.newest_first = newest_first
+        self.server.rng = random.Random(0)
+        self.server.requests = 0
+        self.server.logins = 0
+        self.server.revoked_logins = 0
+        self.server.requests_by_endpoint = Counter()
+        self.server.connections = 0
+        self.server.lock = threading.Lock()
+        self.paths = {name: urlsplit(getattr(settings, name)).path for name in _ENDPOINTS}
+        self.server.paths = {path: _ENDPOINTS[name] for name, path in self.paths.items()}
+        self.ca_bundle = None
+        if tls:
+            self._tls_dir = tempfile.TemporaryDirectory()
+            self.ca_bundle = _wrap_with_self_signed_cert(self.server, self._tls_dir.name)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def endpoint_url(self) -> str:
+        host, port = self.server.server_address
+        scheme = "https" if self.ca_bundle else "http"
+        return f"{scheme}://{host}:{port}"
+
+    @property
+    def settings_overrides(self) -> Dict[str, str]:
+        return {name: f"{self.endpoint_url}{path}" for name, path in self.paths.items()}
+
+    @property
+    def requests(self) -> int:
+        return self.server.requests
+
+    def revoke_tokens(self):
+        """
+        Reject every token issued so far, as after a password change.
+        """
+        with self.server.lock:
+            self.server.revoked_logins = self.server.logins
+
+    @property
+    def requests_by_endpoint(self) -> Dict[str, int]:
+        return dict(self.server.requests_by_endpoint)
+
+    @property
+    def connections(self) -> int:
+        return self.server.connections
+
+    def __enter__(self) -> "FakeSantanderServer":
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.server.shutdown()
+        self.server.server_close()
+        if self.ca_bundle:
+            self._tls_dir.cleanup()
@@ -0,0 +1,117 @@
+import codecs
+import json
+import re
+from typing import Any, Dict, Iterable, Iterator
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+# What may still follow the part of a number decoded so far.
+_NUMBER_TAIL_RE = re.compile(r"[0-9.eE+-]*\Z")
+
+
+class JsonArrayStream:
+    """
+    Items of one array member of a top-level JSON object, decoded as the
+    body arrives instead of after reading all of it.
+
+    Iterate it to get the items of `key` one at a time; every other member
+    of the object (and `key` itself when it is not an array) is decoded
+    whole and ends up in `rest`, complete once the iteration finished. Only
+    the undecoded tail of the body and the current item are held in memory.
+
+        stream = JsonArrayStream(response.iter_content(65536), "movements")
+        for movement in stream:
+            ...
+        stream.rest["pagination"]
+    """
+
+    def __init__(self, chunks: Iterable[bytes], key: str):
+        self.key = key
+        self.rest: Dict[str, Any] = {}
+        self._chunks = iter(chunks)
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def __iter__(self) -> Iterator[Any]:
+        self._expect("{")
+        if self._peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            name = self._value()
+            if not isinstance(name, str):
+                raise ValueError(f"Expected an object key, got {name!r}")
+            self._expect(":")
+            if name == self.key and self._peek() == "[":
+                yield from self._array()
+            else:
+                self.rest[name] = self._value()
+            if self._expect(",}") == "}":
+                return
+
+    def _array(self) -> Iterator[Any]:
+        self._expect("[")
+        if self._peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self._value()
+            if self._expect(",]") == "]":
+                return
+
+    def _read(self) -> bool:
+        """
+        Append the next chunk to the buffer, dropping what was consumed.
+        False at the end of the body.
+        """
+        if self._eof:
+            return False
+        self._buffer = self._buffer[self._pos :]
+        self._pos = 0
+        for chunk in self._chunks:
+            text = self._text.decode(chunk)
+            if text:
+                self._buffer += text
+                return True
+        self._buffer += self._text.decode(b"", final=True)
+        self._eof = True
+        return False
+
+    def _peek(self) -> str:
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._read():
+                raise ValueError("Unexpected end of JSON body")
+
+    def _expect(self, allowed: str) -> str:
+        char = self._peek()
+        if char not in allowed:
+            raise ValueError(f"Expected one of {allowed!r} at {char!r}")
+        self._pos += 1
+        return char
+
+    def _value(self) -> Any:
+        self._peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if self._read():
+                    continue
+                raise
+            # A number cut at the chunk boundary decodes fine but short:
+            # "12" of "12.5", or "10" of "10E+2" with the rest of it still
+            # in the buffer. Decode it again once something else follows.
+            if (
+                isinstance(value, (int, float))
+                and _NUMBER_TAIL_RE.match(self._buffer, end)
+                and self._read()
+            ):
+                continue
+            self._pos = end
+            return value
@@ -0,0 +1,66 @@
+import atexit
+import os
+import threading
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+_registries: List["ProcessRegistry"] = []
+
+
+class ProcessRegistry:
+    """
+    Process-wide objects (HTTP sessions, SDK clients, executors) created on
+    first use, one per key.
+
+    A forked child (gunicorn preload) starts with an empty registry, since
+    the parent's objects hold its sockets and threads. At interpreter exit
+    every registry is closed, the most recently created first, calling
+    `close_item` on each object.
+    """
+
+    def __init__(self, close_item: Optional[Callable[[Any], None]] = None):
+        self._items: Dict[Hashable, Any] = {}
+        self._lock = threading.Lock()
+        self._close_item = close_item
+        _registries.append(self)
+
+    def get(self, key: Hashable, create: Callable[[], Any]) -> Any:
+        item = self._items.get(key)
+        if item is not None:
+            return item
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                item = create()
+                self._items[key] = item
+        return item
+
+    def close(self):
+        """
+        Forget every object, then close them; benchmarks call it to start
+        from a cold registry.
+        """
+        with self._lock:
+            items = list(self._items.values())
+            self._items.clear()
+        if self._close_item is not None:
+            for item in items:
+                self._close_item(item)
+
+    def _forget_inherited(self):
+        self._items.clear()
+        self._lock = threading.Lock()
+
+
+def _close_all():
+    for registry in reversed(_registries):
+        registry.close()
+
+
+def _forget_all_inherited():
+    for registry in _registries:
+        registry._forget_inherited()
+
+
+atexit.register(_close_all)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_all_inherited)
@@ -0,0 +1,46 @@
+import hashlib
+import time
+
+from django.core.cache import cache
+
+
+class RateLimiter:
+    """
+    At most `limit` acquisitions per `period` seconds and key, counted in
+    fixed windows in the Django cache. With a shared cache (Redis) the limit
+    holds across processes; `limit=0` disables it.
+
+    Keys are hashed so identifiers such as RUTs do not end up in the cache.
+    """
+
+    def __init__(self, name: str, limit: int, period: float = 1.0):
+        self.name = name
+        self.limit = limit
+        self.period = period
+
+    def _cache_key(self, key: str, window: int) -> str:
+        digest = hashlib.sha256(key.encode()).hexdigest()[:16] if key else "-"
+        return f"ratelimit:{self.name}:{digest}:{window}"
+
+    def acquire(self, key: str = "") -> float:
+        """
+        Block until a slot is free and return the seconds spent waiting.
+        """
+        if not self.limit:
+            return 0.0
+        waited = 0.0
+        while True:
+            now = time.time()
+            window = int(now // self.period)
+            cache_key = self._cache_key(key, window)
+            cache.add(cache_key, 0, timeout=int(self.period) + 1)
+            try:
+                count = cache.incr(cache_key)
+            except ValueError:
+                # The window expired between add and incr.
+                continue
+            if count <= self.limit:
+                return waited
+            delay = (window + 1) * self.period - now
+            time.sleep(delay)
+            waited += delay
@@ -0,0 +1,235 @@
+import logging
+import random
+import threading
+import time
+from collections import Counter
+from http.cookiejar import DefaultCookiePolicy
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from django.conf import settings
+from django.core.cache import cache
+from requests.adapters import HTTPAdapter
+
+from apps.helpers.cache_counters import incr_counter
+from apps.integrations.process_registry import ProcessRegistry
+from apps.integrations.rate_limit import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+# Keyed on host. A forked worker starts without the parent's sockets and
+# breaker state.
+_sessions = ProcessRegistry(close_item=lambda session: session.close())
+_breakers = ProcessRegistry()
+
+_STATS_KEY_PREFIX = "santander-transport"
+STAT_NAMES = (
+    "requests",
+    "retries",
+    "timeouts_or_connection_errors",
+    "transient_responses",
+    "breaker_opened",
+    "short_circuited",
+)
+# Per-process counts of the same events.
+stats = Counter()
+
+
+def get_santander_session(url: str) -> requests.Session:
+    """
+    Process-wide `requests.Session` for the host of `url`.
+
+    Each Santander host (auth, customer data, open banking) gets its own
+    keep-alive pool of `SANTANDER_POOL_MAXSIZE` connections, so repeated calls
+    skip the TCP and TLS handshakes. Cookies are never stored: the session
+    is shared by every user's sync.
+    """
+    return _sessions.get(urlsplit(url).netloc, _create_session)
+
+
+def _create_session() -> requests.Session:
+    session = requests.Session()
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=settings.SANTANDER_POOL_MAXSIZE,
+        # Callers beyond the pool size wait for a connection instead of
+        # opening throwaway ones.
+        pool_block=True,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class CircuitOpenError(Exception):
+    pass
+
+
+class CircuitBreaker:
+    """
+    Per-host breaker: after `failure_threshold` consecutive failures calls
+    fail fast for `cooldown` seconds, then a single trial call decides
+    whether to close it again or wait another cooldown.
+    """
+
+    def __init__(self, failure_threshold: int, cooldown: float):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at < self.cooldown:
+            return "open"
+        return "half-open"
+
+    def before_call(self):
+        with self._lock:
+            state = self.state
+            if state == "open" or (state == "half-open" and self._trial_in_flight):
+                raise CircuitOpenError("Santander circuit breaker is open")
+            if state == "half-open":
+                self._trial_in_flight = True
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial_in_flight = False
+
+    def release_trial(self):
+        """
+        For a call that ended without telling anything about the host
+        (e.g. interrupted): let the next call be the half-open trial.
+        """
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_failure(self) -> bool:
+        """
+        Count a failure; True when it opened the breaker.
+        """
+        with self._lock:
+            self.failures += 1
+            reopened = self._trial_in_flight
+            self._trial_in_flight = False
+            if reopened or (self.opened_at is None and self.failures >= self.failure_threshold):
+                self.opened_at = time.monotonic()
+                return True
+            return False
+
+
+def get_circuit_breaker(url: str) -> CircuitBreaker:
+    return _breakers.get(
+        urlsplit(url).netloc,
+        lambda: CircuitBreaker(
+            settings.SANTANDER_BREAKER_FAILURES, settings.SANTANDER_BREAKER_COOLDOWN
+        ),
+    )
+
+
+def _is_transient(response: requests.Response) -> bool:
+    return response.status_code == 429 or response.status_code >= 500
+
+
+def _backoff(attempt: int) -> float:
+    # "Full jitter": spreads the retries of many workers hitting the same outage.
+    ceiling = min(
+        settings.SANTANDER_RETRY_MAX_DELAY, settings.SANTANDER_RETRY_BASE_DELAY * 2**attempt
+    )
+    return random.uniform(0, ceiling)
+
+
+def santander_post(
+    url: str, rut: Optional[str] = None, idempotent: bool = False, **kwargs
+) -> requests.Response:
+    """
+    POST through the pooled session of the host, with the configured
+    connect/read timeouts unless the caller passes `timeout`.
+
+    Waits first for the global Santander rate limit and, when `rut` is
+    given, for that customer's limit. Calls go through the host's circuit
+    breaker; `idempotent` ones (reads) are retried on timeouts, connection
+    errors, 429 and 5xx with jittered exponential backoff. The last
+    transient response is returned, the last exception raised.
+    """
+    kwargs.setdefault(
+        "timeout", (settings.SANTANDER_CONNECT_TIMEOUT, settings.SANTANDER_READ_TIMEOUT)
+    )
+    breaker = get_circuit_breaker(url)
+    attempts = max(1, settings.SANTANDER_RETRY_ATTEMPTS) if idempotent else 1
+    for attempt in range(attempts):
+        if attempt:
+            _count("retries")
+            time.sleep(_backoff(attempt - 1))
+        # Before the breaker: a half-open trial must not wait here, nor be
+        # left in flight when the limiter's cache fails.
+        RateLimiter("santander", settings.SANTANDER_MAX_REQUESTS_PER_SECOND).acquire()
+        if rut:
+            RateLimiter(
+                "santander-rut", settings.SANTANDER_MAX_REQUESTS_PER_RUT_PER_MINUTE, period=60
+            ).acquire(rut)
+        try:
+            breaker.before_call()
+        except CircuitOpenError:
+            _count("short_circuited")
+            raise
+        try:
+            _count("requests")
+            response = get_santander_session(url).post(url, **kwargs)
+        except (requests.ConnectionError, requests.Timeout):
+            _record_failure(breaker, url)
+            _count("timeouts_or_connection_errors")
+            if attempt == attempts - 1:
+                raise
+            continue
+        except requests.RequestException:
+            # Not retried (e.g. too many redirects), but still a failed call.
+            _record_failure(breaker, url)
+            raise
+        except BaseException:
+            breaker.release_trial()
+            raise
+        if not _is_transient(response):
+            breaker.record_success()
+            return response
+        _record_failure(breaker, url)
+        _count("transient_responses")
+        if attempt == attempts - 1:
+            return response
+        # Streamed responses hold their pooled connection until closed.
+        response.close()
+
+
+def _record_failure(breaker: CircuitBreaker, url: str):
+    if breaker.record_failure():
+        _count("breaker_opened")
+        logger.warning("Santander circuit breaker opened for %s", urlsplit(url).netloc)
+
+
+def _count(name: str):
+    stats[name] += 1
+    incr_counter(f"{_STATS_KEY_PREFIX}:{name}")
+
+
+def transport_stats() -> Dict[str, int]:
+    """
+    Santander transport counters across every process sharing the cache.
+    """
+    return {name: cache.get(f"{_STATS_KEY_PREFIX}:{name}", 0) for name in STAT_NAMES}
+
+
+def close_santander_sessions():
+    """
+    Close pooled connections and forget every session and circuit breaker.
+    Benchmarks call it to start from cold pools.
+    """
+    _sessions.close()
+    _breakers.close()
@@ -0,0 +1,104 @@
+import hashlib
+import json
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import caches
+
+from apps.models import get_fernet
+
+Tokens = Tuple[str, str]
+
+
+class SantanderTokenCache:
+    """
+    Santander login tokens (access_token, tokenJWT) per set of credentials,
+    kept until `SANTANDER_TOKEN_EXPIRY_MARGIN` seconds before they expire.
+
+    Tokens live in process memory and, when `SANTANDER_TOKEN_CACHE` names a
+    Django cache alias, also in that cache (Fernet-encrypted) so other
+    workers reuse them. Keys include a hash of the stored password, so new
+    credentials never get tokens of the old ones.
+    """
+
+    def __init__(self):
+        self._tokens: Dict[str, Tuple[Tokens, float]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(banking_credentials) -> str:
+        password = (banking_credentials.password or "").encode()
+        password_hash = hashlib.sha256(password).hexdigest()[:16]
+        return f"santander-token:{banking_credentials.pk}:{password_hash}"
+
+    @staticmethod
+    def _shared_cache():
+        alias = settings.SANTANDER_TOKEN_CACHE
+        return caches[alias] if alias else None
+
+    def get(self, banking_credentials) -> Optional[Tokens]:
+        key = self.key(banking_credentials)
+        now = time.time()
+        with self._lock:
+            entry = self._tokens.get(key)
+            if entry is not None and entry[1] <= now:
+                del self._tokens[key]
+                entry = None
+        if entry is None:
+            shared = self._shared_cache()
+            encrypted = shared.get(key) if shared is not None else None
+            if encrypted is not None:
+                payload = json.loads(get_fernet().decrypt(encrypted.encode()))
+                entry = ((payload["access_token"], payload["jwt_token"]), payload["expires_at"])
+                with self._lock:
+                    self._tokens[key] = entry
+        if entry is None or entry[1] <= now:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry[0]
+
+    def set(
+        self,
+        banking_credentials,
+        access_token: str,
+        jwt_token: str,
+        expires_in: Optional[float] = None,
+    ):
+        expires_in = expires_in or settings.SANTANDER_TOKEN_TTL
+        lifetime = expires_in - settings.SANTANDER_TOKEN_EXPIRY_MARGIN
+        if lifetime <= 0:
+            return
+        key = self.key(banking_credentials)
+        expires_at = time.time() + lifetime
+        with self._lock:
+            # Drop expired tokens so credentials that stopped syncing do not pile up.
+            now = time.time()
+            for stale_key in [k for k, (_, at) in self._tokens.items() if at <= now]:
+                del self._tokens[stale_key]
+            self._tokens[key] = ((access_token, jwt_token), expires_at)
+        shared = self._shared_cache()
+        if shared is not None:
+            payload = json.dumps(
+                {"access_token": access_token, "jwt_token": jwt_token, "expires_at": expires_at}
+            )
+            shared.set(key, get_fernet().encrypt(payload.encode()).decode(), timeout=int(lifetime))
+
+    def invalidate(self, banking_credentials):
+        key = self.key(banking_credentials)
+        with self._lock:
+            self._tokens.pop(key, None)
+        shared = self._shared_cache()
+        if shared is not None:
+            shared.delete(key)
+
+    def clear(self):
+        with self._lock:
+            self._tokens.clear()
+
+
+token_cache = SantanderTokenCache()
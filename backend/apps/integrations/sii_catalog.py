@@ -0,0 +1,239 @@
+import hashlib
+import json
+import re
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+CATALOG_PATH = DATA_DIR / "sii_activities.json"
+# Text extracted from the SII "códigos de actividad económica" PDF, the input
+# of `manage.py build_sii_catalog`.
+RAW_CATALOG_PATH = DATA_DIR / "sii_activities_raw.txt"
+
+# The SII PDF export was extracted with a broken font map, so accented
+# characters come out as unrelated glyphs ("CŠdigo", "GANADERêA", ...).
+_MOJIBAKE = str.maketrans(
+    {
+        "Š": "ó",
+        "™": "í",
+        "⁄": "á",
+        "œ": "ú",
+        "”": "é",
+        "ê": "Í",
+        "…": "É",
+        "ç": "Á",
+        "î": "Ó",
+        "ò": "Ú",
+        "—": "Ñ",
+        "ƒ": "Ü",
+    }
+)
+
+PROMPT_HEADER = "código;descripción;afecto a IVA;categoría tributaria"
+
+_CODE_RE = re.compile(r"^\d{6}$")
+_JUNK_RE = re.compile(r"^!*$")
+_HEADER_LINES = {
+    "Código",
+    "Afecto a",
+    "IVA",
+    "Categoría",
+    "Tributaria",
+    "Disponible",
+    "Inter net",
+    "Seleccione el rubro",
+}
+_PREAMBLE_LINES = {
+    "Todos los códigos de actividad económica",
+    "Esta opción permite ver todos los códigos de actividad económica.",
+}
+_IVA_VALUES = {"SI", "NO", "G"}
+_CATEGORY_VALUES = {"1", "2", "G"}
+_INTERNET_VALUES = {"SI", "NO", "S", "N"}
+
+
+@dataclass(frozen=True)
+class SIIActivity:
+    """
+    One row of the SII "códigos de actividad económica" table.
+
+    `iva_affected` and `tax_category` keep the SII values verbatim: "G" means
+    the value is determined by the characteristics of the activity.
+    """
+
+    code: str
+    description: str
+    section: str
+    group: str
+    iva_affected: str
+    tax_category: str
+    internet_available: bool
+
+    def to_prompt_line(self) -> str:
+        return f"{self.code};{self.description};{self.iva_affected};{self.tax_category}"
+
+
+def _clean(line: str) -> str:
+    return " ".join(line.translate(_MOJIBAKE).split())
+
+
+def _join(lines: List[str]) -> str:
+    return " ".join(lines).strip()
+
+
+def _tax_category(value: str) -> Optional[str]:
+    # A handful of rows carry PDF noise after the category ("1Co").
+    if value in _CATEGORY_VALUES:
+        return value
+    if value[:1] in _CATEGORY_VALUES and value[1:].isalpha():
+        return value[:1]
+    return None
+
+
+def parse_sii_catalog(pages: Iterable[str]) -> List[SIIActivity]:
+    """
+    Parse the raw SII PDF dump into structured activities.
+
+    The dump is a flat sequence of lines: a section title, then for every group
+    a "Código ... Disponible Internet" table header with the group title in the
+    middle, followed by rows of `code`, one or more description lines and the
+    three flags (IVA, category, internet; the latter is sometimes cut to "S").
+    Page footers and filler lines are dropped, and repeated codes (page breaks
+    repeat the last row) keep their first occurrence.
+    """
+    lines = [_clean(line) for page in pages for line in page.splitlines()]
+    lines = [line for line in lines if line and not _JUNK_RE.match(line)]
+
+    activities: Dict[str, SIIActivity] = {}
+    section_lines: List[str] = []
+    section = ""
+    group = ""
+    index = 0
+    while index < len(lines):
+        line = lines[index]
+        if line == "Glosario":
+            break
+        if line in _PREAMBLE_LINES:
+            index += 1
+            continue
+        if line == "Código":
+            if section_lines:
+                section = _join(section_lines)
+                section_lines = []
+            group_lines = []
+            index += 1
+            while index < len(lines) and lines[index] != "Afecto a":
+                group_lines.append(lines[index])
+                index += 1
+            group = _join(group_lines)
+            continue
+        if line in _HEADER_LINES:
+            index += 1
+            continue
+        if _CODE_RE.match(line):
+            code = line
+            description_lines = []
+            index += 1
+            while index + 2 < len(lines):
+                iva, category, internet = lines[index : index + 3]
+                tax_category = _tax_category(category)
+                if iva in _IVA_VALUES and tax_category and internet in _INTERNET_VALUES:
+                    break
+                if lines[index] == "Código" or _CODE_RE.match(lines[index]):
+                    raise ValueError(f"Malformed SII activity row: {code}")
+                description_lines.append(lines[index])
+                index += 1
+            else:
+                raise ValueError(f"Unterminated SII activity row: {code}")
+            if code not in activities:
+                activities[code] = SIIActivity(
+                    code=code,
+                    description=_join(description_lines),
+                    section=section,
+                    group=group,
+                    iva_affected=iva,
+                    tax_category=tax_category,
+                    internet_available=internet.startswith("S"),
+                )
+            index += 3
+            continue
+        section_lines.append(line)
+        index += 1
+    return list(activities.values())
+
+
+class SIICatalog:
+    """
+    In-memory view of the parsed SII activity catalog with lookups by code
+    and by section.
+    """
+
+    def __init__(self, activities: Iterable[SIIActivity], version: Optional[str] = None):
+        self.activities = list(activities)
+        self._by_code = {activity.code: activity for activity in self.activities}
+        self._by_section: Dict[str, List[SIIActivity]] = {}
+        for activity in self.activities:
+            self._by_section.setdefault(activity.section, []).append(activity)
+        self.version = version or self._compute_version(self.activities)
+
+    def __len__(self) -> int:
+        return len(self.activities)
+
+    def __iter__(self) -> Iterator[SIIActivity]:
+        return iter(self.activities)
+
+    @staticmethod
+    def _compute_version(activities: List[SIIActivity]) -> str:
+        payload = json.dumps([asdict(activity) for activity in activities], sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()[:12]
+
+    def get(self, code: str) -> Optional[SIIActivity]:
+        return self._by_code.get(code)
+
+    def sections(self) -> List[str]:
+        return list(self._by_section)
+
+    def by_section(self, section: str) -> List[SIIActivity]:
+        return list(self._by_section.get(section, []))
+
+    def to_prompt(self, activities: Optional[Iterable[SIIActivity]] = None) -> str:
+        """
+        Compact, one-line-per-activity rendering for LLM prompts.
+        """
+        activities = self.activities if activities is None else activities
+        lines = [PROMPT_HEADER] + [activity.to_prompt_line() for activity in activities]
+        return "\n".join(lines)
+
+    def save(self, path: Path = CATALOG_PATH):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # One activity per line keeps the artifact small and diffable.
+        rows = ",\n".join(
+            json.dumps(asdict(activity), ensure_ascii=False, separators=(",", ":"))
+            for activity in self.activities
+        )
+        with open(path, "w", encoding="utf-8") as catalog_file:
+            catalog_file.write(f'{{"version":"{self.version}","activities":[\n{rows}\n]}}\n')
+
+    @classmethod
+    def load(cls, path: Path = CATALOG_PATH) -> "SIICatalog":
+        with open(path, encoding="utf-8") as catalog_file:
+            payload = json.load(catalog_file)
+        return cls(
+            (SIIActivity(**activity) for activity in payload["activities"]),
+            version=payload["version"],
+        )
+
+
+_catalog: Optional[SIICatalog] = None
+
+
+def get_catalog() -> SIICatalog:
+    """
+    Process-wide catalog, read from `CATALOG_PATH` the first time it is needed.
+    """
+    global _catalog
+    if _catalog is None:
+        _catalog = SIICatalog.load()
+    return _catalog
@@ -0,0 +1,178 @@
+import math
+import re
+import unicodedata
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from apps.integrations.sii_catalog import SIIActivity, SIICatalog, get_catalog
+
+
+_TOKEN_RE = re.compile(r"[a-z0-9ñ]+")
+
+# Function words plus catalog boilerplate that appears in hundreds of rows
+# ("N.C.P.", "excepto", "incluye") and would only add noise to the ranking.
+_STOPWORDS = {
+    "a", "al", "como", "con", "de", "del", "e", "el", "en", "es", "excepto",
+    "incluye", "la", "las", "lo", "los", "mi", "n", "c", "p", "ncp", "o", "otro",
+    "otros", "otra", "otras", "para", "por", "que", "se", "sin", "su", "sus",
+    "un", "una", "y", "yo",
+    # How people introduce their trade, never part of a catalog description.
+    "dedica", "dedico", "hace", "hago", "persona", "soy", "trabaja", "trabajo",
+}
+
+# Verb stems that should meet the noun used by the catalog ("vendo" -> "venta").
+_STEM_ALIASES = {"vend": "vent", "arriend": "alquil"}
+
+_SUFFIXES = (
+    "aciones", "iciones", "amiento", "imiento", "adoras", "adores", "mente",
+    "acion", "icion", "ciones", "cion", "adora", "ador", "ante", "ancia",
+    "idad", "ible", "able", "ismo", "ista", "eria",
+    "ar", "er", "ir",
+)
+
+
+def strip_accents(text: str) -> str:
+    # Keep "ñ": it distinguishes words ("año"/"ano") and users do type it.
+    text = text.lower().replace("ñ", "\0")
+    text = "".join(
+        char
+        for char in unicodedata.normalize("NFKD", text)
+        if not unicodedata.combining(char)
+    )
+    return text.replace("\0", "ñ")
+
+
+def stem(token: str) -> str:
+    """
+    Light Spanish stemmer: folds plurals, a few derivational suffixes and the
+    final gender vowel so "ventas", "venta" and "vender" land near each other.
+    """
+    if len(token) <= 3:
+        return token
+    if token.endswith("es") and len(token) > 4 and token[-3] not in "aeiou":
+        token = token[:-2]
+    elif token.endswith("s") and len(token) > 3:
+        token = token[:-1]
+    for suffix in _SUFFIXES:
+        if token.endswith(suffix) and len(token) - len(suffix) >= 3:
+            token = token[: -len(suffix)]
+            break
+    if len(token) > 4 and token[-1] in "aeo":
+        token = token[:-1]
+    return token
+
+
+def tokenize(text: str) -> List[str]:
+    tokens = []
+    for token in _TOKEN_RE.findall(strip_accents(text)):
+        if token in _STOPWORDS:
+            continue
+        stemmed = stem(token)
+        tokens.append(_STEM_ALIASES.get(stemmed, stemmed))
+    return tokens
+
+
+class BM25Index:
+    """
+    Small in-process inverted index with Okapi BM25 scoring.
+    """
+
+    def __init__(self, documents: Iterable[List[str]], k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.postings: Dict[str, List[Tuple[int, int]]] = {}
+        self.lengths: List[int] = []
+        for doc_id, tokens in enumerate(documents):
+            self.lengths.append(len(tokens))
+            for term, frequency in Counter(tokens).items():
+                self.postings.setdefault(term, []).append((doc_id, frequency))
+        self.size = len(self.lengths)
+        self.average_length = sum(self.lengths) / self.size if self.size else 0.0
+        self.idf = {
+            term: math.log(1 + (self.size - len(docs) + 0.5) / (len(docs) + 0.5))
+            for term, docs in self.postings.items()
+        }
+
+    def search(self, tokens: List[str], k: int = 10) -> List[Tuple[int, float]]:
+        scores: Dict[int, float] = {}
+        for term in set(tokens):
+            idf = self.idf.get(term)
+            if idf is None:
+                continue
+            for doc_id, frequency in self.postings[term]:
+                norm = 1 - self.b + self.b * self.lengths[doc_id] / self.average_length
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * (
+                    frequency * (self.k1 + 1) / (frequency + self.k1 * norm)
+                )
+        return sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:k]
+
+
+@dataclass(frozen=True)
+class LexicalMatch:
+    """
+    Best BM25 hit for a description. `margin` is the relative lead over the
+    runner-up, `coverage` the share of query terms found in it, and `exact`
+    whether the query has the same terms as the activity description.
+    """
+
+    activity: SIIActivity
+    score: float
+    margin: float
+    coverage: float
+    exact: bool
+
+
+class SIIActivitySearch:
+    """
+    BM25 retrieval over SII activity descriptions, used to shortlist candidate
+    codes before asking the LLM.
+    """
+
+    def __init__(self, catalog: SIICatalog):
+        self.catalog = catalog
+        self.activities = list(catalog)
+        # The group title adds context ("VENTA AL POR MENOR DE ALIMENTOS...")
+        # that the short row descriptions often leave out.
+        documents = [
+            tokenize(f"{activity.description} {activity.group}")
+            for activity in self.activities
+        ]
+        self.terms = [set(tokens) for tokens in documents]
+        self.description_terms = [
+            set(tokenize(activity.description)) for activity in self.activities
+        ]
+        self.index = BM25Index(documents)
+
+    def search(self, activity_description: str, k: int = 10) -> List[Tuple[SIIActivity, float]]:
+        return [
+            (self.activities[doc_id], score)
+            for doc_id, score in self.index.search(tokenize(activity_description), k)
+        ]
+
+    def best_match(self, activity_description: str) -> Optional[LexicalMatch]:
+        tokens = tokenize(activity_description)
+        results = self.index.search(tokens, k=2)
+        if not results:
+            return None
+        query_terms = set(tokens)
+        doc_id, score = results[0]
+        runner_up = results[1][1] if len(results) > 1 else 0.0
+        return LexicalMatch(
+            activity=self.activities[doc_id],
+            score=score,
+            margin=(score - runner_up) / score,
+            coverage=len(query_terms & self.terms[doc_id]) / len(query_terms),
+            exact=query_terms == self.description_terms[doc_id],
+        )
+
+
+_activity_search: Optional[SIIActivitySearch] = None
+
+
+def get_activity_search() -> SIIActivitySearch:
+    global _activity_search
+    catalog = get_catalog()
+    if _activity_search is None or _activity_search.catalog is not catalog:
+        _activity_search = SIIActivitySearch(catalog)
+    return _activity_search
@@ -0,0 +1,264 @@
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from apps.models import BackgroundJob
+
+logger = logging.getLogger(__name__)
+
+# Job kind -> dotted path of the function that runs it with the job payload
+# as keyword arguments.
+JOB_HANDLERS = {
+    "sync_bank_movements": "apps.bank_scraper.sync_bank_movements",
+}
+
+
+class DatabaseJobQueue:
+    """
+    The `BackgroundJob` table is the queue: queued rows are claimed oldest
+    first with a conditional UPDATE, so several workers can poll it without
+    running a job twice and without row locks. Jobs left running by a dead
+    worker are taken back at most every third of JOB_LEASE_SECONDS (see
+    `requeue_expired_jobs`).
+    """
+
+    def __init__(self):
+        self._next_recovery = 0.0
+
+    def push(self, job: BackgroundJob):
+        # Saving the row already queued it.
+        pass
+
+    def pop(self) -> Optional[BackgroundJob]:
+        if time.monotonic() >= self._next_recovery:
+            self._next_recovery = time.monotonic() + settings.JOB_LEASE_SECONDS / 3
+            requeue_expired_jobs()
+        candidates = (
+            BackgroundJob.objects.filter(status=BackgroundJob.STATUS_QUEUED)
+            .order_by("id")
+            .values_list("id", flat=True)[:10]
+        )
+        for job_id in candidates:
+            if _claim(job_id):
+                return BackgroundJob.objects.get(pk=job_id)
+        return None
+
+
+class InMemoryJobQueue:
+    """
+    Process-local queue for tests and single-process setups. Job rows are
+    still written, so status polling works the same, but only a worker in
+    this process sees the jobs.
+    """
+
+    def __init__(self):
+        self._job_ids = deque()
+        self._lock = threading.Lock()
+
+    def push(self, job: BackgroundJob):
+        with self._lock:
+            self._job_ids.append(job.id)
+
+    def pop(self) -> Optional[BackgroundJob]:
+        while True:
+            with self._lock:
+                if not self._job_ids:
+                    return None
+                job_id = self._job_ids.popleft()
+            if _claim(job_id):
+                return BackgroundJob.objects.get(pk=job_id)
+
+    def clear(self):
+        with self._lock:
+            self._job_ids.clear()
+
+
+def _claim(job_id: int) -> bool:
+    now = timezone.now()
+    return bool(
+        BackgroundJob.objects.filter(pk=job_id, status=BackgroundJob.STATUS_QUEUED).update(
+            status=BackgroundJob.STATUS_RUNNING,
+            started_at=now,
+            heartbeat_at=now,
+            attempts=F("attempts") + 1,
+        )
+    )
+
+
+def requeue_expired_jobs() -> int:
+    """
+    Queue again the running jobs whose worker sent no heartbeat within
+    JOB_LEASE_SECONDS, or mark them failed once they were claimed
+    JOB_MAX_ATTEMPTS times. Returns how many were taken back.
+    """
+    now = timezone.now()
+    expired = BackgroundJob.objects.filter(
+        Q(heartbeat_at__lt=now - timedelta(seconds=settings.JOB_LEASE_SECONDS))
+        | Q(heartbeat_at__isnull=True),
+        status=BackgroundJob.STATUS_RUNNING,
+    )
+    failed = expired.filter(attempts__gte=settings.JOB_MAX_ATTEMPTS).update(
+        status=BackgroundJob.STATUS_FAILED,
+        error="Worker lost; attempts exhausted",
+        finished_at=now,
+        updated_at=now,
+    )
+    requeued = expired.update(status=BackgroundJob.STATUS_QUEUED, updated_at=now)
+    if failed or requeued:
+        logger.warning("Took back %s expired jobs, %s failed for good", requeued, failed)
+    return requeued
+
+
+_queue = None
+_queue_lock = threading.Lock()
+
+
+def get_job_queue():
+    """
+    Process-wide instance of `settings.JOB_QUEUE_BACKEND`.
+    """
+    global _queue
+    if _queue is None:
+        with _queue_lock:
+            if _queue is None:
+                _queue = import_string(settings.JOB_QUEUE_BACKEND)()
+    return _queue
+
+
+def enqueue(kind: str, payload: Optional[Dict[str, Any]] = None, user=None) -> BackgroundJob:
+    """
+    Record a job and hand it to the queue once the surrounding transaction
+    commits, so a worker never picks up a job whose data it cannot see yet.
+    """
+    if kind not in JOB_HANDLERS:
+        raise Exception(f"Unknown job kind: {kind}")
+    job = BackgroundJob.objects.create(kind=kind, payload=payload or {}, user=user)
+    transaction.on_commit(lambda: get_job_queue().push(job))
+    return job
+
+
+def run_job(job: BackgroundJob):
+    """
+    Run a claimed job and store its outcome and finish time.
+    """
+    try:
+        import_string(JOB_HANDLERS[job.kind])(**job.payload)
+    except Exception as e:
+        logger.exception("Job %s (%s) failed", job.id, job.kind)
+        job.status = BackgroundJob.STATUS_FAILED
+        job.error = str(e)
+    else:
+        job.status = BackgroundJob.STATUS_SUCCEEDED
+    job.finished_at = timezone.now()
+    job.save(update_fields=["status", "error", "finished_at", "updated_at"])
+    logger.info(
+        "Job %s (%s) %s: waited %.2f s, ran %.2f s",
+        job.id,
+        job.kind,
+        job.status,
+        job.wait_seconds,
+        job.run_seconds,
+    )
+
+
+class JobWorker:
+    """
+    Pulls jobs from the queue and runs at most `concurrency` of them at once
+    in threads. Each thread closes its database connection after a job.
+    `jobs_started` counts the jobs handed to a thread so far.
+    """
+
+    def __init__(self, queue=None, concurrency: Optional[int] = None, poll_interval: Optional[float] = None):
+        self.queue = queue or get_job_queue()
+        self.concurrency = concurrency or settings.JOB_WORKER_CONCURRENCY
+        self.poll_interval = (
+            settings.JOB_POLL_INTERVAL if poll_interval is None else poll_interval
+        )
+        self._slots = threading.BoundedSemaphore(self.concurrency)
+        self._stopping = threading.Event()
+        self._running_ids = set()
+        self._running_lock = threading.Lock()
+        self.jobs_started = 0
+
+    def stop(self):
+        self._stopping.set()
+
+    def run(self, until_idle: bool = False):
+        """
+        Process jobs until `stop()` is called or, with `until_idle`, until the
+        queue is empty and every started job has finished.
+        """
+        finished = threading.Event()
+        heartbeat = threading.Thread(
+            target=self._heartbeat, args=(finished,), name="job-heartbeat", daemon=True
+        )
+        heartbeat.start()
+        try:
+            with ThreadPoolExecutor(
+                max_workers=self.concurrency, thread_name_prefix="job"
+            ) as executor:
+                while not self._stopping.is_set():
+                    self._slots.acquire()
+                    job = self.queue.pop()
+                    if job is None:
+                        self._slots.release()
+                        if until_idle and self._idle():
+                            break
+                        self._stopping.wait(self.poll_interval)
+                        continue
+                    with self._running_lock:
+                        self._running_ids.add(job.id)
+                    executor.submit(self._run, job)
+                    self.jobs_started += 1
+        finally:
+            finished.set()
+            heartbeat.join()
+
+    def _heartbeat(self, finished: threading.Event):
+        # Renews the lease of every job running here, so only the jobs of a
+        # dead worker expire.
+        try:
+            while not finished.wait(settings.JOB_LEASE_SECONDS / 3):
+                with self._running_lock:
+                    job_ids = list(self._running_ids)
+                if not job_ids:
+                    continue
+                try:
+                    BackgroundJob.objects.filter(
+                        id__in=job_ids, status=BackgroundJob.STATUS_RUNNING
+                    ).update(heartbeat_at=timezone.now())
+                except Exception:
+                    logger.exception("Job heartbeat failed")
+                    connection.close()
+        finally:
+            connection.close()
+
+    def _idle(self) -> bool:
+        # Every slot free means no job is running.
+        acquired = 0
+        try:
+            while acquired < self.concurrency and self._slots.acquire(blocking=False):
+                acquired += 1
+            return acquired == self.concurrency
+        finally:
+            for _ in range(acquired):
+                self._slots.release()
+
+    def _run(self, job: BackgroundJob):
+        try:
+            run_job(job)
+        finally:
+            with self._running_lock:
+                self._running_ids.discard(job.id)
+            connection.close()
+            self._slots.release()
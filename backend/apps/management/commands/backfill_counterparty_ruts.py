@@ -0,0 +1,49 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.dashboard_cache import bump_data_version
+from apps.helpers import extract_ruts
+from apps.models import BankMovement
+
+
+class Command(BaseCommand):
+    help = (
+        "Fill BankMovement.counterparty_rut for movements imported before it was "
+        "extracted at import time, in chunks ordered by id"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=2000)
+        parser.add_argument(
+            "--all", action="store_true", help="recompute movements that already have one"
+        )
+
+    def handle(self, *args, **options):
+        movements = BankMovement.objects.order_by("id")
+        if not options["all"]:
+            movements = movements.filter(counterparty_rut__isnull=True)
+        last_id = 0
+        updated = 0
+        start = time.perf_counter()
+        while True:
+            chunk = list(
+                movements.filter(id__gt=last_id).values_list("id", "observation", "bank_account_id")[
+                    : options["chunk_size"]
+                ]
+            )
+            if not chunk:
+                break
+            counterparty_ruts = extract_ruts([observation for _, observation, _ in chunk])
+            BankMovement.objects.bulk_update(
+                [
+                    BankMovement(id=movement_id, counterparty_rut=counterparty_rut)
+                    for (movement_id, _, _), counterparty_rut in zip(chunk, counterparty_ruts)
+                ],
+                ["counterparty_rut"],
+            )
+            bump_data_version(bank_account_id for _, _, bank_account_id in chunk)
+            last_id = chunk[-1][0]
+            updated += len(chunk)
+            self.stdout.write(f"{updated} movements updated, last id {last_id}")
+        self.stdout.write(f"Done: {updated} movements in {time.perf_counter() - start:.1f} s")
@@ -0,0 +1,100 @@
+import os
+import random
+import time
+from collections import Counter
+
+from django.core.management.base import BaseCommand
+from django.test.utils import override_settings
+
+from apps.integrations.activity_classifier import ActivityClassifier
+from apps.integrations.bedrock_clients import close_bedrock_clients
+from apps.integrations.fake_bedrock import FakeBedrockServer
+from apps.integrations.sii_catalog import get_catalog
+
+FREE_TEXT = (
+    "vendo {} en la feria",
+    "hago {} por encargo",
+    "me dedico a {} desde mi casa",
+    "ayudo a mis vecinos con {}",
+)
+TOPICS = (
+    "empanadas", "ropa usada", "uñas", "clases de guitarra", "fletes",
+    "reparación de bicicletas", "tortas", "jardinería", "peluquería canina",
+    "artesanía en cuero", "mermeladas", "fotografía de eventos",
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Descriptions/s of one-by-one classification vs classify_batch, "
+        "against a local fake Bedrock"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--descriptions", type=int, default=300)
+        parser.add_argument("--latency", type=float, default=0.5, help="fake model latency (s)")
+        parser.add_argument("--concurrency", type=int, default=4)
+        parser.add_argument("--batch-size", type=int, default=10)
+        parser.add_argument("--seed", type=int, default=0)
+
+    def handle(self, *args, **options):
+        os.environ.setdefault("AWS_ACCESS_KEY_ID", "bench")
+        os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "bench")
+        descriptions = self.workload(options["descriptions"], random.Random(options["seed"]))
+        self.stdout.write(
+            f"{len(descriptions)} descriptions, {len(set(descriptions))} distinct, "
+            f"model latency {options['latency'] * 1000:.0f} ms"
+        )
+
+        with FakeBedrockServer(latency=options["latency"]) as server:
+            with override_settings(BEDROCK_ENDPOINT_URL=server.endpoint_url):
+                close_bedrock_clients()
+                # The guidance cache is off so both runs do the same work.
+                classifier = ActivityClassifier(use_cache=False)
+
+                sample = descriptions[: min(len(descriptions), 20)]
+                requests_before = server.requests
+                start = time.perf_counter()
+                for description in sample:
+                    classifier.classify(description)
+                elapsed = time.perf_counter() - start
+                self.stdout.write(
+                    f"one by one: {len(sample) / elapsed:.1f} descriptions/s "
+                    f"({server.requests - requests_before} model calls for {len(sample)})"
+                )
+
+                requests_before = server.requests
+                start = time.perf_counter()
+                results = classifier.classify_batch(
+                    descriptions,
+                    concurrency=options["concurrency"],
+                    batch_size=options["batch_size"],
+                )
+                elapsed = time.perf_counter() - start
+                sources = Counter(
+                    "error" if isinstance(result, Exception) else result.source for result in results
+                )
+                self.stdout.write(
+                    f"batch: {len(descriptions) / elapsed:.1f} descriptions/s "
+                    f"({server.requests - requests_before} model calls, {dict(sources)})"
+                )
+                close_bedrock_clients()
+
+    @staticmethod
+    def workload(count, rng):
+        """
+        A third catalog names (lexical fast path), the rest free text with
+        repeats and case/punctuation variants, as in an onboarding import.
+        """
+        activities = get_catalog().activities
+        descriptions = []
+        for _ in range(count):
+            roll = rng.random()
+            if roll < 0.33:
+                descriptions.append(rng.choice(activities).description.lower())
+            else:
+                description = rng.choice(FREE_TEXT).format(rng.choice(TOPICS))
+                if roll > 0.9:
+                    description = description.capitalize() + "!"
+                descriptions.append(description)
+        return descriptions
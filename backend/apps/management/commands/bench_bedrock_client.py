@@ -0,0 +1,55 @@
+import os
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.integrations.bedrock_chat_sii_rubro import BedRockLLM
+from apps.integrations.bedrock_clients import (
+    _create_client,
+    close_bedrock_clients,
+    get_bedrock_client,
+)
+from apps.integrations.fake_bedrock import FakeBedrockServer
+
+
+class Command(BaseCommand):
+    help = "Per-call overhead of a fresh Bedrock client vs the pooled registry, against a local stub"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--calls", type=int, default=200)
+
+    def handle(self, *args, **options):
+        # The stub ignores signatures, but botocore still needs credentials.
+        os.environ.setdefault("AWS_ACCESS_KEY_ID", "bench")
+        os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "bench")
+
+        with FakeBedrockServer() as server:
+            region = "us-east-1"
+
+            def fresh_clients():
+                # Previous behaviour: the mutation and ask_activity_guidance
+                # each built their own client.
+                _create_client(region, server.endpoint_url)
+                llm = BedRockLLM.for_activity_guidance()
+                llm.client = _create_client(region, server.endpoint_url)
+                llm.chat("hola", store_history=False)
+
+            def pooled_client():
+                llm = BedRockLLM.for_activity_guidance()
+                llm.client = get_bedrock_client(region, server.endpoint_url)
+                llm.chat("hola", store_history=False)
+
+            close_bedrock_clients()
+            for label, call in (("fresh client per call", fresh_clients), ("pooled client", pooled_client)):
+                call()  # warm-up: imports, endpoint metadata, first connection
+                timings = []
+                for _ in range(options["calls"]):
+                    start = time.perf_counter()
+                    call()
+                    timings.append((time.perf_counter() - start) * 1000)
+                self.stdout.write(
+                    f"{label}: mean {statistics.mean(timings):.2f} ms, "
+                    f"p50 {statistics.median(timings):.2f} ms per call over {options['calls']} calls"
+                )
+            close_bedrock_clients()
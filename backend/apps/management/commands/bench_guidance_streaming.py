@@ -0,0 +1,59 @@
+import os
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.helpers.read_guidline import ReadGuidance
+from apps.integrations.bedrock_chat_sii_rubro import BedRockLLM
+from apps.integrations.bedrock_clients import close_bedrock_clients, get_bedrock_client
+from apps.integrations.fake_bedrock import DEFAULT_COMPLETION, FakeBedrockServer
+
+# Models tend to explain their pick after the list; none of it is used.
+TRAILING_PROSE = (
+    " Elegí este rubro porque la descripción menciona la venta directa de"
+    " productos frescos a consumidores finales en un local o feria, lo que"
+    " corresponde al comercio minorista especializado y no a la venta al por"
+    " mayor ni al cultivo de los productos." * 4
+)
+
+
+class Command(BaseCommand):
+    help = "Latency and streamed words of full vs early-stopped streaming guidance, against a local fake Bedrock"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--calls", type=int, default=10)
+        parser.add_argument("--token-latency", type=float, default=0.01)
+
+    def handle(self, *args, **options):
+        os.environ.setdefault("AWS_ACCESS_KEY_ID", "bench")
+        os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "bench")
+        completion = DEFAULT_COMPLETION + TRAILING_PROSE
+
+        with FakeBedrockServer(
+            respond=lambda prompt: completion, token_latency=options["token_latency"]
+        ) as server:
+            llm = BedRockLLM.for_activity_guidance()
+            llm.client = get_bedrock_client(endpoint_url=server.endpoint_url)
+            modes = (
+                ("full stream", lambda: llm.chat_stream("hola", store_history=False)),
+                (
+                    "stop at guidance list",
+                    lambda: llm.chat_stream(
+                        "hola", stop_when=ReadGuidance.find_guidance_list, store_history=False
+                    ),
+                ),
+            )
+            for label, call in modes:
+                timings = []
+                chunks_before = server.streamed_chunks
+                for _ in range(options["calls"]):
+                    start = time.perf_counter()
+                    text = call()
+                    timings.append((time.perf_counter() - start) * 1000)
+                chunks = (server.streamed_chunks - chunks_before) / options["calls"]
+                self.stdout.write(
+                    f"{label}: p50 {statistics.median(timings):.0f} ms, max {max(timings):.0f} ms, "
+                    f"~{chunks:.0f} words sent per call, answer {ReadGuidance.extract_guidance_list(text)}"
+                )
+        close_bedrock_clients()
@@ -0,0 +1,85 @@
+import json
+import time
+import tracemalloc
+
+from django.core.management.base import BaseCommand
+
+from apps.bank_scraper import ParsedMovements, SantanderScraper
+from apps.integrations.fake_santander import fake_movements
+from apps.integrations.json_stream import JsonArrayStream
+from apps.models import BankAccount
+
+ACCOUNT_NUMBER = "000100000001"
+
+
+def synthetic_body(templates, movements: int, chunk_size: int):
+    """
+    A movements response of `movements` items, cycling over `templates`
+    with increasing movement numbers, generated lazily and cut in
+    `chunk_size` byte chunks like `response.iter_content` does.
+    """
+    buffer = bytearray(b'{"movements":[')
+    for number in range(1, movements + 1):
+        if number > 1:
+            buffer += b","
+        item = dict(templates[number % len(templates)], movementNumber=str(number))
+        buffer += json.dumps(item).encode()
+        if len(buffer) >= chunk_size:
+            yield bytes(buffer[:chunk_size])
+            del buffer[:chunk_size]
+    buffer += b'],"pagination":{}}'
+    while buffer:
+        yield bytes(buffer[:chunk_size])
+        del buffer[:chunk_size]
+
+
+class Command(BaseCommand):
+    help = (
+        "Peak memory and time of parsing a synthetic movements response whole "
+        "(response.json(), one list of movements) vs streamed in insert-sized batches"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--movements", type=int, default=100_000)
+        parser.add_argument("--chunk-size", type=int, default=64 * 1024, help="bytes per read")
+        parser.add_argument("--batch-size", type=int, default=1000, help="movements per insert")
+
+    def handle(self, *args, **options):
+        # Not saved: nothing is inserted, the insert batches are only dropped.
+        bank_account = BankAccount(account_number=ACCOUNT_NUMBER, bank="Santander")
+        templates = fake_movements(ACCOUNT_NUMBER, 0, 1000)
+        for label, parse in (("whole body", self.parse_whole), ("streamed", self.parse_streamed)):
+            arguments = (templates, options["movements"], options["chunk_size"])
+            start = time.perf_counter()
+            parsed = parse(synthetic_body(*arguments), bank_account, options["batch_size"])
+            elapsed = time.perf_counter() - start
+            # Timed and traced separately: tracemalloc slows allocation-heavy
+            # code several times over.
+            tracemalloc.start()
+            parse(synthetic_body(*arguments), bank_account, options["batch_size"])
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            self.stdout.write(
+                f"{label}: {parsed.new} movements in {elapsed:.2f} s, "
+                f"peak {peak / 2**20:.1f} MiB"
+            )
+
+    @staticmethod
+    def parse_whole(chunks, bank_account, batch_size):
+        # What `response.json()` plus one bulk_create of the page does.
+        body = json.loads(b"".join(chunks))
+        return SantanderScraper.parse_movements(body["movements"], bank_account)
+
+    @staticmethod
+    def parse_streamed(chunks, bank_account, batch_size):
+        parsed = ParsedMovements()
+        batch = []
+        for movement in JsonArrayStream(chunks, "movements"):
+            batch.append(movement)
+            if len(batch) >= batch_size:
+                SantanderScraper.parse_movements(batch, bank_account, parsed)
+                parsed.movements.clear()
+                batch = []
+        SantanderScraper.parse_movements(batch, bank_account, parsed)
+        parsed.movements.clear()
+        return parsed
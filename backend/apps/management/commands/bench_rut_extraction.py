@@ -0,0 +1,100 @@
+import importlib.util
+import random
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.helpers import extract_ruts, retrieve_counterparty_rut, rut_cache
+from apps.helpers.get_master_entity_from_description import NationalIdentifier
+
+
+def synthetic_observations(count: int, distinct: int = 0, seed: int = 0):
+    """
+    Movement observations in the shapes seen in Santander exports: RUT first
+    (zero padded, with or without a right check digit), RUT after the first
+    14 characters, formatted RUTs and descriptions without one. With
+    `distinct`, the observations are drawn from that many different ones,
+    like senders that transfer every month.
+    """
+    if distinct:
+        pool = synthetic_observations(distinct, seed=seed)
+        rng = random.Random(seed)
+        return [rng.choice(pool) for _ in range(count)]
+    rng = random.Random(seed)
+    observations = []
+    for number in range(count):
+        rut = str(rng.randrange(1_000_000, 99_999_999))
+        dv = NationalIdentifier.calculate_verificator(rut)
+        if rng.random() < 0.1:
+            dv = rng.choice("0123456789K")
+        shape = rng.randrange(6)
+        if shape == 0:
+            observations.append(f"{int(rut):010d}{dv} Transf. de cliente {number}")
+        elif shape == 1:
+            observations.append(f"Transf Intern {rut}-{dv} {number % 97}")
+        elif shape == 2:
+            observations.append(f"{int(rut):,}-{dv} Transf".replace(",", "."))
+        elif shape == 3:
+            observations.append(f"Pago PAC Seguro {number}")
+        elif shape == 4:
+            observations.append(f"0000{rut}{dv.lower()}kk Abono")
+        else:
+            observations.append(f"Compra tarjeta {rng.randrange(10_000)} local {number}")
+    return observations
+
+
+class Command(BaseCommand):
+    help = (
+        "Time RUT extraction over synthetic movement observations: one "
+        "NationalIdentifier per row vs the batch extract_ruts (NumPy and pure Python), "
+        "without and with the RUT cache"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--observations", type=int, default=1_000_000)
+        parser.add_argument("--batch-size", type=int, default=10_000)
+        parser.add_argument(
+            "--distinct", type=int, default=50_000, help="different observations; 0 for all"
+        )
+
+    def handle(self, *args, **options):
+        observations = synthetic_observations(options["observations"], options["distinct"])
+        batch_size = options["batch_size"]
+        modes = [
+            (
+                "per row",
+                lambda: [retrieve_counterparty_rut(obs, use_cache=False) for obs in observations],
+            ),
+        ]
+        if importlib.util.find_spec("numpy") is not None:
+            modes.append(
+                ("batch, numpy", lambda: self.batched(observations, batch_size, True, False))
+            )
+        modes += [
+            ("batch, pure python", lambda: self.batched(observations, batch_size, False, False)),
+            ("per row, cached", lambda: [retrieve_counterparty_rut(obs) for obs in observations]),
+            ("batch, cached", lambda: self.batched(observations, batch_size, False, True)),
+        ]
+        reference = None
+        for label, extract in modes:
+            rut_cache.clear()
+            start = time.perf_counter()
+            ruts = extract()
+            elapsed = time.perf_counter() - start
+            if reference is None:
+                reference = ruts
+            mismatches = sum(rut != expected for rut, expected in zip(ruts, reference))
+            cache = rut_cache.stats()
+            self.stdout.write(
+                f"{label}: {elapsed:.2f} s, {len(ruts) / elapsed:,.0f} observations/s, "
+                f"{sum(map(bool, ruts))} RUTs, {mismatches} differ from per row"
+                + (f", cache hit ratio {cache['hit_ratio']:.1%}" if "cached" in label else "")
+            )
+        rut_cache.clear()
+
+    @staticmethod
+    def batched(observations, batch_size, use_numpy, use_cache):
+        ruts = []
+        for start in range(0, len(observations), batch_size):
+            ruts += extract_ruts(observations[start : start + batch_size], use_numpy, use_cache)
+        return ruts
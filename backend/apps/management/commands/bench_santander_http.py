@@ -0,0 +1,117 @@
+import os
+import statistics
+import time
+from types import SimpleNamespace
+
+import requests
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.test.utils import override_settings
+
+from apps.bank_scraper import SantanderScraper
+from apps.integrations.fake_santander import FakeSantanderServer
+from apps.integrations.santander_http import close_santander_sessions
+
+
+class Command(BaseCommand):
+    help = (
+        "Per-request latency and connections opened by bare requests.post vs the "
+        "pooled Santander sessions, against a local fake of the three endpoints"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--syncs", type=int, default=20)
+        parser.add_argument("--accounts", type=int, default=3)
+        parser.add_argument("--latency", type=float, default=0.0, help="fake bank latency (s)")
+        parser.add_argument("--no-tls", action="store_true", help="serve plain HTTP")
+
+    def handle(self, *args, **options):
+        with FakeSantanderServer(
+            latency=options["latency"], accounts=options["accounts"], tls=not options["no_tls"]
+        ) as server:
+            previous_bundle = os.environ.get("REQUESTS_CA_BUNDLE")
+            if server.ca_bundle:
+                os.environ["REQUESTS_CA_BUNDLE"] = server.ca_bundle
+            try:
+                with override_settings(**server.settings_overrides):
+                    close_santander_sessions()
+                    modes = (
+                        ("bare requests.post", self.bare_sync),
+                        ("pooled sessions", self.pooled_sync),
+                    )
+                    for label, sync in modes:
+                        connections_before = server.connections
+                        requests_before = server.requests
+                        timings = []
+                        start = time.perf_counter()
+                        for _ in range(options["syncs"]):
+                            sync(timings)
+                        elapsed = time.perf_counter() - start
+                        self.stdout.write(
+                            f"{label}: {elapsed / options['syncs'] * 1000:.1f} ms per sync, "
+                            f"request p50 {statistics.median(timings):.2f} ms, "
+                            f"{server.requests - requests_before} requests over "
+                            f"{server.connections - connections_before} connections"
+                        )
+                    close_santander_sessions()
+            finally:
+                if previous_bundle is None:
+                    os.environ.pop("REQUESTS_CA_BUNDLE", None)
+                else:
+                    os.environ["REQUESTS_CA_BUNDLE"] = previous_bundle
+
+    @staticmethod
+    def timed(timings, call, *args, **kwargs):
+        start = time.perf_counter()
+        result = call(*args, **kwargs)
+        timings.append((time.perf_counter() - start) * 1000)
+        return result
+
+    def pooled_sync(self, timings):
+        credentials = SimpleNamespace(
+            pk=None,
+            rut="12345678",
+            password="secret",
+            decrypted_password="secret",
+            login_failures=0,
+        )
+        # Log in every time, like the bare sync: cached tokens would skip the request.
+        access_token, jwt_token = self.timed(
+            timings, SantanderScraper.fetch_login_tokens, credentials, use_cache=False
+        )
+        accounts, _ = self.timed(timings, SantanderScraper.fetch_bank_accounts, jwt_token, credentials.rut)
+        for account in accounts:
+            self.timed(
+                timings,
+                SantanderScraper.fetch_bank_movements,
+                access_token,
+                f"{account['OFICINACONTRATO']}{account['NUMEROCONTRATO']}",
+            )
+
+    def bare_sync(self, timings):
+        # What the scraper did before: a fresh connection and header dict per call.
+        def post(url, headers, **kwargs):
+            return requests.post(url, headers=dict(headers), **kwargs)
+
+        tokens = self.timed(
+            timings,
+            post,
+            settings.SANTANDER_TOKEN_URL,
+            SantanderScraper.LOGIN_HEADERS,
+            data="username=0012345678",
+        ).json()
+        accounts = self.timed(
+            timings,
+            post,
+            settings.SANTANDER_ACCOUNTS_URL,
+            {**SantanderScraper.ACCOUNTS_HEADERS, "access-token": tokens["tokenJWT"]},
+            json={},
+        ).json()["DATA"]["OUTPUT"]["MATRICES"]["MATRIZCAPTACIONES"]["e1"]
+        for account in accounts:
+            self.timed(
+                timings,
+                post,
+                settings.SANTANDER_MOVEMENTS_URL,
+                {**SantanderScraper.MOVEMENTS_HEADERS, "Authorization": f"Bearer {tokens['access_token']}"},
+                json={"accountId": f"{account['OFICINACONTRATO']}{account['NUMEROCONTRATO']}"},
+            )
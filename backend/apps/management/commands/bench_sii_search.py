@@ -0,0 +1,56 @@
+import statistics
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.integrations.sii_catalog import get_catalog
+from apps.integrations.sii_search import SIIActivitySearch
+
+SAMPLE_DESCRIPTIONS = [
+    "venta de frutas y verduras",
+    "vendo empanadas en la feria",
+    "clases particulares de matemáticas",
+    "La persona trabaja en la fabricación de muebles de madera.",
+    "peluquería a domicilio",
+    "desarrollo de software para empresas",
+    "soy gasfiter",
+    "vendo ropa usada por instagram",
+    "transporte escolar",
+    "arriendo departamentos amoblados",
+    "reparación de computadores",
+    "diseño gráfico freelance",
+]
+
+
+class Command(BaseCommand):
+    help = "Offline benchmark of the BM25 shortlist used to build activity guidance prompts"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--top-k", type=int, default=settings.SII_CANDIDATES_TOP_K)
+        parser.add_argument("--repeat", type=int, default=200)
+
+    def handle(self, *args, **options):
+        catalog = get_catalog()
+        start = time.perf_counter()
+        search = SIIActivitySearch(catalog)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        timings = []
+        prompt_sizes = []
+        for description in SAMPLE_DESCRIPTIONS:
+            for _ in range(options["repeat"]):
+                start = time.perf_counter()
+                results = search.search(description, k=options["top_k"])
+                timings.append((time.perf_counter() - start) * 1000)
+            prompt_sizes.append(len(catalog.to_prompt([activity for activity, _ in results] or None)))
+
+        full_prompt = len(catalog.to_prompt())
+        shortlist_prompt = statistics.median(prompt_sizes)
+        quantiles = statistics.quantiles(timings, n=100)
+        self.stdout.write(f"index build: {build_ms:.1f} ms over {len(catalog)} activities")
+        self.stdout.write(f"search p50: {quantiles[49]:.3f} ms, p95: {quantiles[94]:.3f} ms")
+        self.stdout.write(
+            f"catalog in prompt: {full_prompt} chars full, {shortlist_prompt:.0f} chars "
+            f"shortlisted (top {options['top_k']}, {full_prompt / shortlist_prompt:.0f}x smaller)"
+        )
@@ -0,0 +1,29 @@
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+
+from apps.integrations.sii_catalog import (
+    CATALOG_PATH,
+    RAW_CATALOG_PATH,
+    SIICatalog,
+    parse_sii_catalog,
+)
+
+
+class Command(BaseCommand):
+    help = "Parse the raw SII activity code dump into the structured catalog artifact"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--input", default=str(RAW_CATALOG_PATH))
+        parser.add_argument("--output", default=str(CATALOG_PATH))
+
+    def handle(self, *args, **options):
+        with open(options["input"], encoding="utf-8") as raw_file:
+            catalog = SIICatalog(parse_sii_catalog([raw_file.read()]))
+        catalog.save(path=Path(options["output"]))
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Wrote {len(catalog)} activities in {len(catalog.sections())} sections "
+                f"(version {catalog.version}) to {options['output']}"
+            )
+        )
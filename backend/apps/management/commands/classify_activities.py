@@ -0,0 +1,60 @@
+import csv
+import sys
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.integrations.activity_classifier import ActivityClassifier
+
+
+class Command(BaseCommand):
+    help = (
+        "Classify activity descriptions (one per line) into SII activities and "
+        "write them as CSV"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--input", help="file with one description per line (default: stdin)")
+        parser.add_argument("--output", help="CSV file to write (default: stdout)")
+        parser.add_argument("--concurrency", type=int, help="Bedrock prompts in flight")
+        parser.add_argument("--batch-size", type=int, help="descriptions per Bedrock prompt")
+        parser.add_argument("--mode", choices=["auto", "llm", "lexical"])
+
+    def handle(self, *args, **options):
+        if options["input"]:
+            with open(options["input"], encoding="utf-8") as input_file:
+                lines = input_file.read().splitlines()
+        else:
+            lines = sys.stdin.read().splitlines()
+        descriptions = [line.strip() for line in lines if line.strip()]
+
+        start = time.perf_counter()
+        results = ActivityClassifier(mode=options["mode"]).classify_batch(
+            descriptions,
+            concurrency=options["concurrency"],
+            batch_size=options["batch_size"],
+        )
+        elapsed = time.perf_counter() - start
+
+        output = open(options["output"], "w", encoding="utf-8", newline="") if options["output"] else self.stdout
+        try:
+            writer = csv.writer(output)
+            writer.writerow(["description", "code", "activity", "iva_code", "source", "error"])
+            failed = 0
+            for description, result in zip(descriptions, results):
+                if isinstance(result, Exception):
+                    failed += 1
+                    writer.writerow([description, "", "", "", "", str(result)])
+                else:
+                    writer.writerow(
+                        [description, result.code or "", result.activity, result.iva_code, result.source, ""]
+                    )
+        finally:
+            if options["output"]:
+                output.close()
+
+        rate = len(descriptions) / elapsed if elapsed else 0.0
+        self.stderr.write(
+            f"Classified {len(descriptions) - failed}/{len(descriptions)} descriptions "
+            f"in {elapsed:.2f} s ({rate:.1f} descriptions/s)"
+        )
@@ -0,0 +1,62 @@
+import asyncio
+import os
+import time
+
+from django.core.management.base import BaseCommand
+from django.test.utils import override_settings
+
+from apps.integrations.bedrock_chat_sii_rubro import BedRockLLM
+from apps.integrations.bedrock_clients import close_bedrock_clients
+from apps.integrations.fake_bedrock import FakeBedrockServer
+
+
+class Command(BaseCommand):
+    help = (
+        "Load test activity guidance against a local fake Bedrock: blocking calls "
+        "vs the async path at increasing concurrency on a single event loop"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=64)
+        parser.add_argument("--latency", type=float, default=0.25, help="fake model latency (s)")
+        parser.add_argument("--concurrency", default="1,4,16,32")
+
+    def handle(self, *args, **options):
+        os.environ.setdefault("AWS_ACCESS_KEY_ID", "loadtest")
+        os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "loadtest")
+        total = options["requests"]
+        levels = [int(level) for level in options["concurrency"].split(",")]
+
+        with FakeBedrockServer(latency=options["latency"]) as server:
+            with override_settings(BEDROCK_ENDPOINT_URL=server.endpoint_url):
+                close_bedrock_clients()
+                llm = BedRockLLM.for_activity_guidance()
+                llm.ask_activity_guidance("venta de frutas")  # warm-up
+
+                sequential = min(total, 8)
+                start = time.perf_counter()
+                for index in range(sequential):
+                    llm.ask_activity_guidance(f"venta de frutas {index}")
+                elapsed = time.perf_counter() - start
+                self.stdout.write(f"blocking: {sequential / elapsed:.1f} req/s")
+
+                for level in levels:
+                    elapsed = asyncio.run(self.run_async(total, level))
+                    self.stdout.write(
+                        f"async, {level} in flight: {total / elapsed:.1f} req/s "
+                        f"({total} requests in {elapsed:.2f} s)"
+                    )
+                close_bedrock_clients()
+
+    async def run_async(self, total, concurrency):
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def one(index):
+            async with semaphore:
+                await BedRockLLM.for_activity_guidance().aask_activity_guidance(
+                    f"venta de frutas {index}"
+                )
+
+        start = time.perf_counter()
+        await asyncio.gather(*(one(index) for index in range(total)))
+        return time.perf_counter() - start
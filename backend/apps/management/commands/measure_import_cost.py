@@ -0,0 +1,61 @@
+import json
+import os
+import subprocess
+import sys
+
+from django.core.management.base import BaseCommand
+
+# Runs in a fresh interpreter so nothing this process already imported skews
+# the numbers. Prints one JSON line with the measurements.
+PROBE = """
+import json, resource, sys, time
+start = time.perf_counter()
+import django
+django.setup()
+import {module}
+elapsed = time.perf_counter() - start
+from apps.integrations import sii_catalog
+print(json.dumps({{
+    "seconds": elapsed,
+    "max_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    "modules": len(sys.modules),
+    "heavy_modules": sorted(name for name in {heavy} if name in sys.modules),
+    "catalog_loaded": sii_catalog._catalog is not None,
+}}))
+"""
+
+HEAVY_MODULES = ("boto3", "botocore", "openai", "numpy")
+
+
+class Command(BaseCommand):
+    help = "Measure worker cold start: import time and memory of the GraphQL schema and URLconf"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "modules",
+            nargs="*",
+            default=["django_template.schema", "django_template.urls"],
+        )
+        parser.add_argument("--runs", type=int, default=5)
+
+    def handle(self, *args, **options):
+        for module in options["modules"]:
+            samples = [self.probe(module) for _ in range(options["runs"])]
+            best = min(samples, key=lambda sample: sample["seconds"])
+            self.stdout.write(
+                f"{module}: {best['seconds'] * 1000:.0f} ms (best of {options['runs']}), "
+                f"max RSS {best['max_rss_kb'] / 1024:.1f} MiB, {best['modules']} modules, "
+                f"heavy: {', '.join(best['heavy_modules']) or 'none'}, "
+                f"SII catalog loaded: {'yes' if best['catalog_loaded'] else 'no'}"
+            )
+
+    def probe(self, module):
+        code = PROBE.format(module=module, heavy=repr(HEAVY_MODULES))
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            check=True,
+            capture_output=True,
+            text=True,
+            env=os.environ.copy(),
+        ).stdout
+        return json.loads(output.strip().splitlines()[-1])
@@ -0,0 +1,20 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.payer_counts import rebuild_payer_counts
+
+
+class Command(BaseCommand):
+    help = (
+        "Recount the distinct payers of every month and semester from the stored "
+        "movements (after backfill_counterparty_ruts, or to repair the counts)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--user", type=int, action="append", help="user id; repeatable")
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        rebuild_payer_counts(options["user"])
+        self.stdout.write(f"Payer counts rebuilt in {time.perf_counter() - start:.1f} s")
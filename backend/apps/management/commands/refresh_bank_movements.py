@@ -0,0 +1,56 @@
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from apps.bank_refresh import refresh_shard, sync_lag
+
+
+class Command(BaseCommand):
+    help = (
+        "Sync the movements of every user not refreshed within "
+        "SANTANDER_REFRESH_INTERVAL, optionally one shard of users per worker"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--shard", type=int, default=0)
+        parser.add_argument("--shards", type=int, default=1)
+        parser.add_argument("--concurrency", type=int, help="users synced at once")
+        parser.add_argument(
+            "--min-interval", type=int, help="skip accounts synced within this many seconds"
+        )
+        parser.add_argument(
+            "--enqueue", action="store_true", help="hand the syncs to the run_jobs workers"
+        )
+        parser.add_argument(
+            "--every", type=int, help="keep running, starting a refresh every N seconds"
+        )
+
+    def handle(self, *args, **options):
+        if not 0 <= options["shard"] < options["shards"]:
+            raise Exception("--shard must be between 0 and --shards - 1")
+        min_interval = (
+            timedelta(seconds=options["min_interval"]) if options["min_interval"] else None
+        )
+        while True:
+            started = time.monotonic()
+            run = refresh_shard(
+                shard=options["shard"],
+                shards=options["shards"],
+                concurrency=options["concurrency"],
+                min_interval=min_interval,
+                use_queue=options["enqueue"],
+            )
+            lag = sync_lag()
+            self.stdout.write(
+                f"Shard {run.shard}/{run.shards}: {run.due} due, {run.skipped} fresh, "
+                f"{run.in_progress} already syncing, {run.backing_off} backing off after rejected logins, "
+                f"{run.synced} synced, {run.failed} failed, {run.enqueued} enqueued, "
+                f"{run.new_movements} new movements in {run.duration_seconds:.1f} s "
+                f"({run.credentials_per_second:.2f} users/s, {run.movements_per_second:.1f} movements/s); "
+                f"lag: {lag['stale_accounts']} stale and {lag['never_synced_accounts']} never synced "
+                f"of {lag['accounts']} accounts, oldest sync {lag['max_lag_seconds']:.0f} s ago"
+            )
+            if not options["every"]:
+                break
+            time.sleep(max(0, options["every"] - (time.monotonic() - started)))
@@ -0,0 +1,23 @@
+import signal
+
+from django.core.management.base import BaseCommand
+
+from apps.jobs import JobWorker
+
+
+class Command(BaseCommand):
+    help = "Run background jobs (bank syncs) from the job queue"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--concurrency", type=int, help="jobs run at once by this worker")
+        parser.add_argument("--poll-interval", type=float, help="seconds between polls of an empty queue")
+        parser.add_argument("--until-idle", action="store_true", help="exit once the queue is empty")
+
+    def handle(self, *args, **options):
+        worker = JobWorker(concurrency=options["concurrency"], poll_interval=options["poll_interval"])
+        # Finish the running jobs, then exit.
+        signal.signal(signal.SIGTERM, lambda *_: worker.stop())
+        signal.signal(signal.SIGINT, lambda *_: worker.stop())
+        self.stdout.write(f"Job worker started (concurrency {worker.concurrency})")
+        worker.run(until_idle=options["until_idle"])
+        self.stdout.write(f"Job worker stopped after {worker.jobs_started} jobs")
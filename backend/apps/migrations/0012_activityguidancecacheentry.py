@@ -0,0 +1,34 @@
+# Generated by Django 5.1.3 on 2026-10-18 14:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('apps', '0011_alter_bankingcredentials_password'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ActivityGuidanceCacheEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('key', models.CharField(max_length=64, unique=True)),
+                ('normalized_description', models.TextField()),
+                ('model_id', models.CharField(max_length=100)),
+                ('catalog_version', models.CharField(max_length=20)),
+                ('activity', models.CharField(max_length=1000)),
+                ('iva_code', models.CharField(max_length=20)),
+                ('code', models.CharField(blank=True, max_length=6, null=True)),
+                ('hits', models.PositiveIntegerField(default=0)),
+                ('last_used_at', models.DateTimeField(db_index=True)),
+                ('expires_at', models.DateTimeField(db_index=True)),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 5.1.3 on 2026-10-18 14:31
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('apps', '0013_backgroundjob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='bankaccount',
+            name='last_accounting_date',
+            field=models.DateField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='bankaccount',
+            name='last_movement_number',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='bankaccount',
+            name='last_synced_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.CreateModel(
+            name='BankSyncStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('synced_at', models.DateTimeField(db_index=True)),
+                ('new_movements', models.PositiveIntegerField(default=0)),
+                ('skipped_movements', models.PositiveIntegerField(default=0)),
+                ('failed_movements', models.PositiveIntegerField(default=0)),
+                ('error', models.TextField(blank=True, null=True)),
+                ('bank_account', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='sync_stats', to='apps.bankaccount')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+    ]
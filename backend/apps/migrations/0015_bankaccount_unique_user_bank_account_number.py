@@ -0,0 +1,66 @@
+# Generated by Django 5.1.3 on 2026-10-18 14:52
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Max, Min
+
+
+def merge_duplicate_accounts(apps, schema_editor):
+    """
+    Syncs used to look accounts up by holder name as well, so a name change
+    created a second row for the same account. Keep the oldest row, move
+    the movements and sync stats of the others onto it (dropping movements
+    it already has) and delete them.
+    """
+    BankAccount = apps.get_model("apps", "BankAccount")
+    BankMovement = apps.get_model("apps", "BankMovement")
+    BankSyncStats = apps.get_model("apps", "BankSyncStats")
+    duplicated = (
+        BankAccount.objects.filter(bank__isnull=False, account_number__isnull=False)
+        .values("user_id", "bank", "account_number")
+        .annotate(accounts=Count("id"), keep_id=Min("id"))
+        .filter(accounts__gt=1)
+    )
+    for group in duplicated:
+        accounts = BankAccount.objects.filter(
+            user_id=group["user_id"], bank=group["bank"], account_number=group["account_number"]
+        )
+        kept = accounts.get(id=group["keep_id"])
+        others = accounts.exclude(id=kept.id)
+        other_ids = list(others.values_list("id", flat=True))
+        # Every copy holds its movements up to its own cursor, so together
+        # they hold them up to the highest one.
+        merged = accounts.aggregate(
+            last_movement_number=Max("last_movement_number"),
+            last_accounting_date=Max("last_accounting_date"),
+            last_synced_at=Max("last_synced_at"),
+        )
+        for other_id in other_ids:
+            # One copy at a time: two copies may hold the same movement.
+            stored = BankMovement.objects.filter(bank_account=kept).values("movement_number")
+            BankMovement.objects.filter(bank_account_id=other_id).exclude(
+                movement_number__in=stored
+            ).update(bank_account=kept)
+            BankMovement.objects.filter(bank_account_id=other_id).delete()
+        BankSyncStats.objects.filter(bank_account_id__in=other_ids).update(bank_account=kept)
+        kept.full_name = accounts.order_by("-id").values_list("full_name", flat=True)[0]
+        for field, value in merged.items():
+            setattr(kept, field, value)
+        kept.save()
+        others.delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('apps', '0014_bank_sync_cursor'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_accounts, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='bankaccount',
+            constraint=models.UniqueConstraint(fields=('user', 'bank', 'account_number'), name='unique_user_bank_account_number'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.3 on 2026-10-18 14:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('apps', '0015_bankaccount_unique_user_bank_account_number'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='bankmovement',
+            name='counterparty_rut',
+            field=models.CharField(blank=True, db_index=True, max_length=12, null=True),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.1.3 on 2026-10-18 14:55
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('apps', '0016_bankmovement_counterparty_rut'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PayerCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('period', models.CharField(choices=[('month', 'Month'), ('semester', 'Semester')], max_length=10)),
+                ('period_start', models.DateField()),
+                ('distinct_payers', models.PositiveIntegerField(default=0)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('user', 'period', 'period_start'), name='unique_user_period_start')],
+            },
+        ),
+    ]
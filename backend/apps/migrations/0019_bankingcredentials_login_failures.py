@@ -0,0 +1,23 @@
+# Generated by Django 5.1.3 on 2026-10-18 15:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('apps', '0018_backgroundjob_lease'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='bankingcredentials',
+            name='last_login_failure_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='bankingcredentials',
+            name='login_failures',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
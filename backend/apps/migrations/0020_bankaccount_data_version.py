@@ -0,0 +1,32 @@
+# Generated by Django 5.1.3 on 2026-10-18 15:18
+
+from django.db import migrations, models
+from django.db.models import Max
+
+
+def start_above_sync_stats_ids(apps, schema_editor):
+    """
+    Dashboard results used to be keyed on the user's latest BankSyncStats
+    id. Start every account above all of those ids so no result cached
+    under the old scheme is read again.
+    """
+    BankAccount = apps.get_model("apps", "BankAccount")
+    BankSyncStats = apps.get_model("apps", "BankSyncStats")
+    latest_id = BankSyncStats.objects.aggregate(latest_id=Max("id"))["latest_id"] or 0
+    BankAccount.objects.update(data_version=latest_id + 1)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('apps', '0019_bankingcredentials_login_failures'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='bankaccount',
+            name='data_version',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(start_above_sync_stats_ids, migrations.RunPython.noop),
+    ]
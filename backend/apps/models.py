@@ -1,11 +1,18 @@
 from django.db import models
 from django.contrib.auth import get_user_model
 import os
+from functools import lru_cache
 from cryptography.fernet import Fernet
 
 key_str = os.getenv("ENCRYPTION_KEY")
 
 
+@lru_cache(maxsize=1)
+def get_fernet():
+    # Fernet derives its signing and encryption keys on construction.
+    return Fernet(key_str.encode())
+
+
 class BaseModel(models.Model):
     created_at = models.DateTimeField(auto_now=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -23,6 +30,9 @@ class BankMovement(BaseModel):
     movement_number = models.PositiveIntegerField()
     amount = models.IntegerField()
     bank_account = models.ForeignKey("apps.BankAccount", on_delete=models.PROTECT)
+    # RUT found in the observation at import; "" when there is none, null for
+    # rows imported before it was extracted (`manage.py backfill_counterparty_ruts`)
+    counterparty_rut = models.CharField(max_length=12, null=True, blank=True, db_index=True)
 
     class Meta:
         constraints = [
@@ -44,12 +54,15 @@ class BankingCredentials(BaseModel):
     rut = models.CharField(max_length=20)
     password = models.CharField(null=True, blank=True, max_length=300)
     bank = models.CharField(null=True, blank=True, max_length=30)
+    # Consecutive logins the bank rejected; scheduled refreshes back off
+    # from the last one (see apps.bank_refresh.due_credentials).
+    login_failures = models.PositiveIntegerField(default=0)
+    last_login_failure_at = models.DateTimeField(null=True, blank=True)
 
     @property
     def decrypted_password(self):
-        f = Fernet(key_str.encode())
         str_bytes = self.password.encode()
-        return f.decrypt(str_bytes).decode()
+        return get_fernet().decrypt(str_bytes).decode()
 
 
 class BankAccount(BaseModel):
@@ -57,9 +70,120 @@ class BankAccount(BaseModel):
     account_number = models.CharField(null=True, blank=True, max_length=30)
     user = models.ForeignKey(get_user_model(), on_delete=models.PROTECT)
     full_name = models.CharField(max_length=255)
+    # Sync cursor: movements at or below last_movement_number are already stored
+    last_movement_number = models.PositiveIntegerField(null=True, blank=True)
+    last_accounting_date = models.DateField(null=True, blank=True)
+    last_synced_at = models.DateTimeField(null=True, blank=True)
+    # Bumped whenever the account's movements are inserted or rewritten;
+    # cached dashboard results are keyed on it (apps.dashboard_cache).
+    data_version = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "bank", "account_number"],
+                name="unique_user_bank_account_number",
+            )
+        ]
+
+
+class BankSyncStats(BaseModel):
+    bank_account = models.ForeignKey(
+        "apps.BankAccount", on_delete=models.CASCADE, related_name="sync_stats"
+    )
+    synced_at = models.DateTimeField(db_index=True)
+    # Movements above the cursor, at or below it (or filtered out), and
+    # unparseable ones
+    new_movements = models.PositiveIntegerField(default=0)
+    skipped_movements = models.PositiveIntegerField(default=0)
+    failed_movements = models.PositiveIntegerField(default=0)
+    # Set when the account's movements could not be fetched at all
+    error = models.TextField(null=True, blank=True)
+
+
+class PayerCount(BaseModel):
+    """
+    Distinct payers (counterparty RUTs of incoming movements) of a user in a
+    calendar month or semester, recounted on import for the periods that
+    received movements (see `apps.payer_counts`).
+    """
+
+    PERIOD_MONTH = "month"
+    PERIOD_SEMESTER = "semester"
+    PERIOD_CHOICES = [
+        (PERIOD_MONTH, "Month"),
+        (PERIOD_SEMESTER, "Semester"),
+    ]
+
+    user = models.ForeignKey(get_user_model(), on_delete=models.CASCADE)
+    period = models.CharField(max_length=10, choices=PERIOD_CHOICES)
+    # First day of the month, or January 1st / July 1st
+    period_start = models.DateField()
+    distinct_payers = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "period", "period_start"],
+                name="unique_user_period_start",
+            )
+        ]
 
 
 class ProcessedServiceListing(BaseModel):
     user = models.ForeignKey(get_user_model(), on_delete=models.PROTECT)
     service_name = models.CharField(max_length=1000)
     amount = models.IntegerField()
+
+
+class ActivityGuidanceCacheEntry(BaseModel):
+    key = models.CharField(max_length=64, unique=True)
+    normalized_description = models.TextField()
+    model_id = models.CharField(max_length=100)
+    catalog_version = models.CharField(max_length=20)
+    activity = models.CharField(max_length=1000)
+    iva_code = models.CharField(max_length=20)
+    code = models.CharField(null=True, blank=True, max_length=6)
+    hits = models.PositiveIntegerField(default=0)
+    last_used_at = models.DateTimeField(db_index=True)
+    expires_at = models.DateTimeField(db_index=True)
+
+
+class BackgroundJob(BaseModel):
+    STATUS_QUEUED = "queued"
+    STATUS_RUNNING = "running"
+    STATUS_SUCCEEDED = "succeeded"
+    STATUS_FAILED = "failed"
+    STATUS_CHOICES = [
+        (STATUS_QUEUED, "Queued"),
+        (STATUS_RUNNING, "Running"),
+        (STATUS_SUCCEEDED, "Succeeded"),
+        (STATUS_FAILED, "Failed"),
+    ]
+
+    kind = models.CharField(max_length=100)
+    payload = models.JSONField(default=dict)
+    status = models.CharField(
+        max_length=20, choices=STATUS_CHOICES, default=STATUS_QUEUED, db_index=True
+    )
+    user = models.ForeignKey(get_user_model(), null=True, blank=True, on_delete=models.PROTECT)
+    error = models.TextField(null=True, blank=True)
+    enqueued_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    # Claims so far, and the last sign of life of the worker running it:
+    # a running job without one for JOB_LEASE_SECONDS is taken back.
+    attempts = models.PositiveIntegerField(default=0)
+    heartbeat_at = models.DateTimeField(null=True, blank=True)
+
+    @property
+    def wait_seconds(self):
+        if self.started_at is None:
+            return None
+        return (self.started_at - self.enqueued_at).total_seconds()
+
+    @property
+    def run_seconds(self):
+        if self.started_at is None or self.finished_at is None:
+            return None
+        return (self.finished_at - self.started_at).total_seconds()
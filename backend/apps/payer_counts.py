@@ -0,0 +1,134 @@
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.db.models import Case, Count, Q, Value, When
+from django.db.models.functions import ExtractMonth, ExtractYear
+from django.utils import timezone
+
+from apps.models import BankMovement, PayerCount
+
+STATUS_OK = "ok"
+STATUS_APPROACHING = "approaching"
+STATUS_EXCEEDED = "exceeded"
+
+PERIODS = [period for period, _ in PayerCount.PERIOD_CHOICES]
+
+
+def payer_limit(period: str) -> int:
+    if period == PayerCount.PERIOD_MONTH:
+        return settings.PAYER_LIMIT_MONTH
+    return settings.PAYER_LIMIT_SEMESTER
+
+
+def period_start(day: date, period: str) -> date:
+    if period == PayerCount.PERIOD_MONTH:
+        return day.replace(day=1)
+    return date(day.year, 1 if day.month <= 6 else 7, 1)
+
+
+def period_end(start: date, period: str) -> date:
+    """
+    First day after the period starting on `start`.
+    """
+    month = start.month - 1 + (1 if period == PayerCount.PERIOD_MONTH else 6)
+    return date(start.year + month // 12, month % 12 + 1, 1)
+
+
+def _payer_movements():
+    # Same movements as `distinctRutsCount`: incoming ones with a RUT.
+    return BankMovement.objects.filter(amount__gt=0).exclude(counterparty_rut="")
+
+
+def _count_payers(movements, period: str) -> Dict[Tuple[int, date], int]:
+    if period == PayerCount.PERIOD_MONTH:
+        first_month = ExtractMonth("accounting_date")
+    else:
+        first_month = Case(When(accounting_date__month__lte=6, then=Value(1)), default=Value(7))
+    rows = movements.values(
+        "bank_account__user_id", year=ExtractYear("accounting_date"), first_month=first_month
+    ).annotate(payers=Count("counterparty_rut", distinct=True))
+    return {
+        (row["bank_account__user_id"], date(row["year"], row["first_month"], 1)): row["payers"]
+        for row in rows
+    }
+
+
+def _save(counts: Dict[Tuple[int, date], int], period: str):
+    PayerCount.objects.bulk_create(
+        [
+            PayerCount(user_id=user_id, period=period, period_start=start, distinct_payers=payers)
+            for (user_id, start), payers in counts.items()
+        ],
+        update_conflicts=True,
+        unique_fields=["user", "period", "period_start"],
+        update_fields=["distinct_payers", "updated_at"],
+    )
+
+
+def refresh_payer_counts(user_id: int, days: Iterable[date]):
+    """
+    Recount the user's months and semesters that contain any of `days`,
+    the accounting dates of newly imported movements. Only those periods'
+    movements are read.
+    """
+    days = set(days)
+    if not days:
+        return
+    for period in PERIODS:
+        ranges = Q()
+        for start in {period_start(day, period) for day in days}:
+            ranges |= Q(accounting_date__gte=start, accounting_date__lt=period_end(start, period))
+        movements = _payer_movements().filter(ranges, bank_account__user_id=user_id)
+        _save(_count_payers(movements, period), period)
+
+
+def rebuild_payer_counts(user_ids: Optional[Iterable[int]] = None):
+    """
+    Recount every period from scratch, for `user_ids` or everyone.
+    """
+    movements = _payer_movements()
+    stored = PayerCount.objects.all()
+    if user_ids is not None:
+        user_ids = list(user_ids)
+        movements = movements.filter(bank_account__user_id__in=user_ids)
+        stored = stored.filter(user_id__in=user_ids)
+    stored.delete()
+    for period in PERIODS:
+        _save(_count_payers(movements, period), period)
+
+
+def threshold_status(payers: int, limit: int) -> str:
+    # Reaching the limit already counts.
+    if payers >= limit:
+        return STATUS_EXCEEDED
+    if payers >= limit * settings.PAYER_WARNING_RATIO:
+        return STATUS_APPROACHING
+    return STATUS_OK
+
+
+def payer_thresholds(user, day: Optional[date] = None) -> List[Dict]:
+    """
+    Distinct payers of the month and semester containing `day` (default
+    today) against their limits, read from `PayerCount` with one query.
+    """
+    day = day or timezone.localdate()
+    starts = {period: period_start(day, period) for period in PERIODS}
+    stored = {
+        (count.period, count.period_start): count.distinct_payers
+        for count in PayerCount.objects.filter(user=user, period_start__in=starts.values())
+    }
+    thresholds = []
+    for period, start in starts.items():
+        payers = stored.get((period, start), 0)
+        limit = payer_limit(period)
+        thresholds.append(
+            {
+                "period": period,
+                "period_start": start,
+                "distinct_payers": payers,
+                "limit": limit,
+                "status": threshold_status(payers, limit),
+            }
+        )
+    return thresholds
@@ -1,3 +1,785 @@
-from django.test import TestCase
+import io
+import json
+import tempfile
+from datetime import date, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
 
-# Create your tests here.
+import jwt
+import requests
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.core.management import call_command
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+
+from apps.bank_refresh import refresh_shard
+from apps.bank_scraper import ParsedMovements, SantanderClient, SantanderScraper
+from apps.dashboard_cache import cached_result
+from apps.integrations.activity_cache import ActivityGuidanceCache
+from apps.integrations.activity_classifier import (
+    MODE_AUTO,
+    MODE_LEXICAL,
+    MODE_LLM,
+    SOURCE_LEXICAL,
+    SOURCE_LLM,
+    ActivityClassifier,
+    ActivityGuidance,
+)
+from apps.integrations.fake_santander import FakeSantanderServer, fake_movements
+from apps.integrations.json_stream import JsonArrayStream
+from apps.integrations.rate_limit import RateLimiter
+from apps.integrations.sii_catalog import (
+    CATALOG_PATH,
+    RAW_CATALOG_PATH,
+    SIICatalog,
+    get_catalog,
+    parse_sii_catalog,
+)
+from apps.integrations.sii_search import (
+    BM25Index,
+    LexicalMatch,
+    get_activity_search,
+    stem,
+    tokenize,
+)
+from apps.integrations.santander_http import (
+    close_santander_sessions,
+    get_circuit_breaker,
+    santander_post,
+)
+from apps.integrations.santander_tokens import token_cache
+from apps.jobs import DatabaseJobQueue
+from apps.models import (
+    ActivityGuidanceCacheEntry,
+    BackgroundJob,
+    BankAccount,
+    BankingCredentials,
+    BankMovement,
+    BankSyncStats,
+    get_fernet,
+)
+from apps.payer_counts import (
+    STATUS_APPROACHING,
+    STATUS_EXCEEDED,
+    STATUS_OK,
+    threshold_status,
+)
+from django_template.schema import schema
+
+
+def split_at(body: bytes, *offsets):
+    cuts = [0, *offsets, len(body)]
+    return [body[start:end] for start, end in zip(cuts, cuts[1:])]
+
+
+class JsonArrayStreamTests(SimpleTestCase):
+    document = {
+        "movements": [
+            {"movementNumber": "1", "amount": 12.5, "observation": "Transf. Ñuñoa café"},
+            {"movementNumber": "2", "amount": -10e2, "observation": 'Pago "PAC" \\ 🚀'},
+            {"movementNumber": "3", "amount": 1234567, "rate": -3.25e-4, "ok": True},
+            [0, 1.0, 2e-3, None, False, "€"],
+            4096,
+        ],
+        "pagination": {"nextKey": "abc", "total": 5, "ratio": 0.75},
+        "count": 100,
+    }
+
+    def decode(self, chunks):
+        stream = JsonArrayStream(chunks, "movements")
+        return list(stream), stream.rest
+
+    def assert_decodes(self, body: bytes, chunks):
+        expected = json.loads(body)
+        items, rest = self.decode(chunks)
+        self.assertEqual(items, expected["movements"])
+        self.assertEqual(rest, {k: v for k, v in expected.items() if k != "movements"})
+
+    def test_whole_body(self):
+        body = json.dumps(self.document, ensure_ascii=False).encode()
+        self.assert_decodes(body, [body])
+
+    def test_cut_at_every_offset(self):
+        for ensure_ascii in (True, False):
+            body = json.dumps(self.document, ensure_ascii=ensure_ascii).encode()
+            for offset in range(1, len(body)):
+                with self.subTest(ensure_ascii=ensure_ascii, offset=offset):
+                    self.assert_decodes(body, split_at(body, offset))
+
+    def test_one_byte_chunks(self):
+        body = json.dumps(self.document, ensure_ascii=False, indent=2).encode()
+        self.assert_decodes(body, [body[i : i + 1] for i in range(len(body))])
+
+    def test_numbers_cut_inside(self):
+        for literal in (b"12.5", b"10E+2", b"-3.25e-4", b"0.000001", b"1e5"):
+            body = b'{"movements": [' + literal + b', 7], "total": ' + literal + b"}"
+            for offset in range(1, len(body)):
+                with self.subTest(literal=literal, offset=offset):
+                    items, rest = self.decode(split_at(body, offset))
+                    self.assertEqual(items, [json.loads(literal), 7])
+                    self.assertEqual(rest, {"total": json.loads(literal)})
+
+    def test_number_at_end_of_array(self):
+        self.assertEqual(self.decode([b'{"movements": [10E', b"+2]}"])[0], [1000.0])
+        self.assertEqual(self.decode([b'{"movements": [12.', b"5]}"])[0], [12.5])
+
+    def test_key_not_an_array(self):
+        self.assertEqual(self.decode([b'{"movements": null, "a": 1}']), ([], {"movements": None, "a": 1}))
+
+    def test_truncated_body(self):
+        for body in (b'{"movements": [1, 2', b'{"movements": [12.', b'{"movements": ["ab'):
+            with self.subTest(body=body), self.assertRaises(ValueError):
+                self.decode([body])
+
+
+class SantanderPostBreakerTests(SimpleTestCase):
+    url = "https://breaker.test/movements"
+
+    def setUp(self):
+        close_santander_sessions()
+        self.addCleanup(close_santander_sessions)
+
+    def open_breaker(self):
+        breaker = get_circuit_breaker(self.url)
+        for _ in range(breaker.failure_threshold):
+            breaker.record_failure()
+        # Cooled down: the next call is the half-open trial.
+        breaker.opened_at -= breaker.cooldown
+        return breaker
+
+    def post_raising(self, error):
+        with mock.patch("requests.Session.post", side_effect=error):
+            with self.assertRaises(type(error)):
+                santander_post(self.url)
+
+    def test_trial_failing_with_any_request_error_reopens(self):
+        breaker = self.open_breaker()
+        self.post_raising(requests.TooManyRedirects())
+        self.assertEqual(breaker.state, "open")
+
+    def test_trial_interrupted_lets_the_next_call_through(self):
+        breaker = self.open_breaker()
+        self.post_raising(KeyboardInterrupt())
+        self.assertEqual(breaker.state, "half-open")
+        response = requests.Response()
+        response.status_code = 200
+        with mock.patch("requests.Session.post", return_value=response):
+            self.assertIs(santander_post(self.url), response)
+        self.assertEqual(breaker.state, "closed")
+
+    def test_rate_limiter_error_leaves_no_trial_in_flight(self):
+        breaker = self.open_breaker()
+        with mock.patch.object(RateLimiter, "acquire", side_effect=ConnectionRefusedError):
+            with self.assertRaises(ConnectionRefusedError):
+                santander_post(self.url)
+        self.assertFalse(breaker._trial_in_flight)
+
+
+@override_settings(JOB_LEASE_SECONDS=60, JOB_MAX_ATTEMPTS=2)
+class JobLeaseTests(TestCase):
+    def pop(self):
+        # A fresh queue looks for expired jobs on its first pop.
+        return DatabaseJobQueue().pop()
+
+    def expire(self, job):
+        BackgroundJob.objects.filter(pk=job.pk).update(
+            heartbeat_at=timezone.now() - timedelta(seconds=61)
+        )
+
+    def test_job_of_a_dead_worker_runs_again_until_the_attempt_cap(self):
+        job = BackgroundJob.objects.create(kind="sync_bank_movements")
+        self.assertEqual(self.pop().attempts, 1)
+        self.assertIsNone(self.pop())
+        self.expire(job)
+        self.assertEqual(self.pop().attempts, 2)
+        self.expire(job)
+        self.assertIsNone(self.pop())
+        job.refresh_from_db()
+        self.assertEqual(job.status, BackgroundJob.STATUS_FAILED)
+        self.assertIsNotNone(job.finished_at)
+
+
+def create_credentials(username: str, rut: str = "12345678-5") -> BankingCredentials:
+    user = get_user_model().objects.create(username=username)
+    return BankingCredentials.objects.create(
+        user=user, rut=rut, bank="Santander", password=get_fernet().encrypt(b"secret").decode()
+    )
+
+
+class FakeSantanderTestCase(TransactionTestCase):
+    """
+    Runs against a local `FakeSantanderServer` built from `server_options`.
+    Syncs query from worker threads, which only see committed rows.
+    """
+
+    server_options = {}
+
+    def setUp(self):
+        self.server = FakeSantanderServer(**self.server_options).__enter__()
+        self.addCleanup(self.server.__exit__, None, None, None)
+        overrides = override_settings(**self.server.settings_overrides)
+        overrides.enable()
+        self.addCleanup(overrides.disable)
+        close_santander_sessions()
+        self.addCleanup(close_santander_sessions)
+        self.addCleanup(token_cache.clear)
+
+
+class RefreshSchedulingTests(FakeSantanderTestCase):
+    def test_enqueues_one_job_per_credential(self):
+        credentials = [create_credentials("ana"), create_credentials("bea")]
+        self.assertEqual(refresh_shard(use_queue=True).enqueued, 2)
+        run = refresh_shard(use_queue=True)
+        self.assertEqual((run.enqueued, run.in_progress), (0, 2))
+        self.assertEqual(BackgroundJob.objects.count(), 2)
+        BackgroundJob.objects.filter(payload__credentials_id=credentials[0].id).update(
+            status=BackgroundJob.STATUS_RUNNING
+        )
+        BackgroundJob.objects.filter(payload__credentials_id=credentials[1].id).update(
+            status=BackgroundJob.STATUS_FAILED
+        )
+        run = refresh_shard(use_queue=True)
+        self.assertEqual((run.enqueued, run.in_progress), (1, 1))
+
+    @override_settings(SANTANDER_LOGIN_BACKOFF=3600, SANTANDER_LOGIN_BACKOFF_MAX=3 * 3600)
+    def test_backs_off_after_rejected_logins(self):
+        credentials = create_credentials("ana")
+        self.server.server.reject_logins = True
+        for failures in (1, 2, 3, 4):
+            with self.assertLogs("apps.bank_refresh", "ERROR"):
+                self.assertEqual(refresh_shard().failed, 1)
+            credentials.refresh_from_db()
+            self.assertEqual(credentials.login_failures, failures)
+            self.assertEqual(refresh_shard().backing_off, 1)
+            # 1 h, 2 h, then capped at 3 h after the last rejection.
+            backoff = timedelta(hours=min(2 ** (failures - 1), 3))
+            BankingCredentials.objects.filter(pk=credentials.pk).update(
+                last_login_failure_at=timezone.now() - backoff + timedelta(minutes=1)
+            )
+            self.assertEqual(refresh_shard().backing_off, 1)
+            BankingCredentials.objects.filter(pk=credentials.pk).update(
+                last_login_failure_at=timezone.now() - backoff
+            )
+        self.server.server.reject_logins = False
+        self.assertEqual(refresh_shard().synced, 1)
+        credentials.refresh_from_db()
+        self.assertEqual(credentials.login_failures, 0)
+
+
+class BenchSantanderHttpTests(SimpleTestCase):
+    def test_both_modes_log_in_every_sync(self):
+        self.addCleanup(token_cache.clear)
+        out = io.StringIO()
+        call_command("bench_santander_http", syncs=2, accounts=1, no_tls=True, stdout=out)
+        lines = out.getvalue().splitlines()
+        self.assertEqual(len(lines), 2)
+        for line in lines:
+            self.assertIn("6 requests", line)
+
+
+def staff_context(username: str = "staff") -> SimpleNamespace:
+    get_user_model().objects.create(username=username, is_staff=True)
+    token = jwt.encode({"username": username}, settings.SECRET_KEY, algorithm="HS256")
+    return SimpleNamespace(headers={"Authorization": f"Bearer {token}"})
+
+
+class BankRefreshStatsQueryTests(FakeSantanderTestCase):
+    def test_resolves_published_runs(self):
+        create_credentials("ana")
+        refresh_shard(use_queue=True)
+        result = schema.execute(
+            "{ bankRefreshStats { runs { due enqueued inProgress backingOff } } }",
+            context_value=staff_context(),
+        )
+        self.assertIsNone(result.errors)
+        self.assertEqual(
+            result.data["bankRefreshStats"]["runs"],
+            [{"due": 1, "enqueued": 1, "inProgress": 0, "backingOff": 0}],
+        )
+
+
+@override_settings(PAYER_WARNING_RATIO=0.8)
+class ThresholdStatusTests(SimpleTestCase):
+    def test_reaching_the_limit_exceeds_it(self):
+        self.assertEqual(threshold_status(39, 50), STATUS_OK)
+        self.assertEqual(threshold_status(40, 50), STATUS_APPROACHING)
+        self.assertEqual(threshold_status(49, 50), STATUS_APPROACHING)
+        self.assertEqual(threshold_status(50, 50), STATUS_EXCEEDED)
+        self.assertEqual(threshold_status(100, 100), STATUS_EXCEEDED)
+
+
+class DashboardCacheVersionTests(FakeSantanderTestCase):
+    server_options = {"accounts": 2, "movements_per_account": 30}
+
+    def setUp(self):
+        super().setUp()
+        caches[settings.DASHBOARD_CACHE].clear()
+        self.credentials = create_credentials("ana")
+
+    def cached_count(self, name, movements):
+        return cached_result(name, self.credentials.user_id, {}, movements.count)
+
+    def movements_count(self):
+        return self.cached_count(
+            "test_movements", BankMovement.objects.filter(bank_account__user=self.credentials.user)
+        )
+
+    def ruts_count(self):
+        return self.cached_count(
+            "test_ruts", BankMovement.objects.filter(counterparty_rut__isnull=False)
+        )
+
+    def test_sync_failing_after_inserting_changes_the_version(self):
+        self.assertEqual(self.movements_count(), 0)
+        with mock.patch.object(
+            BankSyncStats.objects, "bulk_create", side_effect=RuntimeError("stats lost")
+        ), self.assertRaises(RuntimeError):
+            SantanderClient.obtain_movements(self.credentials)
+        self.assertFalse(BankSyncStats.objects.exists())
+        self.assertEqual(self.movements_count(), 60)
+
+    def test_backfill_changes_the_version(self):
+        SantanderClient.obtain_movements(self.credentials)
+        BankMovement.objects.update(counterparty_rut=None)
+        self.assertEqual(self.ruts_count(), 0)
+        call_command("backfill_counterparty_ruts", stdout=io.StringIO())
+        self.assertEqual(self.ruts_count(), 60)
+
+
+@override_settings(SII_GUIDANCE_CACHE_TOUCH_INTERVAL=300, SII_GUIDANCE_CACHE_EVICT_INTERVAL=60)
+class ActivityGuidanceCacheTests(TestCase):
+    def setUp(self):
+        caches["default"].clear()
+        self.cache = ActivityGuidanceCache(model_id="model", catalog_version="v1", max_entries=2)
+
+    def last_used_at(self, description):
+        return ActivityGuidanceCacheEntry.objects.get(key=self.cache.key(description)).last_used_at
+
+    def test_front_hits_keep_an_entry_from_eviction(self):
+        self.cache.set("vendo empanadas", "Venta de alimentos", "1")
+        self.cache.set("clases de piano", "Enseñanza", "2")
+        ActivityGuidanceCacheEntry.objects.update(
+            last_used_at=timezone.now() - timedelta(hours=1)
+        )
+        touched_before = self.last_used_at("vendo empanadas")
+        self.assertIsNotNone(self.cache.get("Vendo  Empanadas!"))
+        self.assertGreater(self.last_used_at("vendo empanadas"), touched_before)
+        # Throttled: a second front hit within the interval writes nothing.
+        with self.assertNumQueries(0):
+            self.cache.get("vendo empanadas")
+        caches["default"].delete("activity-guidance:evicted")
+        self.cache.set("arriendo de autos", "Alquiler", "3")
+        self.assertIsNotNone(self.cache.get("vendo empanadas"))
+        self.assertFalse(
+            ActivityGuidanceCacheEntry.objects.filter(key=self.cache.key("clases de piano")).exists()
+        )
+
+    def test_eviction_runs_once_per_interval(self):
+        for number in range(4):
+            self.cache.set(f"actividad {number}", "Actividad", "1")
+        # Only the first write evicted, with nothing above the cap yet.
+        self.assertEqual(ActivityGuidanceCacheEntry.objects.count(), 4)
+        caches["default"].delete("activity-guidance:evicted")
+        self.cache.set("actividad 4", "Actividad", "1")
+        self.assertEqual(ActivityGuidanceCacheEntry.objects.count(), 2)
+
+
+@override_settings(SANTANDER_MOVEMENTS_PAGE_SIZE=10)
+class SyncCursorTests(FakeSantanderTestCase):
+    server_options = {"accounts": 1, "movements_per_account": 30}
+
+    def setUp(self):
+        super().setUp()
+        self.credentials = create_credentials("ana")
+
+    def sync(self, movements_per_account):
+        self.server.server.movements_per_account = movements_per_account
+        before = self.server.requests_by_endpoint.get("movements", 0)
+        (stats,) = SantanderClient.obtain_movements(self.credentials)
+        stats.movement_requests = self.server.requests_by_endpoint["movements"] - before
+        return stats
+
+    def account(self):
+        return BankAccount.objects.get(user=self.credentials.user)
+
+    def test_resync_only_imports_movements_above_the_cursor(self):
+        stats = self.sync(30)
+        self.assertEqual((stats.new_movements, stats.skipped_movements), (30, 0))
+        self.assertEqual(self.account().last_movement_number, 30)
+        stats = self.sync(35)
+        self.assertEqual((stats.new_movements, stats.skipped_movements), (5, 30))
+        self.assertEqual(self.account().last_movement_number, 35)
+        self.assertEqual(BankMovement.objects.count(), 35)
+        # Oldest first: the stored pages come first and are still fetched.
+        self.assertEqual(stats.movement_requests, 4)
+
+    def test_newest_first_stops_paging_at_the_cursor(self):
+        self.server.server.newest_first = True
+        self.assertEqual(self.sync(30).movement_requests, 3)
+        stats = self.sync(35)
+        self.assertEqual((stats.new_movements, stats.movement_requests), (5, 1))
+        self.assertEqual(self.account().last_movement_number, 35)
+        stats = self.sync(35)
+        self.assertEqual((stats.new_movements, stats.movement_requests), (0, 1))
+        self.assertEqual(BankMovement.objects.count(), 35)
+
+
+class ParseMovementsCursorTests(TestCase):
+    def setUp(self):
+        user = get_user_model().objects.create(username="ana")
+        self.account = BankAccount.objects.create(
+            user=user, bank="Santander", account_number="000100000001", full_name="Ana"
+        )
+
+    def sync(self, movements):
+        parsed = SantanderScraper.parse_movements(movements, self.account, ParsedMovements())
+        BankMovement.objects.bulk_create(parsed.movements, ignore_conflicts=True)
+        SantanderClient.advance_cursor(self.account, parsed, timezone.now())
+        return parsed
+
+    def test_cursor_stays_below_a_failed_movement_until_it_parses(self):
+        movements = fake_movements(self.account.account_number, 0, 10)
+        broken = dict(movements[5], movementAmount=None)
+        with self.assertLogs("apps.bank_scraper", "WARNING"):
+            parsed = self.sync(movements[:5] + [broken] + movements[6:])
+        self.assertEqual((parsed.new, parsed.failed, parsed.first_failed_number), (9, 1, 6))
+        self.assertEqual(self.account.last_movement_number, 5)
+
+        parsed = self.sync(movements)
+        # 1 to 5 are skipped; 7 to 10 are parsed again and dropped as duplicates.
+        self.assertEqual((parsed.new, parsed.skipped, parsed.failed), (5, 5, 0))
+        self.assertEqual(self.account.last_movement_number, 10)
+        self.assertEqual(BankMovement.objects.filter(bank_account=self.account).count(), 10)
+
+        parsed = self.sync(movements)
+        self.assertEqual((parsed.new, parsed.skipped), (0, 10))
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.last_movement_number, 10)
+
+    def test_movements_without_a_number_do_not_move_the_cursor(self):
+        movements = fake_movements(self.account.account_number, 0, 3)
+        with self.assertLogs("apps.bank_scraper", "WARNING"):
+            parsed = self.sync([{"observation": "sin numero"}] + movements)
+        self.assertEqual((parsed.new, parsed.failed), (3, 1))
+        self.assertEqual(self.account.last_movement_number, 3)
+
+
+class MergeDuplicateAccountsMigrationTests(TransactionTestCase):
+    before = [("apps", "0014_bank_sync_cursor")]
+    after = [("apps", "0015_bankaccount_unique_user_bank_account_number")]
+
+    def setUp(self):
+        executor = MigrationExecutor(connection)
+        executor.migrate(self.before)
+        self.apps = executor.loader.project_state(self.before).apps
+        self.addCleanup(self.migrate_to_latest)
+
+    def migrate_to_latest(self):
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(executor.loader.graph.leaf_nodes())
+
+    def migrate(self):
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(self.after)
+        return executor.loader.project_state(self.after).apps
+
+    def test_duplicates_are_merged_into_the_oldest_account(self):
+        User = self.apps.get_model("auth", "User")
+        BankAccount = self.apps.get_model("apps", "BankAccount")
+        BankMovement = self.apps.get_model("apps", "BankMovement")
+        BankSyncStats = self.apps.get_model("apps", "BankSyncStats")
+        ana = User.objects.create(username="ana")
+        bea = User.objects.create(username="bea")
+        now = timezone.now()
+
+        def account(user, full_name, cursor, number="000100000001"):
+            return BankAccount.objects.create(
+                user=user,
+                bank="Santander",
+                account_number=number,
+                full_name=full_name,
+                last_movement_number=cursor,
+                last_synced_at=now - timedelta(days=cursor),
+            )
+
+        def movements(account, numbers):
+            for number in numbers:
+                BankMovement.objects.create(
+                    bank_account=account,
+                    movement_number=number,
+                    accounting_date=date(2024, 1, 1),
+                    transaction_date=date(2024, 1, 1),
+                    observation=f"{account.id}:{number}",
+                    expanded_code="TEF",
+                    amount=1000,
+                )
+
+        oldest = account(ana, "Ana Perez", 3)
+        renamed = account(ana, "Ana Perez Soto", 5)
+        third = account(ana, "Ana P.", 4)
+        movements(oldest, [1, 2, 3])
+        movements(renamed, [3, 4, 5])
+        movements(third, [2, 4])
+        BankSyncStats.objects.create(bank_account=renamed, synced_at=now, new_movements=3)
+        other_number = account(ana, "Ana Perez", 1, number="000100000002")
+        other_user = account(bea, "Bea Soto", 1)
+        movements(other_user, [1])
+
+        apps = self.migrate()
+        BankAccount = apps.get_model("apps", "BankAccount")
+        BankMovement = apps.get_model("apps", "BankMovement")
+        BankSyncStats = apps.get_model("apps", "BankSyncStats")
+
+        self.assertEqual(
+            set(BankAccount.objects.values_list("id", flat=True)),
+            {oldest.id, other_number.id, other_user.id},
+        )
+        kept = BankAccount.objects.get(id=oldest.id)
+        self.assertEqual(kept.full_name, "Ana P.")
+        self.assertEqual(kept.last_movement_number, 5)
+        self.assertEqual(kept.last_synced_at, now - timedelta(days=3))
+        # One row per movement number: the oldest account keeps its copies,
+        # the ones only duplicates held are moved over.
+        merged = dict(
+            BankMovement.objects.filter(bank_account=kept).values_list(
+                "movement_number", "observation"
+            )
+        )
+        self.assertEqual(sorted(merged), [1, 2, 3, 4, 5])
+        for number in (1, 2, 3):
+            self.assertEqual(merged[number], f"{oldest.id}:{number}")
+        self.assertIn(merged[4], (f"{renamed.id}:4", f"{third.id}:4"))
+        self.assertEqual(merged[5], f"{renamed.id}:5")
+        self.assertEqual(BankMovement.objects.count(), 6)
+        self.assertEqual(BankSyncStats.objects.get().bank_account_id, kept.id)
+        self.assertEqual(BankMovement.objects.filter(bank_account_id=other_user.id).count(), 1)
+
+
+class ClassifyBatchChunkingTests(SimpleTestCase):
+    def test_descriptions_without_candidates_do_not_share_a_prompt_with_the_rest(self):
+        classifier = ActivityClassifier(mode=MODE_LLM, use_cache=False)
+        descriptions = ["vendo empanadas", "xyzzy qwerty", "peluqueria", "reparo bicicletas"]
+        prompts = []
+
+        def llm_batch_guidance(chunk):
+            prompts.append(chunk)
+            return [ActivityGuidance(activity=d, iva_code="1", source=SOURCE_LLM) for d in chunk]
+
+        with mock.patch.object(classifier, "llm_batch_guidance", llm_batch_guidance):
+            results = classifier.classify_batch(
+                descriptions + ["clases de piano"], concurrency=1, batch_size=2
+            )
+        self.assertEqual(
+            [result.activity for result in results], descriptions + ["clases de piano"]
+        )
+        self.assertCountEqual(
+            prompts,
+            [
+                ["vendo empanadas", "peluqueria"],
+                ["reparo bicicletas"],
+                ["xyzzy qwerty", "clases de piano"],
+            ],
+        )
+
+
+class SIISearchTests(SimpleTestCase):
+    def test_tokenize_drops_stopwords_and_folds_accents(self):
+        self.assertEqual(
+            tokenize("Yo vendo ropa usada y Artículos de CAMPAÑA"),
+            ["vent", "ropa", "usad", "articul", "campañ"],
+        )
+
+    def test_inflections_share_a_stem(self):
+        for words in [
+            ("vendo", "venta", "ventas", "vender"),
+            ("panaderías", "Panadería", "panaderia"),
+            ("arriendo", "alquiler"),
+        ]:
+            with self.subTest(words):
+                self.assertEqual(len({tuple(tokenize(word)) for word in words}), 1)
+
+    def test_short_words_keep_their_letters(self):
+        self.assertEqual(stem("año"), "año")
+        self.assertNotEqual(tokenize("ano"), tokenize("año"))
+
+    def test_bm25_ranks_by_frequency_and_length(self):
+        index = BM25Index([["vent", "libr"], ["vent", "mueble"], ["libr"], ["vent", "libr", "libr"]])
+        self.assertEqual([doc_id for doc_id, _ in index.search(["libr"])], [2, 3, 0])
+        self.assertEqual([doc_id for doc_id, _ in index.search(["vent", "libr"], k=2)], [3, 0])
+        self.assertEqual(index.search(["zzz"]), [])
+
+    def test_catalog_top_k(self):
+        search = get_activity_search()
+        self.assertEqual(
+            [activity.code for activity, _ in search.search("peluquería", k=2)],
+            ["960200", "960901"],
+        )
+        self.assertIn(
+            "476101", [activity.code for activity, _ in search.search("vendo libros", k=3)]
+        )
+        self.assertEqual(search.search("xyzzy qwerty"), [])
+
+
+class LexicalFastPathTests(SimpleTestCase):
+    def setUp(self):
+        self.classifier = ActivityClassifier(
+            mode=MODE_AUTO, min_margin=0.25, min_coverage=1.0, use_cache=False
+        )
+        self.activity = get_activity_search().activities[0]
+
+    def match(self, margin, coverage=1.0, exact=False):
+        return LexicalMatch(
+            activity=self.activity, score=10.0, margin=margin, coverage=coverage, exact=exact
+        )
+
+    def test_is_confident_needs_every_term_and_a_margin_or_the_exact_name(self):
+        self.assertTrue(self.classifier.is_confident(self.match(0.25)))
+        self.assertTrue(self.classifier.is_confident(self.match(0.0, exact=True)))
+        self.assertFalse(self.classifier.is_confident(self.match(0.2)))
+        self.assertFalse(self.classifier.is_confident(self.match(0.9, coverage=0.5)))
+
+    def test_ambiguous_sales_go_to_the_llm(self):
+        # Wholesale outranks retail books and furniture, and "ropa usada" is
+        # the only row with every term of "venta de ropa".
+        for description, best_code in [
+            ("vendo libros", "464905"),
+            ("venta de libros", "464905"),
+            ("venta de muebles", "464901"),
+            ("venta de ropa", "477402"),
+        ]:
+            with self.subTest(description):
+                match = get_activity_search().best_match(description)
+                self.assertEqual(match.activity.code, best_code)
+                self.assertFalse(self.classifier.is_confident(match))
+                self.assertIsNone(self.classifier.lexical_guidance(description))
+
+    def test_catalog_name_is_answered_locally(self):
+        guidance = self.classifier.lexical_guidance(
+            "Venta al por menor de libros en comercios especializados"
+        )
+        self.assertEqual((guidance.code, guidance.source), ("476101", SOURCE_LEXICAL))
+
+    def test_modes_route_between_index_and_llm(self):
+        catalog_name = "Venta al por menor de libros en comercios especializados"
+        llm_answer = ActivityGuidance(activity="Venta", iva_code="1", source=SOURCE_LLM)
+        for mode, description, source in [
+            (MODE_AUTO, catalog_name, SOURCE_LEXICAL),
+            (MODE_AUTO, "venta de ropa", SOURCE_LLM),
+            (MODE_LEXICAL, "venta de ropa", SOURCE_LEXICAL),
+            (MODE_LLM, catalog_name, SOURCE_LLM),
+        ]:
+            with self.subTest(mode=mode, description=description):
+                classifier = ActivityClassifier(mode=mode, use_cache=False)
+                with mock.patch.object(
+                    classifier, "llm_guidance", return_value=llm_answer
+                ) as llm_guidance:
+                    self.assertEqual(classifier.classify(description).source, source)
+                self.assertEqual(llm_guidance.called, source == SOURCE_LLM)
+
+    def test_lexical_mode_fails_without_candidates(self):
+        with self.assertRaises(Exception):
+            ActivityClassifier(mode=MODE_LEXICAL, use_cache=False).classify("xyzzy qwerty")
+
+
+class ActivityClassifierStatsTests(TestCase):
+    def setUp(self):
+        caches["default"].clear()
+
+    def test_staff_query_counts_answers_by_source(self):
+        classifier = ActivityClassifier(mode=MODE_AUTO, use_cache=False)
+        classifier.classify("Venta al por menor de libros en comercios especializados")
+        llm_answer = ActivityGuidance(activity="Venta", iva_code="1", source=SOURCE_LLM)
+        with mock.patch.object(classifier, "llm_guidance", return_value=llm_answer):
+            classifier.classify("venta de ropa")
+            classifier.classify("vendo libros")
+        result = schema.execute(
+            "{ activityClassifierStats { lexical cache llm lexicalRatio } }",
+            context_value=staff_context(),
+        )
+        self.assertIsNone(result.errors)
+        self.assertEqual(
+            result.data["activityClassifierStats"],
+            {"lexical": 1, "cache": 0, "llm": 2, "lexicalRatio": 1 / 3},
+        )
+
+
+SII_RAW_PAGE = """Todos los cŠdigos de actividad econŠmica
+AGRICULTURA, GANADERêA, SILVICULTURA Y
+PESCA
+CŠdigo
+CULTIVO DE PLANTAS NO PERENNES
+Afecto a
+IVA
+Categor™a
+Tributaria
+Disponible
+Inter net
+011101
+CULTIVO DE TRIGO
+SI
+1
+SI
+011102
+CULTIVO DE MAêZ
+SI
+1Co
+S
+011105
+CULTIVO DE OTROS CEREALES (EXCEPTO TRIGO, MAêZ,
+AVENA Y CEBADA)
+G
+G
+NO
+!!!
+"""
+
+
+class SIICatalogParserTests(SimpleTestCase):
+    def test_parses_rows_across_lines_and_page_breaks(self):
+        # The next page repeats the last row of the previous one.
+        repeated = "011105\nOTRA DESCRIPCION\nSI\n1\nSI\n"
+        activities = parse_sii_catalog([SII_RAW_PAGE, repeated])
+        self.assertEqual([a.code for a in activities], ["011101", "011102", "011105"])
+        wheat, corn, cereals = activities
+        self.assertEqual(wheat.section, "AGRICULTURA, GANADERÍA, SILVICULTURA Y PESCA")
+        self.assertEqual(wheat.group, "CULTIVO DE PLANTAS NO PERENNES")
+        self.assertEqual((wheat.iva_affected, wheat.tax_category), ("SI", "1"))
+        self.assertEqual(corn.description, "CULTIVO DE MAÍZ")
+        self.assertEqual((corn.tax_category, corn.internet_available), ("1", True))
+        self.assertEqual(
+            cereals.description, "CULTIVO DE OTROS CEREALES (EXCEPTO TRIGO, MAÍZ, AVENA Y CEBADA)"
+        )
+        self.assertEqual((cereals.iva_affected, cereals.internet_available), ("G", False))
+
+    def test_unterminated_row_is_rejected(self):
+        with self.assertRaises(ValueError):
+            parse_sii_catalog(["011101\nCULTIVO DE TRIGO\nSI\n"])
+
+    def test_artifact_matches_the_raw_dump(self):
+        with open(RAW_CATALOG_PATH, encoding="utf-8") as raw_file:
+            parsed = SIICatalog(parse_sii_catalog([raw_file.read()]))
+        artifact = SIICatalog.load(CATALOG_PATH)
+        self.assertEqual(len(parsed), 674)
+        self.assertEqual(parsed.activities, artifact.activities)
+        self.assertEqual(parsed.version, artifact.version)
+        self.assertTrue(
+            get_catalog().get("476101").description.startswith("VENTA AL POR MENOR DE LIBROS")
+        )
+
+    def test_version_follows_the_content(self):
+        activities = parse_sii_catalog([SII_RAW_PAGE])
+        version = SIICatalog(activities).version
+        self.assertEqual(SIICatalog(list(activities)).version, version)
+        self.assertNotEqual(SIICatalog(activities[:2]).version, version)
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "catalog.json"
+            SIICatalog(activities).save(path)
+            loaded = SIICatalog.load(path)
+        self.assertEqual((loaded.activities, loaded.version), (activities, version))
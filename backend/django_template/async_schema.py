@@ -0,0 +1,47 @@
+"""
+GraphQL schema served by the async endpoint (`/graphql/async/`).
+
+Only operations that spend most of their time waiting on remote services live
+here: under ASGI one worker keeps many of them in flight at once instead of
+blocking a thread per request as `GraphQLView` does.
+"""
+
+import graphene
+from asgiref.sync import sync_to_async
+
+from apps.integrations.activity_classifier import ActivityClassifier
+from django_template.middleware import get_user
+
+
+class AskActivityGuidance(graphene.Mutation):
+    activity = graphene.String()
+    iva_code = graphene.String()
+    code = graphene.String()
+    source = graphene.String()
+
+    class Arguments:
+        activity_description = graphene.String(required=True)
+
+    async def mutate(self, info, activity_description):
+        auth_user = await sync_to_async(get_user)(info.context)
+        if auth_user.is_anonymous:
+            raise Exception("You must be logged in to ask for guidance")
+
+        guidance = await ActivityClassifier().aclassify(activity_description)
+        return AskActivityGuidance(
+            activity=guidance.activity,
+            iva_code=guidance.iva_code,
+            code=guidance.code,
+            source=guidance.source,
+        )
+
+
+class Mutation(graphene.ObjectType):
+    ask_activity_guidance = AskActivityGuidance.Field()
+
+
+class Query(graphene.ObjectType):
+    hello = graphene.String(default_value="Hello, World!")
+
+
+schema = graphene.Schema(query=Query, mutation=Mutation)
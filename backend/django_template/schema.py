@@ -1,15 +1,19 @@
 import graphene
 from django.contrib.auth.models import User
+from django.conf import settings
 from graphene_django.types import DjangoObjectType
 import graphql_jwt
-from apps.models import BankingCredentials
-from apps.bank_scraper import SantanderClient
-from apps.integrations.bedrock_chat_sii_rubro import BedRockLLM
+from apps.models import BankingCredentials, get_fernet
+from apps.jobs import enqueue
+from apps.bank_refresh import refresh_stats
+from apps.payer_counts import payer_thresholds
+from apps.dashboard_cache import cached_result, dashboard_cache_stats
+from apps.helpers import rut_cache
+from apps.integrations.santander_http import transport_stats
+from apps.integrations.activity_cache import ActivityGuidanceCache
+from apps.integrations.activity_classifier import ActivityClassifier, classifier_stats
 from django_template.middleware import get_user
-from apps.helpers.read_guidline import ReadGuidance
 from graphene_file_upload.scalars import Upload
-from cryptography.fernet import Fernet
-import os
 
 # Import types and models for your queries
 from apps.app_schema.types import (
@@ -18,6 +22,7 @@ from apps.app_schema.types import (
     BankingCredentialsType,
     UserDetailType,
     ProcessedServiceListingType,
+    BackgroundJobType,
 )
 from apps.models import (
     BankMovement,
@@ -25,10 +30,9 @@ from apps.models import (
     BankingCredentials,
     UserDetail,
     ProcessedServiceListing,
+    BackgroundJob,
 )
-from apps.helpers import retrieve_national_identifier_from_description
-
-key_str = os.getenv("ENCRYPTION_KEY")
+from django.db.models import Count
 
 
 # Define UserType
@@ -56,6 +60,78 @@ class BankingCredentialsType(DjangoObjectType):
         model = BankingCredentials
 
 
+class ActivityGuidanceCacheStatsType(graphene.ObjectType):
+    hits = graphene.Int()
+    misses = graphene.Int()
+    hit_ratio = graphene.Float()
+    entries = graphene.Int()
+
+
+class ActivityClassifierStatsType(graphene.ObjectType):
+    lexical = graphene.Int()
+    cache = graphene.Int()
+    llm = graphene.Int()
+    lexical_ratio = graphene.Float()
+
+
+class BankRefreshRunType(graphene.ObjectType):
+    shard = graphene.Int()
+    shards = graphene.Int()
+    started_at = graphene.String()
+    due = graphene.Int()
+    skipped = graphene.Int()
+    in_progress = graphene.Int()
+    backing_off = graphene.Int()
+    synced = graphene.Int()
+    failed = graphene.Int()
+    enqueued = graphene.Int()
+    new_movements = graphene.Int()
+    duration_seconds = graphene.Float()
+    credentials_per_second = graphene.Float()
+    movements_per_second = graphene.Float()
+
+
+class BankRefreshStatsType(graphene.ObjectType):
+    accounts = graphene.Int()
+    never_synced_accounts = graphene.Int()
+    stale_accounts = graphene.Int()
+    max_lag_seconds = graphene.Float()
+    runs = graphene.List(BankRefreshRunType)
+
+
+class SantanderTransportStatsType(graphene.ObjectType):
+    requests = graphene.Int()
+    retries = graphene.Int()
+    timeouts_or_connection_errors = graphene.Int()
+    transient_responses = graphene.Int()
+    breaker_opened = graphene.Int()
+    short_circuited = graphene.Int()
+
+
+class RutCacheStatsType(graphene.ObjectType):
+    hits = graphene.Int()
+    misses = graphene.Int()
+    hit_ratio = graphene.Float()
+    entries = graphene.Int()
+    maxsize = graphene.Int()
+
+
+class DashboardCacheStatsType(graphene.ObjectType):
+    resolver = graphene.String()
+    hits = graphene.Int()
+    misses = graphene.Int()
+    hit_ratio = graphene.Float()
+
+
+class PayerThresholdType(graphene.ObjectType):
+    period = graphene.String()
+    period_start = graphene.Date()
+    distinct_payers = graphene.Int()
+    limit = graphene.Int()
+    # "ok", "approaching" (PAYER_WARNING_RATIO of the limit) or "exceeded"
+    status = graphene.String()
+
+
 # Define Mutation for Registering a User
 class RegisterUser(graphene.Mutation):
     user = graphene.Field(UserType)
@@ -82,6 +158,10 @@ class UploadFile(graphene.Mutation):
 class AskActivityGuidance(graphene.Mutation):
     activity = graphene.String()
     iva_code = graphene.String()
+    code = graphene.String()
+    # "lexical" when answered from the SII catalog, "cache" for a remembered
+    # Bedrock answer, "llm" when Bedrock was asked
+    source = graphene.String()
 
     class Arguments:
         activity_description = graphene.String(required=True)
@@ -91,22 +171,66 @@ class AskActivityGuidance(graphene.Mutation):
         if auth_user.is_anonymous:
             raise Exception("You must be logged in to ask for guidance")
 
-        # Run async code in synchronous context
-        llm = BedRockLLM()
-        guidance = llm.ask_activity_guidance(activity_description)
-        guidance_list = ReadGuidance().extract_guidance_list(guidance)
-        
-        try:
-            activity, iva_code = guidance_list[0], guidance_list[1]
-        except Exception as e:
-            raise Exception("Error parsing activity guidance")
+        guidance = ActivityClassifier().classify(activity_description)
+        return AskActivityGuidance(
+            activity=guidance.activity,
+            iva_code=guidance.iva_code,
+            code=guidance.code,
+            source=guidance.source,
+        )
 
-        return AskActivityGuidance(activity=activity, iva_code=iva_code)
 
+class ActivityGuidanceResultType(graphene.ObjectType):
+    activity_description = graphene.String()
+    activity = graphene.String()
+    iva_code = graphene.String()
+    code = graphene.String()
+    source = graphene.String()
+    # Set instead of the guidance when this description could not be classified
+    error = graphene.String()
+
+
+class AskActivityGuidanceBatch(graphene.Mutation):
+    results = graphene.List(ActivityGuidanceResultType)
+
+    class Arguments:
+        activity_descriptions = graphene.List(graphene.String, required=True)
+
+    def mutate(self, info, activity_descriptions):
+        auth_user = get_user(info.context)
+        if auth_user.is_anonymous:
+            raise Exception("You must be logged in to ask for guidance")
+        if len(activity_descriptions) > settings.SII_BATCH_MAX_DESCRIPTIONS:
+            raise Exception(
+                f"At most {settings.SII_BATCH_MAX_DESCRIPTIONS} descriptions per request"
+            )
+
+        results = []
+        guidances = ActivityClassifier().classify_batch(activity_descriptions)
+        for activity_description, guidance in zip(activity_descriptions, guidances):
+            if isinstance(guidance, Exception):
+                results.append(
+                    ActivityGuidanceResultType(
+                        activity_description=activity_description, error=str(guidance)
+                    )
+                )
+            else:
+                results.append(
+                    ActivityGuidanceResultType(
+                        activity_description=activity_description,
+                        activity=guidance.activity,
+                        iva_code=guidance.iva_code,
+                        code=guidance.code,
+                        source=guidance.source,
+                    )
+                )
+        return AskActivityGuidanceBatch(results=results)
 
 
 class RegisterBankCredentials(graphene.Mutation):
     bank_credentials = graphene.Field(BankingCredentialsType)
+    # Movements are imported in the background; poll `backgroundJob(id)`
+    job_id = graphene.Int()
 
     class Arguments:
         rut = graphene.String(required=True)
@@ -114,14 +238,16 @@ class RegisterBankCredentials(graphene.Mutation):
 
     def mutate(self, info, rut, password):
         auth_user = get_user(info.context)
-        f = Fernet(key_str.encode())
+        f = get_fernet()
         str_bytes = password.encode()
         encrypted_password = f.encrypt(str_bytes).decode()
         credentials = BankingCredentials.objects.create(
             user=auth_user, rut=rut, password=encrypted_password, bank="Santander"
         )
-        SantanderClient.obtain_movements(credentials)
-        return RegisterBankCredentials(bank_credentials=credentials)
+        job = enqueue(
+            "sync_bank_movements", {"credentials_id": credentials.id}, user=auth_user
+        )
+        return RegisterBankCredentials(bank_credentials=credentials, job_id=job.id)
 
 
 # Define the Mutation class
@@ -136,6 +262,7 @@ class Mutation(graphene.ObjectType):
     register_bank_credentials = RegisterBankCredentials.Field()
 
     ask_activity_guidance = AskActivityGuidance.Field()
+    ask_activity_guidance_batch = AskActivityGuidanceBatch.Field()
     upload_file = UploadFile.Field()
 
 # Define Query class for existing queries
@@ -157,6 +284,8 @@ class Query(graphene.ObjectType):
     distinct_ruts_count = graphene.Int(
         start_date=graphene.Date(), end_date=graphene.Date()
     )
+    # Current month and semester (or the ones containing `date`)
+    payer_thresholds = graphene.List(PayerThresholdType, date=graphene.Date())
 
     # Queries for BankAccount
     all_bank_accounts = graphene.List(BankAccountType)
@@ -170,6 +299,14 @@ class Query(graphene.ObjectType):
     all_user_details = graphene.List(UserDetailType)
     user_detail = graphene.Field(UserDetailType, id=graphene.Int())
     get_user = graphene.Field(UserType)
+    activity_guidance_cache_stats = graphene.Field(ActivityGuidanceCacheStatsType)
+    activity_classifier_stats = graphene.Field(ActivityClassifierStatsType)
+    background_job = graphene.Field(BackgroundJobType, id=graphene.Int(required=True))
+    bank_refresh_stats = graphene.Field(BankRefreshStatsType, shards=graphene.Int())
+    santander_transport_stats = graphene.Field(SantanderTransportStatsType)
+    # Per process: each worker has its own cache
+    rut_cache_stats = graphene.Field(RutCacheStatsType)
+    dashboard_cache_stats = graphene.List(DashboardCacheStatsType)
 
     # Queries for ProcessedServiceListingType
     all_processed_service_listing = graphene.List(ProcessedServiceListingType)
@@ -196,7 +333,12 @@ class Query(graphene.ObjectType):
             queryset = queryset.filter(accounting_date__gte=start_date)
         if end_date:
             queryset = queryset.filter(accounting_date__lte=end_date)
-        return queryset
+        return cached_result(
+            "all_bank_movements",
+            auth_user.id,
+            {"start_date": start_date, "end_date": end_date, "amount_gt": bool(amount_gt)},
+            lambda: list(queryset),
+        )
 
     def resolve_get_user(self, info):
         user = get_user(info.context)
@@ -204,6 +346,55 @@ class Query(graphene.ObjectType):
             return user
         return None
 
+    def resolve_activity_guidance_cache_stats(root, info):
+        auth_user = get_user(info.context)
+        if not auth_user.is_staff:
+            return None
+        return ActivityGuidanceCacheStatsType(**ActivityGuidanceCache.stats())
+
+    def resolve_activity_classifier_stats(root, info):
+        auth_user = get_user(info.context)
+        if not auth_user.is_staff:
+            return None
+        return ActivityClassifierStatsType(**classifier_stats())
+
+    def resolve_bank_refresh_stats(root, info, shards=1):
+        auth_user = get_user(info.context)
+        if not auth_user.is_staff:
+            return None
+        stats = refresh_stats(shards)
+        runs = [
+            BankRefreshRunType(
+                **{name: value for name, value in run.items() if name != "errors"}
+            )
+            for run in stats.pop("runs")
+        ]
+        return BankRefreshStatsType(runs=runs, **stats)
+
+    def resolve_santander_transport_stats(root, info):
+        auth_user = get_user(info.context)
+        if not auth_user.is_staff:
+            return None
+        return SantanderTransportStatsType(**transport_stats())
+
+    def resolve_rut_cache_stats(root, info):
+        auth_user = get_user(info.context)
+        if not auth_user.is_staff:
+            return None
+        return RutCacheStatsType(**rut_cache.stats())
+
+    def resolve_dashboard_cache_stats(root, info):
+        auth_user = get_user(info.context)
+        if not auth_user.is_staff:
+            return None
+        return [DashboardCacheStatsType(**entry) for entry in dashboard_cache_stats()]
+
+    def resolve_background_job(root, info, id):
+        auth_user = get_user(info.context)
+        if auth_user.is_anonymous:
+            return None
+        return BackgroundJob.objects.filter(pk=id, user=auth_user).first()
+
     def resolve_distinct_ruts_count(root, info, start_date=None, end_date=None):
         auth_user = get_user(info.context)
         if auth_user.is_anonymous:
@@ -216,14 +407,21 @@ class Query(graphene.ObjectType):
         if end_date:
             queryset = queryset.filter(accounting_date__lte=end_date)
 
-        observations = list(queryset.values_list("observation", flat=True))
-        national_identifiers = [
-            identifier.rut
-            for obs in observations
-            if (identifier := retrieve_national_identifier_from_description(obs))
-            is not None
-        ]
-        return len(set(national_identifiers[0]))
+        # Counterparties are extracted at import (BankMovement.counterparty_rut)
+        return cached_result(
+            "distinct_ruts_count",
+            auth_user.id,
+            {"start_date": start_date, "end_date": end_date},
+            lambda: queryset.exclude(counterparty_rut="").aggregate(
+                count=Count("counterparty_rut", distinct=True)
+            )["count"],
+        )
+
+    def resolve_payer_thresholds(root, info, date=None):
+        auth_user = get_user(info.context)
+        if auth_user.is_anonymous:
+            return []
+        return [PayerThresholdType(**threshold) for threshold in payer_thresholds(auth_user, date)]
 
     def resolve_bank_movement(root, info, id):
         try:
@@ -101,6 +101,21 @@ DATABASES = {
     }
 }
 
+# Cache
+# https://docs.djangoproject.com/en/5.0/topics/cache/
+# Shared through Redis when REDIS_URL is set, per-process memory otherwise.
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    }
+}
+if os.getenv("REDIS_URL"):
+    CACHES["default"] = {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": os.getenv("REDIS_URL"),
+    }
+
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
 
@@ -167,3 +182,134 @@ GRAPHQL_JWT = {
     "JWT_ALGORITHM": "HS256",
     "JWT_EXPIRATION_DELTA": timedelta(days=7),
 }
+
+# Amazon Bedrock
+# One pooled bedrock-runtime client per region is shared by the whole process.
+BEDROCK_REGION = os.getenv("BEDROCK_REGION", "us-east-1")
+# Override to point at a local stub (see apps.integrations.fake_bedrock).
+BEDROCK_ENDPOINT_URL = os.getenv("BEDROCK_ENDPOINT_URL") or None
+BEDROCK_MAX_POOL_CONNECTIONS = int(os.getenv("BEDROCK_MAX_POOL_CONNECTIONS", 50))
+BEDROCK_CONNECT_TIMEOUT = float(os.getenv("BEDROCK_CONNECT_TIMEOUT", 5))
+BEDROCK_READ_TIMEOUT = float(os.getenv("BEDROCK_READ_TIMEOUT", 60))
+BEDROCK_MAX_ATTEMPTS = int(os.getenv("BEDROCK_MAX_ATTEMPTS", 3))
+# Bounds for BedRockLLM.conversation_history (per instance).
+BEDROCK_HISTORY_MAX_ENTRIES = int(os.getenv("BEDROCK_HISTORY_MAX_ENTRIES", 20))
+BEDROCK_HISTORY_MAX_BYTES = int(os.getenv("BEDROCK_HISTORY_MAX_BYTES", 256 * 1024))
+BEDROCK_HISTORY_STORE_PROMPT_HASH = os.getenv("BEDROCK_HISTORY_STORE_PROMPT_HASH", "False") == "True"
+
+# SII activity classification
+SII_CANDIDATES_TOP_K = int(os.getenv("SII_CANDIDATES_TOP_K", 15))
+# "auto" answers confident lexical matches locally and asks Bedrock otherwise,
+# "llm" always asks Bedrock and "lexical" never does.
+SII_CLASSIFIER_MODE = os.getenv("SII_CLASSIFIER_MODE", "auto")
+# Relative lead of the best BM25 match over the runner-up, and share of the
+# description's terms it must contain, to skip the LLM.
+SII_FAST_PATH_MARGIN = float(os.getenv("SII_FAST_PATH_MARGIN", 0.25))
+SII_FAST_PATH_COVERAGE = float(os.getenv("SII_FAST_PATH_COVERAGE", 1.0))
+SII_GUIDANCE_MODEL_ID = os.getenv("SII_GUIDANCE_MODEL_ID", "anthropic.claude-v2")
+# Stream guidance answers and stop reading once the [Rubro, categoria] list is in.
+SII_GUIDANCE_STREAMING = os.getenv("SII_GUIDANCE_STREAMING", "True") == "True"
+# Cached LLM classifications: lifetime, LRU size bound, and how long the
+# Django cache front keeps an entry before re-reading the table.
+SII_GUIDANCE_CACHE_TTL = int(os.getenv("SII_GUIDANCE_CACHE_TTL", 60 * 60 * 24 * 30))
+SII_GUIDANCE_CACHE_MAX_ENTRIES = int(os.getenv("SII_GUIDANCE_CACHE_MAX_ENTRIES", 10000))
+SII_GUIDANCE_CACHE_FRONT_TTL = int(os.getenv("SII_GUIDANCE_CACHE_FRONT_TTL", 60 * 60))
+# Hits served by the front refresh an entry's `last_used_at` at most this
+# often, and eviction runs at most once per interval across processes.
+SII_GUIDANCE_CACHE_TOUCH_INTERVAL = int(os.getenv("SII_GUIDANCE_CACHE_TOUCH_INTERVAL", 5 * 60))
+SII_GUIDANCE_CACHE_EVICT_INTERVAL = int(os.getenv("SII_GUIDANCE_CACHE_EVICT_INTERVAL", 60))
+# Batch classification (AskActivityGuidanceBatch, manage.py classify_activities):
+# descriptions per Bedrock prompt, prompts in flight, answer tokens allowed per
+# description and the largest batch the mutation accepts.
+SII_BATCH_PROMPT_SIZE = int(os.getenv("SII_BATCH_PROMPT_SIZE", 10))
+SII_BATCH_CONCURRENCY = int(os.getenv("SII_BATCH_CONCURRENCY", 4))
+SII_BATCH_TOKENS_PER_ITEM = int(os.getenv("SII_BATCH_TOKENS_PER_ITEM", 60))
+SII_BATCH_MAX_DESCRIPTIONS = int(os.getenv("SII_BATCH_MAX_DESCRIPTIONS", 500))
+
+# Background jobs (apps.jobs, run by `manage.py run_jobs`). The queue backend
+# can be swapped for "apps.jobs.InMemoryJobQueue" in tests.
+JOB_QUEUE_BACKEND = os.getenv("JOB_QUEUE_BACKEND", "apps.jobs.DatabaseJobQueue")
+JOB_WORKER_CONCURRENCY = int(os.getenv("JOB_WORKER_CONCURRENCY", 4))
+JOB_POLL_INTERVAL = float(os.getenv("JOB_POLL_INTERVAL", 1.0))
+# A running job whose worker sent no heartbeat for this long (crashed or
+# killed) is queued again, up to JOB_MAX_ATTEMPTS claims, then marked failed.
+JOB_LEASE_SECONDS = int(os.getenv("JOB_LEASE_SECONDS", 5 * 60))
+JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", 3))
+
+# Santander
+# Endpoints of the scraper; override to point at a local stub
+# (see apps.integrations.fake_santander).
+SANTANDER_TOKEN_URL = os.getenv(
+    "SANTANDER_TOKEN_URL",
+    "https://apideveloper.santander.cl/sancl/privado/party_authentication_restricted/party_auth_dss/v1/oauth2/token",
+)
+SANTANDER_ACCOUNTS_URL = os.getenv(
+    "SANTANDER_ACCOUNTS_URL",
+    "https://apiper.santander.cl/perdsk/datosCliente/cruceProductosOnline",
+)
+SANTANDER_MOVEMENTS_URL = os.getenv(
+    "SANTANDER_MOVEMENTS_URL",
+    "https://openbanking.santander.cl/account_balances_transactions_and_withholdings_retail/v1/current-accounts/transactions",
+)
+# Keep-alive connections per Santander host, and per-request timeouts.
+SANTANDER_POOL_MAXSIZE = int(os.getenv("SANTANDER_POOL_MAXSIZE", 10))
+SANTANDER_CONNECT_TIMEOUT = float(os.getenv("SANTANDER_CONNECT_TIMEOUT", 5))
+SANTANDER_READ_TIMEOUT = float(os.getenv("SANTANDER_READ_TIMEOUT", 30))
+# Read calls (accounts, movements) are retried on timeouts, 429 and 5xx with
+# full-jitter exponential backoff; logins are never retried.
+SANTANDER_RETRY_ATTEMPTS = int(os.getenv("SANTANDER_RETRY_ATTEMPTS", 3))
+SANTANDER_RETRY_BASE_DELAY = float(os.getenv("SANTANDER_RETRY_BASE_DELAY", 0.5))
+SANTANDER_RETRY_MAX_DELAY = float(os.getenv("SANTANDER_RETRY_MAX_DELAY", 8))
+# Consecutive failures per host that open the circuit breaker, and how long
+# it fails fast before letting a trial request through.
+SANTANDER_BREAKER_FAILURES = int(os.getenv("SANTANDER_BREAKER_FAILURES", 5))
+SANTANDER_BREAKER_COOLDOWN = float(os.getenv("SANTANDER_BREAKER_COOLDOWN", 30))
+# Accounts of one user whose movements are fetched at the same time; keep it
+# at or below SANTANDER_POOL_MAXSIZE.
+SANTANDER_ACCOUNT_CONCURRENCY = int(os.getenv("SANTANDER_ACCOUNT_CONCURRENCY", 4))
+# Movements requested per page, and parsed movements per bulk insert.
+SANTANDER_MOVEMENTS_PAGE_SIZE = int(os.getenv("SANTANDER_MOVEMENTS_PAGE_SIZE", 500))
+SANTANDER_INSERT_CHUNK_SIZE = int(os.getenv("SANTANDER_INSERT_CHUNK_SIZE", 1000))
+# Movement bodies are decoded as they arrive, SANTANDER_STREAM_READ_SIZE bytes
+# at a time, and handed to the insert loop in batches of
+# SANTANDER_STREAM_BATCH_SIZE movements.
+SANTANDER_STREAM_READ_SIZE = int(os.getenv("SANTANDER_STREAM_READ_SIZE", 64 * 1024))
+SANTANDER_STREAM_BATCH_SIZE = int(os.getenv("SANTANDER_STREAM_BATCH_SIZE", 200))
+# Requests toward Santander: across the process (or every process sharing a
+# Redis cache) per second, and per customer RUT per minute. 0 disables.
+SANTANDER_MAX_REQUESTS_PER_SECOND = int(os.getenv("SANTANDER_MAX_REQUESTS_PER_SECOND", 10))
+SANTANDER_MAX_REQUESTS_PER_RUT_PER_MINUTE = int(
+    os.getenv("SANTANDER_MAX_REQUESTS_PER_RUT_PER_MINUTE", 30)
+)
+# Scheduled refresh (`manage.py refresh_bank_movements`): accounts synced more
+# recently than this are skipped, and users synced at once per worker.
+SANTANDER_REFRESH_INTERVAL = int(os.getenv("SANTANDER_REFRESH_INTERVAL", 60 * 60 * 24))
+SANTANDER_REFRESH_CONCURRENCY = int(os.getenv("SANTANDER_REFRESH_CONCURRENCY", 4))
+# After a rejected login the refresh skips the credentials for this many
+# seconds, doubling with every further rejection up to the maximum, so a
+# wrong password does not lock the customer out at the bank.
+SANTANDER_LOGIN_BACKOFF = int(os.getenv("SANTANDER_LOGIN_BACKOFF", 60 * 60))
+SANTANDER_LOGIN_BACKOFF_MAX = int(os.getenv("SANTANDER_LOGIN_BACKOFF_MAX", 60 * 60 * 24 * 7))
+# Santander login tokens are reused until this many seconds before they
+# expire; SANTANDER_TOKEN_TTL is assumed when the bank does not send
+# `expires_in`. Name a CACHES alias in SANTANDER_TOKEN_CACHE to share them
+# (encrypted) between workers.
+SANTANDER_TOKEN_TTL = int(os.getenv("SANTANDER_TOKEN_TTL", 300))
+SANTANDER_TOKEN_EXPIRY_MARGIN = int(os.getenv("SANTANDER_TOKEN_EXPIRY_MARGIN", 30))
+SANTANDER_TOKEN_CACHE = os.getenv("SANTANDER_TOKEN_CACHE", "")
+# Distinct payers (RUTs sending transfers) per calendar month and semester
+# at which a user is flagged (the law counts "50 or more" a month, "100 or
+# more" a semester), and the share of a limit that counts as approaching it.
+PAYER_LIMIT_MONTH = int(os.getenv("PAYER_LIMIT_MONTH", 50))
+PAYER_LIMIT_SEMESTER = int(os.getenv("PAYER_LIMIT_SEMESTER", 100))
+PAYER_WARNING_RATIO = float(os.getenv("PAYER_WARNING_RATIO", 0.8))
+# Movement observations whose extracted RUT is kept in memory per process
+# (apps.helpers rut_cache); 0 disables the cache.
+RUT_CACHE_SIZE = int(os.getenv("RUT_CACHE_SIZE", 50_000))
+# Cached results of the dashboard resolvers (distinctRutsCount,
+# allBankMovements): the CACHES alias holding them, for how long (0 disables
+# the cache) and the longest movement list worth caching. Entries are keyed
+# on the user's latest import, so new movements never serve stale results.
+DASHBOARD_CACHE = os.getenv("DASHBOARD_CACHE", "default")
+DASHBOARD_CACHE_TTL = int(os.getenv("DASHBOARD_CACHE_TTL", 60 * 60))
+DASHBOARD_CACHE_MAX_ROWS = int(os.getenv("DASHBOARD_CACHE_MAX_ROWS", 5000))
@@ -23,6 +23,8 @@ from rest_framework.renderers import JSONRenderer
 from rest_framework.decorators import api_view, renderer_classes
 from rest_framework.response import Response
 
+from django_template.views import async_graphql_view
+
 
 @api_view(["GET"])
 @renderer_classes([JSONRenderer])
@@ -33,5 +35,6 @@ def health_check(request):
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('graphql/', csrf_exempt(GraphQLView.as_view(graphiql=True))),
+    path('graphql/async/', csrf_exempt(async_graphql_view)),
     path("health-check", health_check),
 ]
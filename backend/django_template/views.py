@@ -0,0 +1,30 @@
+import json
+
+from django.http import JsonResponse
+
+from django_template.async_schema import schema as async_schema
+
+
+async def async_graphql_view(request):
+    """
+    Minimal GraphQL-over-HTTP endpoint that executes `async_schema` on the
+    event loop. Accepts POST bodies with `query`, `variables` and
+    `operationName`.
+    """
+    if request.method != "POST":
+        return JsonResponse({"errors": [{"message": "Only POST is supported"}]}, status=405)
+    try:
+        payload = json.loads(request.body or b"{}")
+    except json.JSONDecodeError:
+        return JsonResponse({"errors": [{"message": "Invalid JSON body"}]}, status=400)
+
+    result = await async_schema.execute_async(
+        payload.get("query"),
+        variable_values=payload.get("variables"),
+        operation_name=payload.get("operationName"),
+        context_value=request,
+    )
+    response = {"data": result.data}
+    if result.errors:
+        response["errors"] = [error.formatted for error in result.errors]
+    return JsonResponse(response, status=400 if result.data is None else 200)